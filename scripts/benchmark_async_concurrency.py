@@ -0,0 +1,84 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#!/usr/bin/env python3
+"""Measure async step throughput as the number of concurrent NovaAct instances grows.
+
+For each concurrency level N, starts N headless async NovaAct instances, then runs
+one act() on each with asyncio.gather and reports model steps per second. With the
+event loop free of blocking backend and image work, throughput should scale close
+to linearly with N until the backend or the machine saturates. Browser startup is
+excluded from the timing.
+
+Requires NOVA_ACT_API_KEY (or other configured auth) and a local Chromium.
+
+Usage:
+    python scripts/benchmark_async_concurrency.py
+    python scripts/benchmark_async_concurrency.py --levels 1 2 4 8 --max-steps 5
+"""
+
+import argparse
+import asyncio
+import time
+
+from nova_act import ActError
+from nova_act.asyncio import NovaAct
+
+DEFAULT_STARTING_PAGE = "https://nova.amazon.com/act/gym/next-dot"
+DEFAULT_PROMPT = "Click on 'Explore Destinations', then return the name of the first destination"
+
+
+async def _run_act(nova: NovaAct, prompt: str, max_steps: int) -> int:
+    """Run one act and return the number of model steps it took, whether or not it succeeded."""
+    try:
+        result = await nova.act(prompt, max_steps=max_steps)
+        return result.metadata.num_steps_executed
+    except ActError as e:
+        return e.metadata.num_steps_executed if e.metadata is not None else 0
+
+
+async def _measure(concurrency: int, starting_page: str, prompt: str, max_steps: int) -> tuple[int, float]:
+    instances = [NovaAct(starting_page=starting_page, headless=True, tty=False) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*[nova.start() for nova in instances])
+        start = time.perf_counter()
+        steps = await asyncio.gather(*[_run_act(nova, prompt, max_steps) for nova in instances])
+        return sum(steps), time.perf_counter() - start
+    finally:
+        await asyncio.gather(*[nova.stop() for nova in instances], return_exceptions=True)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    baseline: float | None = None
+    for concurrency in args.levels:
+        steps, elapsed = await _measure(concurrency, args.starting_page, args.prompt, args.max_steps)
+        throughput = steps / elapsed if elapsed > 0 else 0.0
+        baseline = baseline or throughput / concurrency
+        scaling = throughput / (baseline * concurrency) if baseline else 0.0
+        print(
+            f"N={concurrency:<3} steps={steps:<4} wall={elapsed:7.1f} s  "
+            f"throughput={throughput:6.2f} steps/s  scaling efficiency={scaling:5.0%}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8], help="Concurrency levels to measure")
+    parser.add_argument("--max-steps", type=int, default=5, help="max_steps for each act")
+    parser.add_argument("--starting-page", default=DEFAULT_STARTING_PAGE)
+    parser.add_argument("--prompt", default=DEFAULT_PROMPT)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#!/usr/bin/env python3
+"""Compare browser CLI command latency with and without the session daemon.
+
+Runs the same ``act browser`` command repeatedly as a fresh process, first on the
+cold path and then with NOVA_ACT_BROWSER_DAEMON=1, and prints latency percentiles.
+The session must already exist (``act browser session create --session-id <id>``).
+
+Usage:
+    python scripts/benchmark_browser_daemon.py --session-id bench -n 20
+    python scripts/benchmark_browser_daemon.py --session-id bench -- evaluate "document.title"
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_COMMAND = ["tab-list", "--json"]
+
+
+def _time_runs(argv: list[str], env: dict[str, str], runs: int) -> list[float]:
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(argv, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        latencies.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            sys.exit(f"Command failed ({result.returncode}): {' '.join(argv)}\n{result.stderr}")
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    print(
+        f"{label:<6} n={len(ordered):<3} median={statistics.median(ordered) * 1000:8.1f} ms  "
+        f"p95={p95 * 1000:8.1f} ms  min={ordered[0] * 1000:8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--session-id", default="default", help="Existing session to run commands against")
+    parser.add_argument("-n", "--runs", type=int, default=10, help="Timed runs per mode")
+    parser.add_argument("command", nargs="*", help="Browser command and arguments (default: tab-list --json)")
+    args = parser.parse_args()
+
+    argv = [
+        sys.executable,
+        "-m",
+        "nova_act.cli.cli",
+        "browser",
+        *(args.command or DEFAULT_COMMAND),
+        "--session-id",
+        args.session_id,
+        "--no-screenshot",
+        "--no-snapshot",
+    ]
+    cold_env = {k: v for k, v in os.environ.items() if k != "NOVA_ACT_BROWSER_DAEMON"}
+    warm_env = {**cold_env, "NOVA_ACT_BROWSER_DAEMON": "1"}
+
+    cold = _time_runs(argv, cold_env, args.runs)
+    # Untimed run to start the daemon and attach it to the session
+    _time_runs(argv, warm_env, 1)
+    warm = _time_runs(argv, warm_env, args.runs)
+
+    _report("cold", cold)
+    _report("warm", warm)
+    print(f"speedup (median): {statistics.median(cold) / statistics.median(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#!/usr/bin/env python3
+"""Compare browser memory and startup time of per-instance browsers and a BrowserPool.
+
+For each concurrency level N, starts N headless async NovaAct instances twice: once
+with a browser each (the default) and once leasing contexts from a shared
+BrowserPool. Reports wall time to start all N, and the unique memory (USS) of every
+browser process they spawned. With --prompt, also runs one act() on each instance
+and reports model steps per second.
+
+Requires NOVA_ACT_API_KEY (or other configured auth), a local Chromium and psutil
+(installed with the ``cli`` extra).
+
+Usage:
+    python scripts/benchmark_browser_pool.py
+    python scripts/benchmark_browser_pool.py --levels 4 16 --max-browsers 2
+    python scripts/benchmark_browser_pool.py --levels 8 --prompt "Return the page title"
+"""
+
+import argparse
+import asyncio
+import time
+
+import psutil
+
+from nova_act import ActError
+from nova_act.asyncio import BrowserPool, NovaAct
+
+DEFAULT_STARTING_PAGE = "https://nova.amazon.com/act/gym/next-dot"
+
+
+def _browser_memory_mb() -> float:
+    """Sum the unique memory of browser processes descended from this one."""
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            if "chrom" in child.name().lower():
+                total += child.memory_full_info().uss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total / 2**20
+
+
+async def _run_act(nova: NovaAct, prompt: str, max_steps: int) -> int:
+    try:
+        result = await nova.act(prompt, max_steps=max_steps)
+        return result.metadata.num_steps_executed
+    except ActError as e:
+        return e.metadata.num_steps_executed if e.metadata is not None else 0
+
+
+async def _measure(args: argparse.Namespace, concurrency: int, pool: BrowserPool | None) -> str:
+    instances = [
+        NovaAct(starting_page=args.starting_page, headless=True, tty=False, browser_pool=pool)
+        for _ in range(concurrency)
+    ]
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*[nova.start() for nova in instances])
+        report = f"start={time.perf_counter() - start:6.1f} s  browser memory={_browser_memory_mb():8.0f} MiB"
+        if args.prompt:
+            start = time.perf_counter()
+            steps = await asyncio.gather(*[_run_act(nova, args.prompt, args.max_steps) for nova in instances])
+            report += f"  throughput={sum(steps) / (time.perf_counter() - start):6.2f} steps/s"
+        return report
+    finally:
+        await asyncio.gather(*[nova.stop() for nova in instances], return_exceptions=True)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    for concurrency in args.levels:
+        print(f"N={concurrency:<3} per-instance  {await _measure(args, concurrency, None)}")
+        contexts_per_browser = -(-concurrency // args.max_browsers)
+        async with BrowserPool(max_browsers=args.max_browsers, max_contexts_per_browser=contexts_per_browser) as pool:
+            print(f"N={concurrency:<3} pooled({args.max_browsers})     {await _measure(args, concurrency, pool)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 4, 8], help="Concurrency levels to measure")
+    parser.add_argument("--max-browsers", type=int, default=1, help="Browser processes in the pool")
+    parser.add_argument("--starting-page", default=DEFAULT_STARTING_PAGE)
+    parser.add_argument("--prompt", default=None, help="Also run this act on every instance and report throughput")
+    parser.add_argument("--max-steps", type=int, default=5, help="max_steps for each act")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#!/usr/bin/env python3
+"""Break down NovaAct browser startup time, with a cold and a warm user agent cache.
+
+Starts and stops a headless NovaAct --runs times. The first start runs with the user
+agent cache cleared, so it pays for the throwaway browser launch that detects the
+user agent; later starts hit the cache. Prints each start's phase timings (as
+recorded by the Playwright manager) and the median of the warm starts.
+
+Requires NOVA_ACT_API_KEY (or other configured auth) and a local Chromium.
+
+Usage:
+    python scripts/benchmark_browser_startup.py
+    python scripts/benchmark_browser_startup.py --runs 5 --starting-page https://example.com
+"""
+
+import argparse
+import statistics
+import time
+
+from nova_act import NovaAct
+from nova_act.tools.browser.default.default_nova_local_browser_actuator import DefaultNovaLocalBrowserActuator
+from nova_act.util.user_agent_cache import clear_user_agent_cache
+
+DEFAULT_STARTING_PAGE = "https://nova.amazon.com/act/gym/next-dot"
+
+
+def _start_once(starting_page: str) -> tuple[float, dict[str, float]]:
+    nova = NovaAct(starting_page=starting_page, headless=True, tty=False)
+    start = time.perf_counter()
+    nova.start()
+    try:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        actuator = nova._actuator
+        assert isinstance(actuator, DefaultNovaLocalBrowserActuator)
+        return elapsed_ms, actuator._playwright_manager.startup_timings_ms
+    finally:
+        nova.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Starts to measure; the first is cold")
+    parser.add_argument("--starting-page", default=DEFAULT_STARTING_PAGE)
+    args = parser.parse_args()
+
+    clear_user_agent_cache()
+    warm_ms = []
+    for run in range(max(2, args.runs)):
+        elapsed_ms, phases = _start_once(args.starting_page)
+        label = "cold" if run == 0 else "warm"
+        breakdown = ", ".join(f"{phase}={ms:.0f}" for phase, ms in phases.items())
+        print(f"{label} start={elapsed_ms:7.0f} ms  ({breakdown})")
+        if run > 0:
+            warm_ms.append(elapsed_ms)
+    print(f"median warm start={statistics.median(warm_ms):7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
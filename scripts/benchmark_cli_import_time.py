@@ -0,0 +1,100 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#!/usr/bin/env python3
+"""Guard the import-time budget of common ``act`` commands.
+
+Runs each command's ``--help`` under ``python -X importtime`` (so nothing touches a
+browser or AWS) and sums the time spent importing modules. Exits non-zero if any
+command's median exceeds its budget, e.g. because a command module started
+importing the SDK at module level or a command was registered eagerly.
+
+Usage:
+    python scripts/benchmark_cli_import_time.py
+    python scripts/benchmark_cli_import_time.py -n 5 --budget-scale 1.5
+    python scripts/benchmark_cli_import_time.py --top 15
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+# Command -> import-time budget in milliseconds. Importing the SDK (NovaAct) alone
+# costs well over a second, so these catch it creeping back onto a startup path.
+COMMAND_BUDGETS_MS: dict[tuple[str, ...], float] = {
+    ("--version",): 400,
+    ("browser", "session", "list", "--help"): 1000,
+    ("browser", "goto", "--help"): 1000,
+    ("browser", "tab-list", "--help"): 1000,
+    ("workflow", "list", "--help"): 600,
+}
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _measure(args: tuple[str, ...]) -> tuple[float, list[tuple[int, str]]]:
+    """Return total import time (ms) and (cumulative us, module) for top-level imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "nova_act.cli.cli", *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.exit(f"Command failed ({result.returncode}): act {' '.join(args)}\n{result.stderr[-2000:]}")
+    total_us = 0
+    top_level = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        total_us += int(self_us)
+        if len(indent) == 1:
+            top_level.append((int(cumulative_us), module))
+    return total_us / 1000, top_level
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--runs", type=int, default=3, help="Runs per command (the median is compared)")
+    parser.add_argument(
+        "--budget-scale", type=float, default=1.0, help="Multiply every budget (e.g. for slow CI machines)"
+    )
+    parser.add_argument("--top", type=int, default=0, help="Show the N most expensive top-level imports per command")
+    args = parser.parse_args()
+
+    over_budget = []
+    for command, budget_ms in COMMAND_BUDGETS_MS.items():
+        budget_ms *= args.budget_scale
+        totals = []
+        top_level: list[tuple[int, str]] = []
+        for _ in range(max(1, args.runs)):
+            total_ms, top_level = _measure(command)
+            totals.append(total_ms)
+        median_ms = statistics.median(totals)
+        status = "ok" if median_ms <= budget_ms else "OVER"
+        print(f"{status:<4} {median_ms:8.1f} ms / {budget_ms:6.0f} ms  act {' '.join(command)}")
+        for cumulative_us, module in sorted(top_level, reverse=True)[: args.top]:
+            print(f"       {cumulative_us / 1000:8.1f} ms  {module}")
+        if median_ms > budget_ms:
+            over_budget.append(command)
+
+    if over_budget:
+        sys.exit(f"{len(over_budget)} command(s) exceeded their import-time budget")
+
+
+if __name__ == "__main__":
+    main()
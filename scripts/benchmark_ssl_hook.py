@@ -0,0 +1,114 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#!/usr/bin/env python3
+"""Measure page-load time with and without the SSL validation hook.
+
+Loads each URL --runs times in one headless browser under four setups:
+
+- off: no hook.
+- navigation-only: the SDK's hook, which pauses only document requests and
+  caches verified hosts.
+- navigation-only cold: the SDK's hook with the verified host cache cleared
+  before every load, as on the first visit to a host.
+- route-all: the previous hook, which routed every request through Python
+  and did a fresh TLS handshake for every navigation.
+
+Prints the median load time per URL and setup. No Nova Act credentials needed.
+
+Usage:
+    python scripts/benchmark_ssl_hook.py
+    python scripts/benchmark_ssl_hook.py --runs 10 --urls https://example.com https://www.wikipedia.org
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+from playwright.sync_api import Route
+
+from nova_act.impl.inputs import validate_url_ssl_certificate
+from nova_act.tools.browser.default.playwright import PlaywrightInstanceManager
+from nova_act.tools.browser.default.playwright_instance_options import PlaywrightInstanceOptions
+from nova_act.util.url import clear_verified_hosts
+
+DEFAULT_URLS = ["https://nova.amazon.com/act/gym/next-dot", "https://www.wikipedia.org"]
+
+
+def _route_all(route: Route) -> None:
+    if route.request.is_navigation_request():
+        clear_verified_hosts()
+        validate_url_ssl_certificate(False, route.request.url)
+    route.continue_()
+
+
+def _median_load_ms(manager: PlaywrightInstanceManager, url: str, runs: int, cold: bool = False) -> float:
+    page = manager.main_page
+    timings = []
+    for _ in range(runs):
+        page.goto("about:blank")
+        if cold:
+            clear_verified_hosts()
+        start = time.perf_counter()
+        page.goto(url, wait_until="load")
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", nargs="+", default=DEFAULT_URLS)
+    parser.add_argument("--runs", type=int, default=5, help="Loads per URL and setup (the median is reported)")
+    args = parser.parse_args()
+
+    manager = PlaywrightInstanceManager(
+        PlaywrightInstanceOptions(
+            maybe_playwright=None,
+            starting_page="about:blank",
+            chrome_channel="chromium",
+            headless=True,
+            user_data_dir=tempfile.mkdtemp(suffix="_nova_act_user_data_dir"),
+            profile_directory=None,
+            cdp_endpoint_url=None,
+            screen_width=1600,
+            screen_height=900,
+            user_agent=None,
+            record_video=False,
+            ignore_https_errors=False,
+        )
+    )
+    manager.start(session_logs_directory=None)
+    try:
+        for url in args.urls:
+            off_ms = _median_load_ms(manager, url, args.runs)
+
+            manager.setup_ssl_validation_hook(manager.context)
+            navigation_only_ms = _median_load_ms(manager, url, args.runs)
+            navigation_only_cold_ms = _median_load_ms(manager, url, args.runs, cold=True)
+            manager.disable_ssl_validation_hook(force=True)
+
+            manager.context.route("**", _route_all)
+            route_all_ms = _median_load_ms(manager, url, args.runs)
+            manager.context.unroute_all(behavior="wait")
+
+            print(
+                f"{url}\n  off={off_ms:7.0f} ms  navigation-only={navigation_only_ms:7.0f} ms  "
+                f"navigation-only cold={navigation_only_cold_ms:7.0f} ms  route-all={route_all_ms:7.0f} ms"
+            )
+    finally:
+        manager.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -58,6 +58,9 @@ _HATCH_BIN = _PROJECT_ROOT / ".hatch" / "bin" / "hatch"
 ASYNC_DIR = _PROJECT_ROOT / "src/nova_act/asyncio"
 SYNC_DIR = _PROJECT_ROOT / "src/nova_act"
 
+# Modules only used from ``# pragma: async`` blocks; their imports are dropped from sync code
+ASYNC_ONLY_MODULES = frozenset({"nova_act.util.executors"})
+
 
 # ---------------------------------------------------------------------------
 # libcst helpers
@@ -103,6 +106,7 @@ class AsyncToSyncTransformer(cst.CSTTransformer):
     - ``asyncio.sleep(...)`` → ``time.sleep(...)``
     - ``Coroutine[X, Y, T]`` → ``T`` (in both AST nodes and string annotations)
     - Removal of ``Coroutine`` from ``from typing import ...``
+    - Removal of imports from ``ASYNC_ONLY_MODULES``
     """
 
     def __init__(self, async_source_path: str) -> None:
@@ -248,6 +252,9 @@ class AsyncToSyncTransformer(cst.CSTTransformer):
     ) -> cst.BaseSmallStatement | cst.FlattenSentinel[cst.BaseSmallStatement] | cst.RemovalSentinel:
         module = updated_node.module
 
+        if module is not None and cst.helpers.get_full_name_for_node(module) in ASYNC_ONLY_MODULES:
+            return cst.RemovalSentinel.REMOVE
+
         # playwright.async_api → playwright.sync_api
         if (
             isinstance(module, cst.Attribute)
@@ -17,56 +17,115 @@
 import builtins
 import pdb
 import sys
+from typing import TYPE_CHECKING
 
-from pydantic import JsonValue as JSONType
-from strands import tool
-
-from nova_act.browser_auth import (
-    AgentCoreBrowserSessionProvider,
-    BrowserSessionProvider,
-    LocalFileSessionProvider,
-    S3SessionProvider,
-)
-from nova_act.impl.common import rsync_from_default_user_data
-from nova_act.impl.extension import ExtensionActuator
-from nova_act.nova_act import NovaAct
-from nova_act.tools.browser.default.default_nova_local_browser_actuator import DefaultNovaLocalBrowserActuator
-from nova_act.tools.browser.interface.browser import BrowserActuatorBase
-from nova_act.tools.browser.interface.playwright_pages import PlaywrightPageManagerBase
-from nova_act.tools.human.interface.human_input_callback import (
-    HumanInputCallbacksProvider,
-)
-from nova_act.types.act_errors import (
-    ActActuationError,
-    ActAgentError,
-    ActAgentFailed,
-    ActCanceledError,
-    ActClientError,
-    ActDispatchError,
-    ActError,
-    ActExceededMaxStepsError,
-    ActExecutionError,
-    ActGuardrailsError,
-    ActInternalServerError,
-    ActInvalidModelGenerationError,
-    ActInvalidToolError,
-    ActInvalidToolSchemaError,
-    ActModelError,
-    ActProtocolError,
-    ActRateLimitExceededError,
-    ActServerError,
-    ActStateGuardrailError,
-    ActTimeoutError,
-)
-from nova_act.types.act_metadata import ActMetadata
-from nova_act.types.act_result import ActGetResult, ActResult
-from nova_act.types.errors import NovaActError, StartFailed, StopFailed, ValidationFailed
-from nova_act.types.features import SecurityOptions
-from nova_act.types.guardrail import GuardrailDecision, GuardrailInputState
-from nova_act.types.workflow import Workflow, get_current_workflow, workflow
-from nova_act.util.jsonschema import BOOL_SCHEMA, STRING_SCHEMA
+from nova_act.util import lazy_exports
 from nova_act.util.logging import setup_logging
 
+if TYPE_CHECKING:
+    from pydantic import JsonValue as JSONType
+    from strands import tool
+
+    from nova_act.browser_auth import (
+        AgentCoreBrowserSessionProvider,
+        BrowserSessionProvider,
+        LocalFileSessionProvider,
+        S3SessionProvider,
+    )
+    from nova_act.impl.common import rsync_from_default_user_data
+    from nova_act.impl.extension import ExtensionActuator
+    from nova_act.nova_act import NovaAct
+    from nova_act.tools.browser.default.browser_pool import BrowserPool
+    from nova_act.tools.browser.default.default_nova_local_browser_actuator import DefaultNovaLocalBrowserActuator
+    from nova_act.tools.browser.interface.browser import BrowserActuatorBase
+    from nova_act.tools.browser.interface.playwright_pages import PlaywrightPageManagerBase
+    from nova_act.tools.human.interface.human_input_callback import (
+        HumanInputCallbacksProvider,
+    )
+    from nova_act.types.act_errors import (
+        ActActuationError,
+        ActAgentError,
+        ActAgentFailed,
+        ActCanceledError,
+        ActClientError,
+        ActDispatchError,
+        ActError,
+        ActExceededMaxStepsError,
+        ActExecutionError,
+        ActGuardrailsError,
+        ActInternalServerError,
+        ActInvalidModelGenerationError,
+        ActInvalidToolError,
+        ActInvalidToolSchemaError,
+        ActModelError,
+        ActProtocolError,
+        ActRateLimitExceededError,
+        ActServerError,
+        ActStateGuardrailError,
+        ActTimeoutError,
+    )
+    from nova_act.types.act_metadata import ActMetadata
+    from nova_act.types.act_result import ActGetResult, ActResult
+    from nova_act.types.errors import NovaActError, StartFailed, StopFailed, ValidationFailed
+    from nova_act.types.features import SecurityOptions
+    from nova_act.types.guardrail import GuardrailDecision, GuardrailInputState
+    from nova_act.types.workflow import Workflow, get_current_workflow, workflow
+    from nova_act.util.jsonschema import BOOL_SCHEMA, STRING_SCHEMA
+
+# Public names mapped to their modules ("module:attribute" when renamed); each module is imported on first access,
+# so importing a submodule (e.g. the CLI) does not pay for the whole SDK.
+_LAZY_EXPORTS: dict[str, str] = {
+    "JSONType": "pydantic:JsonValue",
+    "tool": "strands",
+    "AgentCoreBrowserSessionProvider": "nova_act.browser_auth",
+    "BrowserSessionProvider": "nova_act.browser_auth",
+    "LocalFileSessionProvider": "nova_act.browser_auth",
+    "S3SessionProvider": "nova_act.browser_auth",
+    "rsync_from_default_user_data": "nova_act.impl.common",
+    "ExtensionActuator": "nova_act.impl.extension",
+    "NovaAct": "nova_act.nova_act",
+    "DefaultNovaLocalBrowserActuator": "nova_act.tools.browser.default.default_nova_local_browser_actuator",
+    "BrowserActuatorBase": "nova_act.tools.browser.interface.browser",
+    "BrowserPool": "nova_act.tools.browser.default.browser_pool",
+    "PlaywrightPageManagerBase": "nova_act.tools.browser.interface.playwright_pages",
+    "HumanInputCallbacksProvider": "nova_act.tools.human.interface.human_input_callback",
+    "ActActuationError": "nova_act.types.act_errors",
+    "ActAgentError": "nova_act.types.act_errors",
+    "ActAgentFailed": "nova_act.types.act_errors",
+    "ActCanceledError": "nova_act.types.act_errors",
+    "ActClientError": "nova_act.types.act_errors",
+    "ActDispatchError": "nova_act.types.act_errors",
+    "ActError": "nova_act.types.act_errors",
+    "ActExceededMaxStepsError": "nova_act.types.act_errors",
+    "ActExecutionError": "nova_act.types.act_errors",
+    "ActGuardrailsError": "nova_act.types.act_errors",
+    "ActInternalServerError": "nova_act.types.act_errors",
+    "ActInvalidModelGenerationError": "nova_act.types.act_errors",
+    "ActInvalidToolError": "nova_act.types.act_errors",
+    "ActInvalidToolSchemaError": "nova_act.types.act_errors",
+    "ActModelError": "nova_act.types.act_errors",
+    "ActProtocolError": "nova_act.types.act_errors",
+    "ActRateLimitExceededError": "nova_act.types.act_errors",
+    "ActServerError": "nova_act.types.act_errors",
+    "ActStateGuardrailError": "nova_act.types.act_errors",
+    "ActTimeoutError": "nova_act.types.act_errors",
+    "ActMetadata": "nova_act.types.act_metadata",
+    "ActGetResult": "nova_act.types.act_result",
+    "ActResult": "nova_act.types.act_result",
+    "NovaActError": "nova_act.types.errors",
+    "StartFailed": "nova_act.types.errors",
+    "StopFailed": "nova_act.types.errors",
+    "ValidationFailed": "nova_act.types.errors",
+    "SecurityOptions": "nova_act.types.features",
+    "GuardrailDecision": "nova_act.types.guardrail",
+    "GuardrailInputState": "nova_act.types.guardrail",
+    "Workflow": "nova_act.types.workflow",
+    "get_current_workflow": "nova_act.types.workflow",
+    "workflow": "nova_act.types.workflow",
+    "BOOL_SCHEMA": "nova_act.util.jsonschema",
+    "STRING_SCHEMA": "nova_act.util.jsonschema",
+}
+
 __all__ = [
     "AgentCoreBrowserSessionProvider",
     "BrowserSessionProvider",
@@ -103,6 +162,7 @@ __all__ = [
     "BOOL_SCHEMA",
     "STRING_SCHEMA",
     "BrowserActuatorBase",
+    "BrowserPool",
     "ExtensionActuator",
     "DefaultNovaLocalBrowserActuator",
     "JSONType",
@@ -116,6 +176,8 @@ __all__ = [
     "workflow",
 ]
 
+lazy_exports.install(globals(), _LAZY_EXPORTS)
+
 
 # Intercept `builtins.breakpoint` to disable KeyboardEventWatcher
 from nova_act.impl.keyboard_event_watcher import DEBUGGER_ATTACHED_EVENT
@@ -25,6 +25,7 @@ from pydantic import JsonValue as JSONType
 from strands import tool
 
 from nova_act.asyncio.nova_act import NovaAct
+from nova_act.asyncio.tools.browser.default.browser_pool import BrowserPool
 from nova_act.asyncio.tools.browser.default.default_nova_local_browser_actuator import DefaultNovaLocalBrowserActuator
 from nova_act.asyncio.tools.browser.interface.browser import BrowserActuatorBase
 from nova_act.asyncio.tools.browser.interface.playwright_pages import PlaywrightPageManagerBase
@@ -89,6 +90,7 @@ __all__ = [
     "BOOL_SCHEMA",
     "STRING_SCHEMA",
     "BrowserActuatorBase",
+    "BrowserPool",
     "DefaultNovaLocalBrowserActuator",
     "JSONType",
     "GuardrailDecision",
@@ -25,7 +25,11 @@ from nova_act.impl.controller import ControlState, NovaStateController
 from nova_act.impl.inputs import validate_viewport_dimensions
 from nova_act.impl.program.base import Call, Program
 from nova_act.impl.thinker import Thinker
-from nova_act.tools.browser.default.util.image_helpers import get_source_image_from_data_url
+from nova_act.impl.trajectory.writer import TrajectoryWriter
+from nova_act.tools.browser.default.util.image_helpers import (
+    get_source_image_from_data_url,
+    probe_image_metadata,
+)
 from nova_act.tools.browser.interface.types.agent_redirect_error import (
     AgentRedirectError,
 )
@@ -46,6 +50,7 @@ from nova_act.types.guardrail import GuardrailCallable
 from nova_act.types.state.act import Act
 from nova_act.util.decode_string import decode_awl_raw_program
 from nova_act.util.event_handler import EventHandler
+from nova_act.util.executors import run_backend_call, run_image_work
 from nova_act.util.human_wait_time_tracker import HumanWaitTimeTracker
 from nova_act.util.logging import (
     SessionState,
@@ -223,6 +228,14 @@ class ActDispatcher:
         step_object = None
         step_idx = 0
 
+        # Stream steps to the trajectory file as they are taken
+        session_logs_dir = get_session_logs_directory()
+        trajectory_writer = (
+            TrajectoryWriter(build_trajectory_file_path(session_logs_dir, act.id, act.prompt), act.prompt)
+            if session_logs_dir
+            else None
+        )
+
         # Create and run initial Program
         initial_calls: list[Call] = []
         if act.observation_delay_ms:
@@ -258,24 +271,39 @@ class ActDispatcher:
                         observation.return_value
                     ):
                         screenshot_b64 = browser_observation["screenshotBase64"]
-                        screenshot_pil = get_source_image_from_data_url(screenshot_b64)
-                        validate_viewport_dimensions(*screenshot_pil.size, warn=act.ignore_screen_dims_check)
+                        # Read the dimensions from the image header; decode the full image only if that fails
+                        if screenshot_metadata := probe_image_metadata(screenshot_b64):
+                            screenshot_size = (screenshot_metadata.width, screenshot_metadata.height)
+                        else:
+                            if True:  # pragma: async
+                                screenshot_pil = await run_image_work(get_source_image_from_data_url, screenshot_b64)
+                            else:
+                                screenshot_pil = get_source_image_from_data_url(screenshot_b64)
+                            screenshot_size = screenshot_pil.size
+                        validate_viewport_dimensions(*screenshot_size, warn=act.ignore_screen_dims_check)
 
                 # Get a Program from the model
                 set_logging_session_state(SessionState.THINKING)
                 with Thinker(tty=self._controller._tty, logger=_TRACE_LOGGER):
-                    step_object = self._backend.step(act, program_result.call_results, self._tool_map)
+                    if True:  # pragma: async
+                        # Backends make blocking HTTP calls; keep the event loop free for other agents
+                        step_object = await run_backend_call(
+                            self._backend.step, act, program_result.call_results, self._tool_map
+                        )
+                    else:
+                        step_object = self._backend.step(act, program_result.call_results, self._tool_map)
 
                 self._human_input_callbacks.most_recent_screenshot = step_object.model_input.image
 
                 act.add_step(step_object)
+                if trajectory_writer is not None:
+                    trajectory_writer.append_step(step_object)
                 program = step_object.program
 
                 # Log the model output
                 awl_program = decode_awl_raw_program(step_object.model_output.awl_raw_program)
                 trace_log_lines(awl_program)
 
-
                 # Handle pause/cancel conditions
                 while control.state == ControlState.PAUSED:
                     await asyncio.sleep(0.1)
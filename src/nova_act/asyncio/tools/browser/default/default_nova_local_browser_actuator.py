@@ -13,6 +13,8 @@
 # limitations under the License.
 import asyncio
 import functools
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Callable, Literal
 
@@ -28,7 +30,12 @@ from nova_act.asyncio.tools.browser.default.util.agent_type import agent_type
 from nova_act.asyncio.tools.browser.default.util.element_helpers import viewport_dimensions
 from nova_act.asyncio.tools.browser.default.util.get_bbox_values import get_bbox_values
 from nova_act.asyncio.tools.browser.default.util.go_to_url import go_to_url
-from nova_act.asyncio.tools.browser.default.util.take_observation import take_observation
+from nova_act.asyncio.tools.browser.default.util.image_helpers import encode_data_url, get_image_size
+from nova_act.asyncio.tools.browser.default.util.settle_detection import (
+    SettleDetectorBase,
+    ThumbnailSettleDetector,
+)
+from nova_act.asyncio.tools.browser.default.util.take_observation import take_observation_bytes
 from nova_act.asyncio.tools.browser.default.util.wait import (
     WAIT_FOR_PAGE_TO_SETTLE_CONFIG,
     wait_for_page_to_settle,
@@ -50,8 +57,12 @@ from nova_act.types.errors import (
 )
 from nova_act.types.guardrail import GuardrailCallable
 from nova_act.util.common_js_expressions import Expressions
+from nova_act.util.logging import setup_logging
+
+_LOGGER = setup_logging(__name__)
 
 MAX_PAGE_EVALUATE_RETRIES = 3
+SETTLE_FRAME_MAX_AGE_MS = 500
 
 
 # Catch and throw the error stored in the playwright instance manager if present as it's more informative
@@ -78,6 +89,27 @@ def _check_ssl_error(func: Callable[..., Any]) -> Callable[..., Any]:  # type: i
     return wrapper
 
 
+# Any Action that may change the page must drop the cached settle frame before it runs
+def _invalidate_settle_frame(func: Callable[..., Any]) -> Callable[..., Any]:  # type: ignore[explicit-any]
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:  # type: ignore[explicit-any]
+        self._settle_frame = None
+        return await func(self, *args, **kwargs)
+
+    return wrapper
+
+
+@dataclass(frozen=True)
+class _SettleFrame:
+    """The last stable frame captured while waiting for the page to settle."""
+
+    page: Page
+    url: str
+    dimensions: dict[str, int]
+    screenshot: bytes
+    captured_at: float
+
+
 class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManagerBase):
     """The Default Actuator for NovaAct Browser Use."""
 
@@ -86,10 +118,16 @@ class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManager
         playwright_options: PlaywrightInstanceOptions,
         state_guardrail: GuardrailCallable | None = None,
         save_dom: bool = False,
+        settle_detector: SettleDetectorBase | None = None,
+        settle_frame_max_age_ms: int = SETTLE_FRAME_MAX_AGE_MS,
     ):
         self._playwright_manager = PlaywrightInstanceManager(playwright_options)
         self._state_guardrail = state_guardrail
         self._save_dom = save_dom
+        self._settle_detector = settle_detector or ThumbnailSettleDetector()
+        self._settle_frame_max_age_ms = settle_frame_max_age_ms
+        self._settle_frame: _SettleFrame | None = None
+        self._user_agent: str | None = None
 
     async def start(self, **kwargs: Any) -> None:  # type: ignore[explicit-any]
         if not self._playwright_manager.started:
@@ -97,6 +135,8 @@ class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManager
                 await self._playwright_manager.start(kwargs.get("session_logs_directory"))
 
     async def stop(self, **kwargs: Any) -> None:  # type: ignore[explicit-any]
+        self._settle_frame = None
+        self._user_agent = None
         if self.started:
             await self._playwright_manager.stop()
 
@@ -119,6 +159,7 @@ class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManager
         return self._playwright_manager.context.pages
 
     @_check_ssl_error
+    @_invalidate_settle_frame
     async def agent_click(
         self,
         box: str,
@@ -131,6 +172,7 @@ class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManager
         return None
 
     @_check_ssl_error
+    @_invalidate_settle_frame
     async def agent_hover(self, box: str) -> JsonValue:
         """Hovers on the center of the specified box."""
         bbox = parse_bbox_string(box)
@@ -138,6 +180,7 @@ class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManager
         return None
 
     @_check_ssl_error
+    @_invalidate_settle_frame
     async def agent_scroll(self, direction: ScrollDirection, box: str, value: float | None = None) -> JsonValue:
         """Scrolls the element in the specified box in the specified direction.
 
@@ -148,6 +191,7 @@ class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManager
         return None
 
     @_check_ssl_error
+    @_invalidate_settle_frame
     async def agent_type(self, value: str, box: str, pressEnter: bool = False) -> JsonValue:
         """Types the specified value into the element at the center of the
         specified box.
@@ -166,6 +210,7 @@ class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManager
         return None
 
     @_check_ssl_error
+    @_invalidate_settle_frame
     async def go_to_url(self, url: str) -> JsonValue:
         """Navigates to the specified URL."""
 
@@ -208,23 +253,64 @@ class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManager
     @_check_ssl_error
     async def wait_for_page_to_settle(self) -> JsonValue:
         """Ensure the browser page is ready for the next Action."""
-        await wait_for_page_to_settle(self._playwright_manager.main_page, WAIT_FOR_PAGE_TO_SETTLE_CONFIG)
+        self._settle_frame = None
+        page = self._playwright_manager.main_page
+        sample = await wait_for_page_to_settle(page, WAIT_FOR_PAGE_TO_SETTLE_CONFIG, detector=self._settle_detector)
+        if sample is not None and self._settle_frame_max_age_ms > 0:
+            await self._cache_settle_frame(page, sample.screenshot)
         return None
 
+    async def _cache_settle_frame(self, page: Page, screenshot: bytes) -> None:
+        """Keep a stable frame so an immediately following observation can reuse it."""
+        try:
+            dimensions = await page.evaluate(Expressions.GET_VIEWPORT_SIZE.value)
+        except Exception as e:
+            _LOGGER.debug(f"Not caching settle frame, failed to read viewport size: {e}")
+            return
+
+        # Frames captured at a different scale than the viewport would still need resizing
+        if get_image_size(screenshot) != (dimensions["width"], dimensions["height"]):
+            return
+
+        self._settle_frame = _SettleFrame(
+            page=page,
+            url=page.url,
+            dimensions=dimensions,
+            screenshot=screenshot,
+            captured_at=time.monotonic(),
+        )
+
+    def _consume_settle_frame(self) -> _SettleFrame | None:
+        """Return the cached settle frame if it still describes the current page, then drop it."""
+        frame, self._settle_frame = self._settle_frame, None
+        if frame is None:
+            return None
+
+        page = self._playwright_manager.main_page
+        age_ms = (time.monotonic() - frame.captured_at) * 1000
+        if frame.page is not page or frame.url != page.url or age_ms > self._settle_frame_max_age_ms:
+            return None
+
+        _LOGGER.debug(f"Reusing settle frame captured {age_ms:.0f}ms ago as observation")
+        return frame
+
     @_check_ssl_error
     async def take_observation(self) -> BrowserObservation:
         """Take an observation of the existing browser state."""
 
-        dimensions = None
-        user_agent = None
+        page = self._playwright_manager.main_page
+        frame = self._consume_settle_frame()
+        dimensions: dict[str, int] | None = frame.dimensions if frame is not None else None
 
         for attempt in range(MAX_PAGE_EVALUATE_RETRIES):
             try:
-                dimensions = await self._playwright_manager.main_page.evaluate(Expressions.GET_VIEWPORT_SIZE.value)
-                user_agent = await self._playwright_manager.main_page.evaluate(Expressions.GET_USER_AGENT.value)
+                if dimensions is None:
+                    dimensions = await page.evaluate(Expressions.GET_VIEWPORT_SIZE.value)
+                if self._user_agent is None:
+                    self._user_agent = await page.evaluate(Expressions.GET_USER_AGENT.value)
                 break
             except Exception as e:
-                await wait_for_page_to_settle(self._playwright_manager.main_page, WAIT_FOR_PAGE_TO_SETTLE_CONFIG)
+                await wait_for_page_to_settle(page, WAIT_FOR_PAGE_TO_SETTLE_CONFIG, detector=self._settle_detector)
                 if attempt == MAX_PAGE_EVALUATE_RETRIES - 1:  # Last attempt
                     # Cast it as RuntimeError but also surface the original cause.
                     raise RuntimeError(f"{type(e).__str__}: {e}") from e
@@ -232,17 +318,24 @@ class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManager
         # At this point, dimensions and user_agent are guaranteed to be set
         # because either the try block succeeded or an exception was raised
         assert dimensions is not None
-        assert user_agent is not None
+        assert self._user_agent is not None
 
         id_to_bbox_map: dict[int, BboxTLWH] = {}
         simplified_dom = ""
         if self._save_dom:
-            id_to_bbox_map, simplified_dom = await get_bbox_values(self._playwright_manager.main_page)
+            id_to_bbox_map, simplified_dom = await get_bbox_values(page)
 
-        screenshot_data_url = await take_observation(self._playwright_manager.main_page, dimensions)
+        if frame is not None:
+            screenshot_bytes = frame.screenshot
+            active_url = frame.url
+        else:
+            screenshot_bytes = await take_observation_bytes(
+                page, {"width": dimensions["width"], "height": dimensions["height"]}
+            )
+            active_url = page.url
 
         return {
-            "activeURL": self._playwright_manager.main_page.url,
+            "activeURL": active_url,
             "browserDimensions": {
                 "scrollHeight": dimensions["scrollHeight"],
                 "scrollLeft": dimensions["scrollLeft"],
@@ -252,10 +345,10 @@ class DefaultNovaLocalBrowserActuator(BrowserActuatorBase, PlaywrightPageManager
                 "windowWidth": dimensions["width"],
             },
             "idToBboxMap": id_to_bbox_map,
-            "screenshotBase64": screenshot_data_url,
+            "screenshotBase64": encode_data_url(screenshot_bytes, "jpeg"),
             "simplifiedDOM": simplified_dom,
             "timestamp_ms": int(datetime.now(timezone.utc).timestamp() * 1000),
-            "userAgent": user_agent,
+            "userAgent": self._user_agent,
         }
 
     async def get_viewport_size(self) -> DimensionsDict:
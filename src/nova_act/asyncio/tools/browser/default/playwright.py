@@ -12,17 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import base64
+import functools
 import os
 import subprocess
 import sys
+import time
 from typing import Any
 
 import requests
 from install_playwright import install
-from playwright.async_api import BrowserContext, Page, Route, async_playwright
+from playwright.async_api import BrowserContext, CDPSession, Page, async_playwright
 from playwright.async_api import Error as PlaywrightError
 
 from nova_act.asyncio.tools.browser.default.playwright_instance_options import PlaywrightInstanceOptions
+from nova_act.asyncio.tools.browser.default.util.user_agent import DEFAULT_USER_AGENT_SUFFIX, detect_user_agent
 from nova_act.browser_auth.browser_session_provider import BrowserSessionProvider
 from nova_act.impl.common import quit_default_chrome_browser, should_install_chromium_dependencies
 from nova_act.impl.inputs import validate_url_ssl_certificate
@@ -36,14 +40,16 @@ from nova_act.types.errors import (
     StartFailed,
     ValidationFailed,
 )
-from nova_act.util.common_js_expressions import Expressions
+from nova_act.util.executors import run_backend_call
 from nova_act.util.logging import setup_logging
 
 _LOGGER = setup_logging(__name__)
 
-_DEFAULT_USER_AGENT_SUFFIX = " Agent-NovaAct/0.9"
 _MACOS_LOCAL_CHROME_PATH = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
 _CDP_PORT = 9222
+# Served in place of a document whose certificate fails validation
+_SSL_ERROR_PAGE = "<html><body>SSL Error</body></html>"
+_SSL_ERROR_PAGE_BASE64 = base64.b64encode(_SSL_ERROR_PAGE.encode()).decode()
 
 
 def detect_interactive_mode() -> bool:
@@ -79,6 +85,7 @@ class PlaywrightInstanceManager:
         self._cdp_use_existing_page = options.cdp_use_existing_page
         self.security_options = options.security_options
         self._browser_auth_mode = options.browser_auth_mode
+        self._browser_pool = options.browser_pool
 
         if self._cdp_endpoint_url is not None or self._use_default_chrome_browser:
             if self._record_video:
@@ -88,9 +95,19 @@ class PlaywrightInstanceManager:
             if self._proxy:
                 raise ValidationFailed("Cannot specify a proxy when connecting over CDP")
 
+        if self._browser_pool is not None:
+            if self._cdp_endpoint_url is not None or self._use_default_chrome_browser:
+                raise ValidationFailed("Cannot use a browser pool when connecting over CDP")
+            if self._profile_directory:
+                raise ValidationFailed("Cannot specify a profile directory when using a browser pool")
+            if self._playwright is not None:
+                raise ValidationFailed("Cannot specify a playwright instance when using a browser pool")
+
         self._context: BrowserContext | None = None
         self._launched_default_chrome_popen: subprocess.Popen[bytes] | None = None
         self._session_logs_directory: str | None = None
+        self._startup_timings_ms: dict[str, float] = {}
+        self._startup_phase_start = 0.0
         if options.user_browser_args is None:
             self._user_browser_args = []
         else:
@@ -101,6 +118,8 @@ class PlaywrightInstanceManager:
         self._modifier_key = "ControlOrMeta"
         self._safe_site_validation_error: InvalidURL | InvalidCertificate | None = None
         self._ssl_hook_enabled = False
+        self._ssl_hook_context: BrowserContext | None = None
+        self._ssl_hook_sessions: list[CDPSession] = []
         # Static flag: are we running in an interactive REPL? Never changes after init.
         self._is_interactive = detect_interactive_mode()
 
@@ -109,6 +128,16 @@ class PlaywrightInstanceManager:
         """Check if the client is started."""
         return self._context is not None
 
+    @property
+    def startup_timings_ms(self) -> dict[str, float]:
+        """Duration of each phase of the last start(), in milliseconds."""
+        return dict(self._startup_timings_ms)
+
+    def _record_startup_phase(self, phase: str) -> None:
+        now = time.perf_counter()
+        self._startup_timings_ms[phase] = round((now - self._startup_phase_start) * 1000, 1)
+        self._startup_phase_start = now
+
     async def _init_browser_context(self, context: BrowserContext, trusted_page: Page) -> Page:
         """Go to the starting page and exit."""
         if self._cdp_use_existing_page:
@@ -152,7 +181,11 @@ class PlaywrightInstanceManager:
         return context
 
     async def setup_ssl_validation_hook(self, context: BrowserContext) -> None:
-        """Set up SSL certificate validation for all navigation requests."""
+        """Set up SSL certificate validation for all document navigations.
+
+        Each page gets a CDP session that pauses only document requests (``Fetch.enable``
+        filtered by resource type), so subresources load without a round trip through Python.
+        """
         if self._ssl_hook_enabled:
             return
 
@@ -160,22 +193,78 @@ class PlaywrightInstanceManager:
         if self._ignore_https_errors:
             return
 
-        async def handle_navigation(route: Route) -> None:
-            if route.request.is_navigation_request() and route.request.url:
-                try:
-                    validate_url_ssl_certificate(self._ignore_https_errors, route.request.url)
-                    await route.continue_()
-                except (InvalidCertificate, InvalidURL) as e:
-                    if self._safe_site_validation_error is None:
-                        self._safe_site_validation_error = e
-                    # Force navigate to a safe page
-                    await route.fulfill(body="<html><body>SSL Error</body></html>", content_type="text/html")
-                    raise
+        self._ssl_hook_context = context
+        context.on("page", self._intercept_navigations)
+        for page in context.pages:
+            await self._intercept_navigations(page)
+        self._ssl_hook_enabled = True
+
+    async def _intercept_navigations(self, page: Page) -> None:
+        """Pause the page's document requests for SSL validation."""
+        try:
+            cdp_session = await page.context.new_cdp_session(page)
+            cdp_session.on("Fetch.requestPaused", functools.partial(self._handle_navigation, cdp_session))
+            await cdp_session.send("Fetch.enable", {"patterns": [{"urlPattern": "*", "resourceType": "Document"}]})
+        except PlaywrightError as e:
+            _LOGGER.debug(f"Unable to intercept navigations on {page.url}: {e}")
+            return
+        self._ssl_hook_sessions.append(cdp_session)
+
+        # A page opened by another one (e.g. a popup) may have navigated before interception began.
+        if page.url.startswith(("http://", "https://")):
+            try:
+                await self._validate_navigation(page.url)
+            except (InvalidCertificate, InvalidURL):
+                # Force navigate to a safe page
+                await page.set_content(_SSL_ERROR_PAGE)
+
+    async def _handle_navigation(self, cdp_session: CDPSession, event: dict[str, Any]) -> None:  # type: ignore[explicit-any]
+        request_id = event["requestId"]
+        try:
+            try:
+                await self._validate_navigation(event["request"]["url"])
+            except (InvalidCertificate, InvalidURL):
+                # Force navigate to a safe page
+                await cdp_session.send(
+                    "Fetch.fulfillRequest",
+                    {
+                        "requestId": request_id,
+                        "responseCode": 200,
+                        "responseHeaders": [{"name": "Content-Type", "value": "text/html"}],
+                        "body": _SSL_ERROR_PAGE_BASE64,
+                    },
+                )
+                return
+            await cdp_session.send("Fetch.continueRequest", {"requestId": request_id})
+        except PlaywrightError as e:
+            # The page closed while its navigation was paused.
+            _LOGGER.debug(f"Failed to resume navigation: {e}")
+
+    async def _validate_navigation(self, url: str) -> None:
+        """Validate a navigation's certificate, remembering the first failure."""
+        try:
+            if True:  # pragma: async
+                await run_backend_call(validate_url_ssl_certificate, self._ignore_https_errors, url)
             else:
-                await route.continue_()
+                validate_url_ssl_certificate(self._ignore_https_errors, url)
+        except (InvalidCertificate, InvalidURL) as e:
+            if self._safe_site_validation_error is None:
+                self._safe_site_validation_error = e
+            raise
 
-        await context.route("**", handle_navigation)
-        self._ssl_hook_enabled = True
+    async def _stop_intercepting_navigations(self) -> None:
+        """Detach the navigation interception sessions, which resumes any paused requests."""
+        if self._ssl_hook_context is not None:
+            self._ssl_hook_context.remove_listener("page", self._intercept_navigations)
+            self._ssl_hook_context = None
+        sessions, self._ssl_hook_sessions = self._ssl_hook_sessions, []
+        for cdp_session in sessions:
+            try:
+                await cdp_session.detach()
+            except PlaywrightError:
+                # Already detached, e.g. because its page closed.
+                pass
+        self._ssl_hook_enabled = False
 
     def clear_ssl_error(self) -> None:
         """Explicitly clear the stored SSL validation error."""
@@ -188,8 +277,7 @@ class PlaywrightInstanceManager:
             force: If True, disable even in non-interactive mode (for HITL).
         """
         if self._context and self._ssl_hook_enabled and (self._is_interactive or force):
-            await self._context.unroute_all(behavior="wait")
-            self._ssl_hook_enabled = False
+            await self._stop_intercepting_navigations()
 
     @property
     def safe_site_validation_error(self) -> InvalidURL | InvalidCertificate | None:
@@ -206,9 +294,11 @@ class PlaywrightInstanceManager:
             assert session_logs_directory is not None, "Started without a logs dir when record_video is True"
 
         self._session_logs_directory = session_logs_directory
+        self._startup_timings_ms = {}
+        self._startup_phase_start = time.perf_counter()
         try:
             # Start a new playwright instance if one was not provided by the user
-            if self._playwright is None:
+            if self._playwright is None and self._browser_pool is None:
                 if True:  # pragma: async
                     self._playwright = await async_playwright().start()
                 else:
@@ -221,6 +311,7 @@ class PlaywrightInstanceManager:
                                 "To parallelize, dedicate one thread per NovaAct instance."
                             ) from e
                         raise
+                self._record_startup_phase("playwright")
 
             if self._use_default_chrome_browser:
                 # Launch the default browser with a debug port and a freshly copied user data dir.
@@ -264,9 +355,18 @@ class PlaywrightInstanceManager:
                     raise
 
                 _LOGGER.info(f"Chrome launched with ws url {self._cdp_endpoint_url}")
+                self._record_startup_phase("default_chrome")
 
             # Attach to a context or create one.
-            if self._cdp_endpoint_url is not None:
+            if self._browser_pool is not None:
+                context = await self._browser_pool.lease(**self._pooled_context_options())
+                if self._go_to_url_timeout is not None:
+                    context.set_default_navigation_timeout(self._go_to_url_timeout)
+                trusted_page = await context.new_page()
+                self._record_startup_phase("lease")
+
+            elif self._cdp_endpoint_url is not None:
+                assert self._playwright is not None
                 browser = await self._playwright.chromium.connect_over_cdp(
                     self._cdp_endpoint_url, headers=self._cdp_headers
                 )
@@ -296,8 +396,10 @@ class PlaywrightInstanceManager:
                     trusted_page = context.pages[-1]
                 else:
                     trusted_page = await context.new_page()
+                self._record_startup_phase("connect")
 
             else:
+                assert self._playwright is not None
                 if not os.environ.get("NOVA_ACT_SKIP_PLAYWRIGHT_INSTALL"):
                     with_deps = should_install_chromium_dependencies()
                     if not install(self._playwright.chromium, with_deps=with_deps):
@@ -310,6 +412,7 @@ class PlaywrightInstanceManager:
                             "For more information, please consult Playwright's documentation: "
                             "https://playwright.dev/python/docs/browsers"
                         )
+                self._record_startup_phase("install")
 
                 launch_args = [
                     f"--window-size={self.screen_width},{self.screen_height}",
@@ -340,16 +443,11 @@ class PlaywrightInstanceManager:
                 if self.user_agent:
                     context_options["user_agent"] = self.user_agent
                 else:
-                    # Detect user agent by launching a headless browser, and add suffix.
-                    browser = await self._playwright.chromium.launch(
-                        headless=True, args=["--headless=new", *self._user_browser_args]
+                    context_options["user_agent"] = (
+                        await detect_user_agent(self._playwright.chromium, self._user_browser_args)
+                        + DEFAULT_USER_AGENT_SUFFIX
                     )
-                    page = await browser.new_page()
-                    original_user_agent = await page.evaluate(Expressions.GET_USER_AGENT.value)
-                    await browser.close()
-                    # Replace the headless chrome bit since it's a detection artifact.
-                    original_user_agent = original_user_agent.replace("HeadlessChrome/", "Chrome/")
-                    context_options["user_agent"] = original_user_agent + _DEFAULT_USER_AGENT_SUFFIX
+                    self._record_startup_phase("user_agent")
 
 
                 if self._record_video:
@@ -360,6 +458,7 @@ class PlaywrightInstanceManager:
 
                 context = await self._launch_browser(context_options)
                 trusted_page = context.pages[0]
+                self._record_startup_phase("launch")
 
             # Apply authentication cookies BEFORE navigating to starting page
             if self._browser_auth_mode is not None:
@@ -382,10 +481,17 @@ class PlaywrightInstanceManager:
                             f"Registered localStorage init script for {len(origins)} origin(s) "
                             f"via {self._browser_auth_mode.name}"
                         )
+                self._record_startup_phase("browser_auth")
 
 
             await self._init_browser_context(context, trusted_page)
             self._context = context
+            self._record_startup_phase("starting_page")
+            _LOGGER.debug(
+                f"Browser started in {sum(self._startup_timings_ms.values()):.0f} ms ("
+                + ", ".join(f"{phase}={ms:.0f} ms" for phase, ms in self._startup_timings_ms.items())
+                + ")"
+            )
 
         except StartFailed:
             raise
@@ -398,6 +504,27 @@ class PlaywrightInstanceManager:
             await self.stop()
             raise StartFailed("Failed to start and initialize Playwright for NovaAct") from e
 
+    def _pooled_context_options(self) -> dict[str, Any]:  # type: ignore[explicit-any]
+        """Options for a context leased from the browser pool.
+
+        Each pooled context gets its own viewport, user agent and proxy; the user agent
+        defaults to the pool's.
+        """
+        context_options: dict[str, Any] = {  # type: ignore[explicit-any]
+            # There is no per-context window, so the viewport is the full screen size
+            "viewport": {"width": self.screen_width, "height": self.screen_height},
+            "ignore_https_errors": self._ignore_https_errors,
+        }
+        if self._proxy:
+            context_options["proxy"] = self._proxy
+        if self.user_agent:
+            context_options["user_agent"] = self.user_agent
+        if self._record_video:
+            assert self._session_logs_directory is not None
+            context_options["record_video_dir"] = self._session_logs_directory
+            context_options["record_video_size"] = {"width": self.screen_width, "height": self.screen_height}
+        return context_options
+
     @staticmethod
     async def _prepare_for_close(context: BrowserContext) -> None:
         """Stop background network activity and remove all route handlers.
@@ -420,10 +547,10 @@ class PlaywrightInstanceManager:
         in flight.
 
         Without this cleanup, ``context.close()`` triggers a burst of
-        network events from closing pages. The SDK's SSL validation
-        hook registers ``context.route("**", ...)`` which intercepts
-        every request, so any in-flight request at close time causes
-        ``CancelledError`` and ``TargetClosedError`` noise.
+        network events from closing pages. A route registered with
+        ``context.route("**", ...)`` intercepts every request, so any
+        in-flight request at close time causes ``CancelledError`` and
+        ``TargetClosedError`` noise.
 
         The ``about:blank`` navigation uses a timeout to avoid hanging
         indefinitely on unresponsive pages.
@@ -461,6 +588,9 @@ class PlaywrightInstanceManager:
 
     async def stop(self) -> None:
         """Stop and detach the Browser"""
+        if self._ssl_hook_enabled:
+            await self._stop_intercepting_navigations()
+
         if self._context is not None and self._record_video:
             for page in self._context.pages:
                 if page.video:
@@ -497,6 +627,10 @@ class PlaywrightInstanceManager:
             finally:
                 await self._prepare_for_close(self._context)
 
+        if self._browser_pool is not None and self._context is not None:
+            await self._browser_pool.release(self._context)
+            self._context = None
+
         _can_close_context = not self._owns_playwright
 
         if self._owns_context and self._context is not None and _can_close_context:
@@ -11,19 +11,116 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import importlib.resources
+import secrets
+import weakref
+from dataclasses import dataclass
 from typing import Tuple
 
 from playwright.async_api import Page
 
 from nova_act.types.api.step import BboxTLWH
 
+# Window property holding the snapshot function. The name is random per process and the property is
+# non-writable, so page scripts can neither find nor replace it to fake an unchanged snapshot.
+_DOM_SNAPSHOT_KEY = f"__novaActDomSnapshot_{secrets.token_hex(8)}"
+
+# Calls the snapshot function installed in the page, or returns null if this document has none yet
+CALL_DOM_SNAPSHOT_JS = f"(knownVersion) => window.{_DOM_SNAPSHOT_KEY} ? window.{_DOM_SNAPSHOT_KEY}(knownVersion) : null"
+
+# Installs a snapshot function that re-runs get_simplified_dom.js only when the document has changed.
+# A MutationObserver plus scroll/resize/input listeners mark the document dirty, as do changes that
+# need no mutation: hover and focus (which :hover/:focus rules can use to show or hide elements), late
+# image/iframe loads, web fonts, and finished transitions and animations. While
+# any animation is running, the document is treated as dirty. The observer is paused while the extractor
+# writes its own nova-act-id attributes. Versions embed the document's time origin, so a snapshot from a
+# previous document can never be mistaken for the current one.
+INSTALL_DOM_SNAPSHOT_JS = """(knownVersion) => {
+  if (!window.%(key)s) {
+    const extract = (%(extract)s);
+    const state = { dirty: true, count: 0 };
+    const markDirty = () => {
+      state.dirty = true;
+    };
+    const observer = new MutationObserver(markDirty);
+    const observe = () =>
+      observer.observe(document, { attributes: true, characterData: true, childList: true, subtree: true });
+    const dirtyingEvents = [
+      "scroll",
+      "resize",
+      "input",
+      "change",
+      "pointerover",
+      "pointerout",
+      "mouseover",
+      "focusin",
+      "focusout",
+      "load",
+      "transitionend",
+      "animationend",
+    ];
+    for (const type of dirtyingEvents) {
+      window.addEventListener(type, markDirty, { capture: true, passive: true });
+    }
+    if (document.fonts) {
+      document.fonts.addEventListener("loadingdone", markDirty);
+    }
+    const isAnimating = () => (document.getAnimations ? document.getAnimations().length > 0 : false);
+    observe();
+    const snapshot = (knownVersion) => {
+      const version = `${performance.timeOrigin}:${state.count}`;
+      if (!state.dirty && knownVersion === version && !isAnimating()) {
+        return { unchanged: true, version };
+      }
+      observer.disconnect();
+      let result;
+      try {
+        result = extract();
+      } finally {
+        observer.takeRecords();
+        observe();
+      }
+      state.dirty = false;
+      state.count += 1;
+      return { ...result, version: `${performance.timeOrigin}:${state.count}` };
+    };
+    Object.defineProperty(window, "%(key)s", { value: snapshot, writable: false, configurable: false });
+  }
+  return window.%(key)s(knownVersion);
+}"""
+
+
+@dataclass(frozen=True)
+class _DomSnapshot:
+    version: str
+    bboxes: dict[int, BboxTLWH]
+    modified_html: str
+
+
+# The most recent snapshot of each page, dropped when the page is garbage collected
+_LAST_SNAPSHOTS: "weakref.WeakKeyDictionary[Page, _DomSnapshot]" = weakref.WeakKeyDictionary()
+
+
+@functools.cache
+def _install_dom_snapshot_js() -> str:
+    # Use importlib.resources to load the JavaScript file
+    # This works regardless of whether the package is installed from source or as a wheel
+    js_code = (
+        importlib.resources.files("nova_act.tools.browser.default.util").joinpath("get_simplified_dom.js").read_text()
+    )
+    return INSTALL_DOM_SNAPSHOT_JS % {"key": _DOM_SNAPSHOT_KEY, "extract": js_code.strip().rstrip(";")}
+
 
 async def get_bbox_values(page: Page) -> Tuple[dict[int, BboxTLWH], str]:
     """
     Get the bounding box values for all elements on the page and generate a new HTML DOM
     with nova-act-id attributes added to elements that pass the filtering conditions.
 
+    The extraction script is installed in the page once per document. If the document has not
+    been mutated, scrolled, resized, edited or re-laid out (by loaded resources, fonts or
+    animations) since the previous call, the previous result is reused without re-walking the DOM.
+
     Args:
         page: The Playwright Page object
 
@@ -32,16 +129,18 @@ async def get_bbox_values(page: Page) -> Tuple[dict[int, BboxTLWH], str]:
         - A dictionary mapping element identifiers to their bounding boxes
         - A string containing the modified HTML DOM with nova-act-id attributes
     """
-
-    # Use importlib.resources to load the JavaScript file
-    # This works regardless of whether the package is installed from source or as a wheel
-    js_code = (
-        importlib.resources.files("nova_act.tools.browser.default.util").joinpath("get_simplified_dom.js").read_text()
-    )
+    previous = _LAST_SNAPSHOTS.get(page)
+    known_version = previous.version if previous is not None else None
 
     # Process all elements in a single JavaScript execution
     # This avoids multiple Python-to-browser round trips
-    js_results = await page.evaluate(js_code)
+    js_results = await page.evaluate(CALL_DOM_SNAPSHOT_JS, known_version)
+    if js_results is None:
+        # New document (first call or after navigation): install the script and take a full snapshot
+        js_results = await page.evaluate(_install_dom_snapshot_js(), known_version)
+
+    if js_results.get("unchanged") and previous is not None:
+        return dict(previous.bboxes), previous.modified_html
 
     # Extract the bounding box results and modified HTML
     bbox_results = js_results.get("bboxes", {})
@@ -57,4 +156,7 @@ async def get_bbox_values(page: Page) -> Tuple[dict[int, BboxTLWH], str]:
             "height": float(value["height"]),
         }
 
-    return bbox_dict, modified_html
+    _LAST_SNAPSHOTS[page] = _DomSnapshot(
+        version=js_results.get("version", ""), bboxes=bbox_dict, modified_html=modified_html
+    )
+    return dict(bbox_dict), modified_html
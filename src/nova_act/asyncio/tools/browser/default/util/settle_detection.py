@@ -0,0 +1,137 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+from PIL import Image
+from playwright.async_api import Page
+
+from nova_act.asyncio.tools.browser.default.util.image_helpers import (
+    compare_images,
+    encode_data_url,
+    take_screenshot_as_bytes,
+)
+from nova_act.util.executors import run_image_work
+
+THUMBNAIL_SIZE = (160, 100)
+THUMBNAIL_PIXEL_THRESHOLD = 10
+SETTLE_FRAME_JPEG_QUALITY = 90
+
+
+@dataclass(frozen=True)
+class SettleSample:
+    """The outcome of a single settle-detection poll.
+
+    Attributes:
+        screenshot: The encoded JPEG frame captured for this poll.
+        percent_difference: Percentage of pixels that changed since the previous poll,
+            or None if this is the first poll since the last reset.
+        latency_ms: Time spent capturing and comparing this sample, in milliseconds.
+    """
+
+    screenshot: bytes
+    percent_difference: float | None
+    latency_ms: float
+
+
+class SettleDetectorBase(ABC):
+    """Decide whether a page has visually changed between consecutive polls.
+
+    Detectors are stateful: each sample is compared against the previous one,
+    and `reset` must be called before a new settle sequence begins.
+    """
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Forget the previous sample."""
+
+    @abstractmethod
+    async def sample(self, page: Page) -> SettleSample:
+        """Capture the page and compare it against the previous sample."""
+
+
+class ThumbnailSettleDetector(SettleDetectorBase):
+    """Compare small grayscale thumbnails of viewport-sized frames.
+
+    Frames are captured at CSS pixel scale and decoded with JPEG draft mode, which
+    lets the decoder skip most of the pixel data. Only the previous thumbnail is
+    kept between polls, so each poll decodes a single, reduced-size frame.
+    """
+
+    def __init__(
+        self,
+        thumbnail_size: tuple[int, int] = THUMBNAIL_SIZE,
+        pixel_threshold: int = THUMBNAIL_PIXEL_THRESHOLD,
+    ):
+        self._thumbnail_size = thumbnail_size
+        self._pixel_threshold = pixel_threshold
+        self._previous_thumbnail: npt.NDArray[np.int16] | None = None
+
+    def reset(self) -> None:
+        self._previous_thumbnail = None
+
+    def _thumbnail(self, screenshot: bytes) -> npt.NDArray[np.int16]:
+        with Image.open(io.BytesIO(screenshot)) as image:
+            image.draft("L", self._thumbnail_size)
+            thumbnail = image.convert("L").resize(self._thumbnail_size, Image.Resampling.BILINEAR)
+        return np.asarray(thumbnail, dtype=np.int16)
+
+    async def sample(self, page: Page) -> SettleSample:
+        start = time.perf_counter()
+        screenshot = await take_screenshot_as_bytes(page, quality=SETTLE_FRAME_JPEG_QUALITY, scale="css")
+        if True:  # pragma: async
+            thumbnail = await run_image_work(self._thumbnail, screenshot)
+        else:
+            thumbnail = self._thumbnail(screenshot)
+
+        percent_difference = None
+        if self._previous_thumbnail is not None:
+            changed = np.count_nonzero(np.abs(thumbnail - self._previous_thumbnail) > self._pixel_threshold)
+            percent_difference = float(changed) / thumbnail.size * 100.0
+        self._previous_thumbnail = thumbnail
+
+        return SettleSample(screenshot, percent_difference, (time.perf_counter() - start) * 1000)
+
+
+class FullFrameSettleDetector(SettleDetectorBase):
+    """Compare full-resolution, quality-100 frames pixel by pixel.
+
+    This is the original settle-detection strategy; it is exact but decodes two
+    full frames on every poll.
+    """
+
+    def __init__(self) -> None:
+        self._previous_data_url: str | None = None
+
+    def reset(self) -> None:
+        self._previous_data_url = None
+
+    async def sample(self, page: Page) -> SettleSample:
+        start = time.perf_counter()
+        screenshot = await take_screenshot_as_bytes(page)
+        data_url = encode_data_url(screenshot, "jpeg")
+
+        percent_difference = None
+        if self._previous_data_url is not None:
+            if True:  # pragma: async
+                percent_difference = await run_image_work(compare_images, self._previous_data_url, data_url)
+            else:
+                percent_difference = compare_images(self._previous_data_url, data_url)
+        self._previous_data_url = data_url
+
+        return SettleSample(screenshot, percent_difference, (time.perf_counter() - start) * 1000)
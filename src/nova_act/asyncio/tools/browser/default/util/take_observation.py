@@ -18,10 +18,43 @@ from datetime import datetime
 from playwright.async_api import Page
 
 from nova_act.asyncio.tools.browser.default.util.image_helpers import (
-    resize_image,
-    take_screenshot_as_data_url,
+    encode_data_url,
+    get_image_size,
+    resize_image_bytes,
+    take_screenshot_as_bytes,
 )
 from nova_act.tools.browser.interface.types.dimensions_dict import DimensionsDict
+from nova_act.util.executors import run_image_work
+
+OBSERVATION_JPEG_QUALITY = 90
+
+
+async def take_observation_bytes(page: Page, dimensions: DimensionsDict | None = None) -> bytes:
+    """
+    Captures the observation screenshot as JPEG bytes, encoded exactly once.
+
+    When dimensions are given, the browser renders the frame at CSS pixel scale so it already
+    matches the viewport size; the image is only resized locally if the capture still differs.
+
+    Args:
+        page: The Playwright Page object.
+        dimensions: Dictionary with width and height keys for sizing the image.
+
+    Returns:
+        The JPEG-encoded screenshot bytes.
+    """
+    if dimensions is None:
+        return await take_screenshot_as_bytes(page)
+
+    screenshot_bytes = await take_screenshot_as_bytes(page, quality=OBSERVATION_JPEG_QUALITY, scale="css")
+    if get_image_size(screenshot_bytes) != (dimensions["width"], dimensions["height"]):
+        if True:  # pragma: async
+            screenshot_bytes = await run_image_work(
+                resize_image_bytes, screenshot_bytes, dimensions, OBSERVATION_JPEG_QUALITY
+            )
+        else:
+            screenshot_bytes = resize_image_bytes(screenshot_bytes, dimensions, OBSERVATION_JPEG_QUALITY)
+    return screenshot_bytes
 
 
 async def take_observation(page: Page, dimensions: DimensionsDict | None = None, save_screenshot: bool = False) -> str:
@@ -35,10 +68,8 @@ async def take_observation(page: Page, dimensions: DimensionsDict | None = None,
     Returns:
         A data URL of the resized screenshot.
     """
-    # Take a screenshot and get it as a data URL
-    screenshot_data_url = await take_screenshot_as_data_url(page)
-    if dimensions is not None:
-        screenshot_data_url = resize_image(screenshot_data_url, dimensions)
+    screenshot_bytes = await take_observation_bytes(page, dimensions)
+    screenshot_data_url = encode_data_url(screenshot_bytes, "jpeg")
 
     if save_screenshot:
         save_data_url_to_file(screenshot_data_url, f"screenshot_{datetime.now().isoformat()}.jpg")
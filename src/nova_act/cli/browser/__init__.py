@@ -15,45 +15,130 @@
 
 import click
 
-from nova_act.cli.browser.commands import (
-    ask,
-    back,
-    click_target,
-    console_log,
-    diff,
-    doctor,
-    evaluate,
-    execute,
-    extract,
-    fill_form,
-    forward,
-    get_content,
-    goto,
-    network_log,
-    page,
-    pdf,
-    perf,
-    qa_plan,
-    query,
-    refresh,
-    screenshot,
-    scroll_to,
-    snapshot,
-    style,
-    tab_close,
-    tab_list,
-    tab_new,
-    tab_select,
-    type_text,
-    verify,
-    wait_for,
+from nova_act.cli.group import LazyGroup
+
+_COMMANDS = "nova_act.cli.browser.commands"
+
+# Command name -> "module:attribute"; a command's module is imported only when it is dispatched
+BROWSER_COMMANDS = {
+    "ask": f"{_COMMANDS}.browsing.ask:ask",
+    "back": f"{_COMMANDS}.browsing.back:back",
+    "click": f"{_COMMANDS}.browsing.click_target:click_target",
+    "console-log": f"{_COMMANDS}.browsing.console_log:console_log",
+    "diff": f"{_COMMANDS}.extraction.diff:diff",
+    "doctor": f"{_COMMANDS}.setup.doctor:doctor",
+    "evaluate": f"{_COMMANDS}.extraction.evaluate:evaluate",
+    "execute": f"{_COMMANDS}.browsing.execute:execute",
+    "extract": f"{_COMMANDS}.extraction.extract:extract",
+    "fill-form": f"{_COMMANDS}.browsing.fill_form:fill_form",
+    "forward": f"{_COMMANDS}.browsing.forward:forward",
+    "get-content": f"{_COMMANDS}.extraction.get_content:get_content",
+    "goto": f"{_COMMANDS}.browsing.goto:goto",
+    "network-log": f"{_COMMANDS}.browsing.network_log:network_log",
+    "page": f"{_COMMANDS}.browsing.page:page",
+    "pdf": f"{_COMMANDS}.extraction.pdf:pdf",
+    "perf": f"{_COMMANDS}.extraction.perf:perf",
+    "qa-plan": f"{_COMMANDS}.setup.qa_plan:qa_plan",
+    "qa-run": f"{_COMMANDS}.setup.qa_run:qa_run",
+    "query": f"{_COMMANDS}.extraction.query:query",
+    "refresh": f"{_COMMANDS}.browsing.refresh:refresh",
+    "screenshot": f"{_COMMANDS}.extraction.screenshot:screenshot",
+    "scroll-to": f"{_COMMANDS}.browsing.scroll_to:scroll_to",
+    "session": f"{_COMMANDS}.session:session",
+    "setup": f"{_COMMANDS}.setup.setup:setup",
+    "snapshot": f"{_COMMANDS}.extraction.snapshot:snapshot",
+    "style": f"{_COMMANDS}.extraction.style:style",
+    "tab-close": f"{_COMMANDS}.browsing.tab_close:tab_close",
+    "tab-list": f"{_COMMANDS}.browsing.tab_list:tab_list",
+    "tab-new": f"{_COMMANDS}.browsing.tab_new:tab_new",
+    "tab-select": f"{_COMMANDS}.browsing.tab_select:tab_select",
+    "type": f"{_COMMANDS}.browsing.type_text:type_text",
+    "verify": f"{_COMMANDS}.browsing.verify:verify",
+    "wait-for": f"{_COMMANDS}.browsing.wait_for:wait_for",
+}
+
+# Commands that act on a live session and may be served by its daemon (see services/session/daemon.py)
+DAEMON_COMMANDS = frozenset(
+    {
+        "ask",
+        "back",
+        "click",
+        "console-log",
+        "diff",
+        "evaluate",
+        "execute",
+        "extract",
+        "fill-form",
+        "forward",
+        "get-content",
+        "goto",
+        "network-log",
+        "page",
+        "pdf",
+        "perf",
+        "query",
+        "refresh",
+        "screenshot",
+        "scroll-to",
+        "snapshot",
+        "style",
+        "tab-close",
+        "tab-list",
+        "tab-new",
+        "tab-select",
+        "type",
+        "verify",
+        "wait-for",
+    }
 )
-from nova_act.cli.browser.commands.session import session
-from nova_act.cli.browser.commands.setup.setup import setup
-from nova_act.cli.group import StyledGroup
 
+_ARGV_META_KEY = "nova_act.browser.argv"
+
+
+def _get_session_id(args: list[str]) -> str:
+    """Extract the --session-id value from raw command arguments."""
+    for i, arg in enumerate(args):
+        if arg == "--session-id" and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith("--session-id="):
+            return arg.split("=", 1)[1]
+    return "default"
+
+
+def _run_in_daemon(ctx: click.Context, args: list[str]) -> int | None:
+    """Forward a session command to its daemon; None means run it in this process."""
+    from nova_act.cli.browser.services.session.daemon import (  # noqa: PLC0415
+        is_daemon_enabled,
+        run_in_session_daemon,
+    )
+
+    if not is_daemon_enabled():
+        return None
+    no_color = ctx.find_root().params.get("no_color")
+    argv = [*(["--no-color"] if no_color else []), "browser", *args]
+    return run_in_session_daemon(_get_session_id(args), argv)
 
-@click.group(cls=StyledGroup)
+
+class BrowserGroup(LazyGroup):
+    """Browser command group that can forward session commands to a session daemon."""
+
+    lazy_commands = BROWSER_COMMANDS
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        # The group has no options of its own, so these are the subcommand and its arguments
+        ctx.meta[_ARGV_META_KEY] = list(args)
+        return super().parse_args(ctx, args)
+
+    def invoke(self, ctx: click.Context) -> object:
+        args: list[str] = ctx.meta.get(_ARGV_META_KEY, [])
+        if args and args[0] in DAEMON_COMMANDS and not {"--help", "-h"} & set(args):
+            exit_code = _run_in_daemon(ctx, args)
+            if exit_code is not None:
+                ctx.exit(exit_code)
+        return super().invoke(ctx)
+
+
+@click.group(cls=BrowserGroup)
 def browser() -> None:
     """Interactive browser automation commands.
 
@@ -65,39 +150,3 @@ def browser() -> None:
         act browser screenshot --output output.png
     """
     pass
-
-
-# Register commands in desired order
-browser.add_command(ask)
-browser.add_command(back)
-browser.add_command(console_log)
-browser.add_command(diff)
-browser.add_command(click_target)
-browser.add_command(doctor)
-browser.add_command(evaluate)
-browser.add_command(execute)
-browser.add_command(forward)
-browser.add_command(goto)
-browser.add_command(fill_form)
-browser.add_command(network_log)
-browser.add_command(page)
-browser.add_command(pdf)
-browser.add_command(perf)
-browser.add_command(qa_plan)
-browser.add_command(screenshot)
-browser.add_command(scroll_to)
-browser.add_command(setup)
-browser.add_command(snapshot)
-browser.add_command(extract)
-browser.add_command(get_content)
-browser.add_command(query)
-browser.add_command(refresh)
-browser.add_command(session)
-browser.add_command(style)
-browser.add_command(tab_close)
-browser.add_command(tab_list)
-browser.add_command(tab_new)
-browser.add_command(tab_select)
-browser.add_command(type_text)
-browser.add_command(verify)
-browser.add_command(wait_for)
@@ -39,6 +39,7 @@ __all__ = [
     "pdf",
     "perf",
     "qa_plan",
+    "qa_run",
     "query",
     "refresh",
     "screenshot",
@@ -54,34 +55,78 @@ __all__ = [
     "wait_for",
 ]
 
-from nova_act.cli.browser.commands.browsing.ask import ask
-from nova_act.cli.browser.commands.browsing.back import back
-from nova_act.cli.browser.commands.browsing.click_target import click_target
-from nova_act.cli.browser.commands.browsing.console_log import console_log
-from nova_act.cli.browser.commands.browsing.execute import execute
-from nova_act.cli.browser.commands.browsing.fill_form import fill_form
-from nova_act.cli.browser.commands.browsing.forward import forward
-from nova_act.cli.browser.commands.browsing.goto import goto
-from nova_act.cli.browser.commands.browsing.network_log import network_log
-from nova_act.cli.browser.commands.browsing.page import page
-from nova_act.cli.browser.commands.browsing.refresh import refresh
-from nova_act.cli.browser.commands.browsing.scroll_to import scroll_to
-from nova_act.cli.browser.commands.browsing.tab_close import tab_close
-from nova_act.cli.browser.commands.browsing.tab_list import tab_list
-from nova_act.cli.browser.commands.browsing.tab_new import tab_new
-from nova_act.cli.browser.commands.browsing.tab_select import tab_select
-from nova_act.cli.browser.commands.browsing.type_text import type_text
-from nova_act.cli.browser.commands.browsing.verify import verify
-from nova_act.cli.browser.commands.browsing.wait_for import wait_for
-from nova_act.cli.browser.commands.extraction.diff import diff
-from nova_act.cli.browser.commands.extraction.evaluate import evaluate
-from nova_act.cli.browser.commands.extraction.extract import extract
-from nova_act.cli.browser.commands.extraction.get_content import get_content
-from nova_act.cli.browser.commands.extraction.pdf import pdf
-from nova_act.cli.browser.commands.extraction.perf import perf
-from nova_act.cli.browser.commands.extraction.query import query
-from nova_act.cli.browser.commands.extraction.screenshot import screenshot
-from nova_act.cli.browser.commands.extraction.snapshot import snapshot
-from nova_act.cli.browser.commands.extraction.style import style
-from nova_act.cli.browser.commands.setup.doctor import doctor
-from nova_act.cli.browser.commands.setup.qa_plan import qa_plan
+from typing import TYPE_CHECKING
+
+from nova_act.util import lazy_exports
+
+if TYPE_CHECKING:
+    from nova_act.cli.browser.commands.browsing.ask import ask
+    from nova_act.cli.browser.commands.browsing.back import back
+    from nova_act.cli.browser.commands.browsing.click_target import click_target
+    from nova_act.cli.browser.commands.browsing.console_log import console_log
+    from nova_act.cli.browser.commands.browsing.execute import execute
+    from nova_act.cli.browser.commands.browsing.fill_form import fill_form
+    from nova_act.cli.browser.commands.browsing.forward import forward
+    from nova_act.cli.browser.commands.browsing.goto import goto
+    from nova_act.cli.browser.commands.browsing.network_log import network_log
+    from nova_act.cli.browser.commands.browsing.page import page
+    from nova_act.cli.browser.commands.browsing.refresh import refresh
+    from nova_act.cli.browser.commands.browsing.scroll_to import scroll_to
+    from nova_act.cli.browser.commands.browsing.tab_close import tab_close
+    from nova_act.cli.browser.commands.browsing.tab_list import tab_list
+    from nova_act.cli.browser.commands.browsing.tab_new import tab_new
+    from nova_act.cli.browser.commands.browsing.tab_select import tab_select
+    from nova_act.cli.browser.commands.browsing.type_text import type_text
+    from nova_act.cli.browser.commands.browsing.verify import verify
+    from nova_act.cli.browser.commands.browsing.wait_for import wait_for
+    from nova_act.cli.browser.commands.extraction.diff import diff
+    from nova_act.cli.browser.commands.extraction.evaluate import evaluate
+    from nova_act.cli.browser.commands.extraction.extract import extract
+    from nova_act.cli.browser.commands.extraction.get_content import get_content
+    from nova_act.cli.browser.commands.extraction.pdf import pdf
+    from nova_act.cli.browser.commands.extraction.perf import perf
+    from nova_act.cli.browser.commands.extraction.query import query
+    from nova_act.cli.browser.commands.extraction.screenshot import screenshot
+    from nova_act.cli.browser.commands.extraction.snapshot import snapshot
+    from nova_act.cli.browser.commands.extraction.style import style
+    from nova_act.cli.browser.commands.setup.doctor import doctor
+    from nova_act.cli.browser.commands.setup.qa_plan import qa_plan
+    from nova_act.cli.browser.commands.setup.qa_run import qa_run
+
+# Resolved on first access so importing one submodule does not import them all
+_LAZY_EXPORTS: dict[str, str] = {
+    "ask": "nova_act.cli.browser.commands.browsing.ask",
+    "back": "nova_act.cli.browser.commands.browsing.back",
+    "click_target": "nova_act.cli.browser.commands.browsing.click_target",
+    "console_log": "nova_act.cli.browser.commands.browsing.console_log",
+    "execute": "nova_act.cli.browser.commands.browsing.execute",
+    "fill_form": "nova_act.cli.browser.commands.browsing.fill_form",
+    "forward": "nova_act.cli.browser.commands.browsing.forward",
+    "goto": "nova_act.cli.browser.commands.browsing.goto",
+    "network_log": "nova_act.cli.browser.commands.browsing.network_log",
+    "page": "nova_act.cli.browser.commands.browsing.page",
+    "refresh": "nova_act.cli.browser.commands.browsing.refresh",
+    "scroll_to": "nova_act.cli.browser.commands.browsing.scroll_to",
+    "tab_close": "nova_act.cli.browser.commands.browsing.tab_close",
+    "tab_list": "nova_act.cli.browser.commands.browsing.tab_list",
+    "tab_new": "nova_act.cli.browser.commands.browsing.tab_new",
+    "tab_select": "nova_act.cli.browser.commands.browsing.tab_select",
+    "type_text": "nova_act.cli.browser.commands.browsing.type_text",
+    "verify": "nova_act.cli.browser.commands.browsing.verify",
+    "wait_for": "nova_act.cli.browser.commands.browsing.wait_for",
+    "diff": "nova_act.cli.browser.commands.extraction.diff",
+    "evaluate": "nova_act.cli.browser.commands.extraction.evaluate",
+    "extract": "nova_act.cli.browser.commands.extraction.extract",
+    "get_content": "nova_act.cli.browser.commands.extraction.get_content",
+    "pdf": "nova_act.cli.browser.commands.extraction.pdf",
+    "perf": "nova_act.cli.browser.commands.extraction.perf",
+    "query": "nova_act.cli.browser.commands.extraction.query",
+    "screenshot": "nova_act.cli.browser.commands.extraction.screenshot",
+    "snapshot": "nova_act.cli.browser.commands.extraction.snapshot",
+    "style": "nova_act.cli.browser.commands.extraction.style",
+    "doctor": "nova_act.cli.browser.commands.setup.doctor",
+    "qa_plan": "nova_act.cli.browser.commands.setup.qa_plan",
+    "qa_run": "nova_act.cli.browser.commands.setup.qa_run",
+}
+
+lazy_exports.install(globals(), _LAZY_EXPORTS)
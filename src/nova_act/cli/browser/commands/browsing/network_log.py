@@ -29,18 +29,30 @@ from nova_act.cli.browser.utils.decorators import (
     pack_command_params,
 )
 from nova_act.cli.browser.utils.error_handlers import handle_common_errors
+from nova_act.cli.browser.utils.file_output import validate_output_dir
 from nova_act.cli.browser.utils.session import (
     command_session,
     get_active_page,
     prepare_session,
 )
-from nova_act.cli.core.json_output import is_json_mode
-from nova_act.cli.core.output import echo_success, get_cli_stdout
+from nova_act.cli.core.json_output import ErrorCode, is_json_mode
+from nova_act.cli.core.output import echo_success, exit_with_error, get_cli_stdout
 
 if TYPE_CHECKING:
     from nova_act.cli.browser.types import CommandParams
 
 
+# Credential-bearing headers are never kept, so --export files do not leak them
+SENSITIVE_HEADER_PATTERNS = [
+    "authorization",
+    "proxy-authorization",
+    "cookie",
+    "set-cookie",
+    "x-api-key",
+    "x-amz-*token",
+]
+
+
 def _new_registry() -> dict[str, NetworkCaptureService]:
     return {}
 
@@ -51,7 +63,7 @@ def get_or_create_capture(
 ) -> NetworkCaptureService:
     """Get existing capture service or create a new one for the session."""
     if session_id not in _registry:
-        _registry[session_id] = NetworkCaptureService()
+        _registry[session_id] = NetworkCaptureService(redact_headers=SENSITIVE_HEADER_PATTERNS)
     return _registry[session_id]
 
 
@@ -82,6 +94,12 @@ def _format_entry_line(entry: NetworkEntry) -> str:
 @click.option("--status", default=None, help="Filter by status code (200, 4xx, 5xx, >=400)")
 @click.option("--limit", default=50, type=int, help="Max entries to display (default: 50)")
 @click.option("--clear", is_flag=True, help="Clear captured entries")
+@click.option(
+    "--export",
+    "export_path",
+    default=None,
+    help="Stream all matching entries to a file (.har for HAR, otherwise JSON Lines)",
+)
 @browser_command_options
 @handle_common_errors
 @pack_command_params
@@ -91,6 +109,7 @@ def network_log(
     status: str | None,
     limit: int,
     clear: bool,
+    export_path: str | None,
     params: CommandParams,
 ) -> None:
     """Display captured network requests and responses.
@@ -104,7 +123,11 @@ def network_log(
         act browser network-log --status 4xx --limit 20
         act browser network-log --clear
         act browser network-log --json
+        act browser network-log --status 5xx --export failures.har
     """
+    if export_path:
+        validate_output_dir(export_path)
+
     prep = prepare_session(params, None)
     capture = get_or_create_capture(params.session_id)
 
@@ -127,10 +150,39 @@ def network_log(
             echo_success("Network log cleared")
             return
 
+        if export_path:
+            count = _export_entries(capture, export_path, url_filter=url_filter, method=method, status=status)
+            echo_success("Network log exported", details={"File": export_path, "Entries": count})
+            return
+
         entries = capture.get_entries(url_filter=url_filter, method=method, status=status, limit=limit)
         _emit_entries(entries, capture.entry_count, params.session_id)
 
 
+def _export_entries(
+    capture: NetworkCaptureService,
+    path: str,
+    *,
+    url_filter: str | None,
+    method: str | None,
+    status: str | None,
+) -> int:
+    """Stream matching entries to path as HAR (.har) or JSON Lines. Exits on write error."""
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            if path.lower().endswith(".har"):
+                return capture.export_har(f, url_filter=url_filter, method=method, status=status)
+            return capture.export_jsonl(f, url_filter=url_filter, method=method, status=status)
+    except OSError as e:
+        exit_with_error(
+            "File write error",
+            str(e),
+            suggestions=["Check file permissions", "Verify output path exists"],
+            error_code=ErrorCode.FILE_ERROR,
+        )
+        return 0  # unreachable
+
+
 def _emit_entries(entries: list[NetworkEntry], total: int, session_id: str) -> None:
     """Output entries in JSON or text format."""
     out = get_cli_stdout()
@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 
 import click
@@ -82,9 +83,11 @@ def create(
         params,
         auth_config=auth_config,
     )
+    start = time.perf_counter()
     session_info = get_or_create_session(manager, params.session_id, url, browser_options, max_sessions=max_sessions)
+    elapsed = time.perf_counter() - start
 
     echo_success(
         f"Created session '{params.session_id}'",
-        details={"State": session_info.state.value},
+        details={"State": session_info.state.value, "Startup Time": f"{elapsed:.2f}s"},
     )
@@ -37,12 +37,19 @@ from nova_act.cli.core.output import echo_success, exit_with_error, get_cli_stdo
     default="json",
     help="Output format (default: json)",
 )
+@click.option("--limit", type=int, default=None, help="Export last N commands only")
 @click.option("--include-screenshots", is_flag=True, help="Embed screenshots as base64 (warning: large output)")
 @click.option("--report", is_flag=True, help="Generate a structured markdown report with copied resources")
 @click.option("--output-dir", type=click.Path(), default=None, help="Report output directory (requires --report)")
 @json_option
 def export(
-    session_id: str, output: str | None, fmt: str, include_screenshots: bool, report: bool, output_dir: str | None
+    session_id: str,
+    output: str | None,
+    fmt: str,
+    limit: int | None,
+    include_screenshots: bool,
+    report: bool,
+    output_dir: str | None,
 ) -> None:
     """Export structured session history for agent consumption.
 
@@ -55,6 +62,7 @@ def export(
         act browser session export --session-id my-session --format json
         act browser session export --output history.json --include-screenshots
         act browser session export --format yaml -o history.yaml
+        act browser session export --limit 20
         act browser session export --report
         act browser session export --report --output-dir ./my-report
     """
@@ -74,7 +82,7 @@ def export(
         )
 
     recorder = get_recorder(session_id)
-    manifest = recorder.get_manifest()
+    manifest = recorder.get_manifest(limit=limit)
     commands = manifest["commands"]
 
     if report:
@@ -44,8 +44,8 @@ def record_show(session_id: str, limit: int | None, summary: bool) -> None:
         act browser session record-show --summary
     """
     recorder = get_recorder(session_id)
-    manifest = recorder.get_manifest()
-    commands = recorder.get_commands(limit=limit)
+    manifest = recorder.get_manifest(limit=limit)
+    commands = manifest["commands"]
 
     if not commands:
         echo_success("No commands recorded", details={"session_id": session_id})
@@ -59,7 +59,7 @@ def record_show(session_id: str, limit: int | None, summary: bool) -> None:
             "session_id": manifest.get("session_id"),
             "started_at": manifest.get("started_at"),
             "last_updated": manifest.get("last_updated"),
-            "total_commands": len(manifest.get("commands", [])),
+            "total_commands": recorder.total_commands,
             "commands": commands,
         }
         click.echo(json.dumps(output, indent=2), file=out)
@@ -78,7 +78,7 @@ def record_show(session_id: str, limit: int | None, summary: bool) -> None:
     # Detailed view
     details: dict[str, str] = {
         "Started": manifest.get("started_at", "unknown"),
-        "Total commands": str(len(manifest.get("commands", []))),
+        "Total commands": str(recorder.total_commands),
     }
     for i, cmd in enumerate(commands, 1):
         duration = f" ({cmd['duration_ms']:.0f}ms)" if "duration_ms" in cmd else ""
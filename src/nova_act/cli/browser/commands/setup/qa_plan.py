@@ -57,22 +57,16 @@ def qa_plan(feature_file: str, plan_strategy: str, tags: tuple[str, ...], output
         act browser qa-plan tests/checkout.feature --output plan.json
         act browser qa-plan tests/smoke.feature --dry-run
     """
-    from nova_act.cli.browser.services.gherkin_compiler import compile_feature
-
-    path = Path(feature_file)
-
-    # Collect .feature files
-    if path.is_dir():
-        files = sorted(path.rglob("*.feature"))
-        if not files:
-            exit_with_error(
-                "No .feature files found",
-                f"No .feature files in {path}",
-                suggestions=["Check the path contains .feature files"],
-            )
-            return
-    else:
-        files = [path]
+    from nova_act.cli.browser.services.gherkin_compiler import compile_feature, find_feature_files
+
+    files = find_feature_files(feature_file)
+    if not files:
+        exit_with_error(
+            "No .feature files found",
+            f"No .feature files in {feature_file}",
+            suggestions=["Check the path contains .feature files"],
+        )
+        return
 
     tag_list = list(tags) if tags else None
     plans = []
@@ -0,0 +1,124 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""qa-run command -- run Gherkin .feature scenarios in parallel browser sessions."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+from nova_act.cli.browser.utils.decorators import json_option
+from nova_act.cli.core.json_output import ErrorCode, is_json_mode
+from nova_act.cli.core.output import echo_success, exit_with_error, get_cli_stdout
+
+if TYPE_CHECKING:
+    from nova_act.cli.browser.services.plan_runner import ScenarioResult
+
+
+def _echo_scenario(result: ScenarioResult) -> None:
+    if is_json_mode():
+        return
+    click.echo(
+        f"{result.status.upper():<7} {result.duration_s:>7.1f}s  {result.feature} :: {result.scenario}",
+        file=get_cli_stdout(),
+    )
+
+
+@click.command(name="qa-run")
+@click.argument("feature_file", type=click.Path(exists=True))
+@click.option(
+    "--plan-strategy",
+    type=click.Choice(["aggressive", "conservative"]),
+    default="aggressive",
+    show_default=True,
+    help="aggressive collapses sequential same-type steps; conservative maps 1:1",
+)
+@click.option("--tags", multiple=True, help="Filter scenarios by @tag (repeatable)")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Maximum scenarios (browser sessions) running at once",
+)
+@click.option("--output", "-o", type=click.Path(), default=None, help="Save the run report to a JSON file")
+@json_option
+def qa_run(
+    feature_file: str,
+    plan_strategy: str,
+    tags: tuple[str, ...],
+    concurrency: int,
+    output: str | None,
+) -> None:
+    """Run Gherkin scenarios in parallel, one isolated browser session each.
+
+    Compiles FEATURE_FILE (or every .feature file under a directory) like
+    qa-plan, then runs up to --concurrency scenarios at once. Each scenario gets
+    its own session, which is closed when the scenario ends. Scenarios that
+    require human auth run one at a time in a headed browser. Exit code 0 if
+    every scenario passed, 1 otherwise.
+
+    Examples:
+        act browser qa-run tests/smoke.feature
+        act browser qa-run tests/ --tags @smoke --concurrency 8
+        act browser qa-run tests/checkout.feature --output report.json --json
+    """
+    from nova_act.cli.browser.services.gherkin_compiler import compile_feature, find_feature_files
+    from nova_act.cli.browser.services.plan_runner import PlanRunner
+
+    if output:
+        from nova_act.cli.browser.utils.file_output import validate_output_dir
+
+        validate_output_dir(output)
+
+    tag_list = list(tags) if tags else None
+    plans = [compile_feature(f, strategy=plan_strategy, tags=tag_list) for f in find_feature_files(feature_file)]
+    plans = [p for p in plans if p.scenarios]
+    if not plans:
+        exit_with_error(
+            "No matching scenarios",
+            f"No scenarios found in {feature_file} for the given tag filters",
+            suggestions=["Check the path contains .feature files", "Check your --tags filter"],
+        )
+
+    report = PlanRunner(concurrency=concurrency, on_scenario_done=_echo_scenario).run(plans)
+    report_dict = asdict(report)
+    if output:
+        Path(output).write_text(json.dumps(report_dict, indent=2), encoding="utf-8")
+
+    summary: dict[str, object] = {
+        "scenarios": report.total,
+        "passed": report.passed,
+        "failed": report.failed,
+        "wall_time_s": report.wall_time_s,
+        "serial_time_s": report.serial_time_s,
+    }
+    if output:
+        summary["report"] = output
+    if is_json_mode():
+        summary["results"] = report_dict["scenarios"]
+
+    if report.failed:
+        exit_with_error(
+            "QA run failed",
+            f"{report.failed} of {report.total} scenarios did not pass",
+            suggestions=["Inspect failed steps in the report (--output or --json)", "Re-run with --concurrency 1"],
+            error_code=ErrorCode.ASSERTION_FAILED,
+            details=summary,
+        )
+    echo_success("All scenarios passed", details=summary)
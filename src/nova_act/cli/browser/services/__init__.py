@@ -13,17 +13,35 @@
 # limitations under the License.
 """Browser services module."""
 
-from nova_act.cli.browser.services.session.chrome_launcher import ChromeLauncher
-from nova_act.cli.browser.services.session.chrome_terminator import ChromeTerminator
-from nova_act.cli.browser.services.session.locking import SessionLockManager
-from nova_act.cli.browser.services.session.manager import SessionManager
-from nova_act.cli.browser.services.session.models import (
-    BrowserOptions,
-    SessionInfo,
-    SessionState,
-)
-from nova_act.cli.browser.services.session.persistence import SessionPersistence
-from nova_act.cli.core.exceptions import SessionLockTimeout
+from typing import TYPE_CHECKING
+
+from nova_act.util import lazy_exports
+
+if TYPE_CHECKING:
+    from nova_act.cli.browser.services.session.chrome_launcher import ChromeLauncher
+    from nova_act.cli.browser.services.session.chrome_terminator import ChromeTerminator
+    from nova_act.cli.browser.services.session.locking import SessionLockManager
+    from nova_act.cli.browser.services.session.manager import SessionManager
+    from nova_act.cli.browser.services.session.models import (
+        BrowserOptions,
+        SessionInfo,
+        SessionState,
+    )
+    from nova_act.cli.browser.services.session.persistence import SessionPersistence
+    from nova_act.cli.core.exceptions import SessionLockTimeout
+
+# Resolved on first access so importing one submodule does not import them all
+_LAZY_EXPORTS: dict[str, str] = {
+    "ChromeLauncher": "nova_act.cli.browser.services.session.chrome_launcher",
+    "ChromeTerminator": "nova_act.cli.browser.services.session.chrome_terminator",
+    "SessionLockManager": "nova_act.cli.browser.services.session.locking",
+    "SessionManager": "nova_act.cli.browser.services.session.manager",
+    "BrowserOptions": "nova_act.cli.browser.services.session.models",
+    "SessionInfo": "nova_act.cli.browser.services.session.models",
+    "SessionState": "nova_act.cli.browser.services.session.models",
+    "SessionPersistence": "nova_act.cli.browser.services.session.persistence",
+    "SessionLockTimeout": "nova_act.cli.core.exceptions",
+}
 
 __all__ = [
     "BrowserOptions",
@@ -36,3 +54,5 @@ __all__ = [
     "SessionPersistence",
     "SessionManager",
 ]
+
+lazy_exports.install(globals(), _LAZY_EXPORTS)
@@ -46,5 +46,13 @@ class DefaultBrowserConfig:
     DEFAULT_MAX_ACTIVE_SESSIONS = 5
     SESSION_STALE_TTL_HOURS = 24
 
+    # Warm Chrome Pool
+    CHROME_POOL_MAX_SIZE = 8
+    CHROME_POOL_IDLE_TTL_SECONDS = 30 * 60
+
+    # Default Chrome Profile Template
+    PROFILE_TEMPLATE_MAX_AGE_SECONDS = 15 * 60
+    PROFILE_TEMPLATE_LOCK_TIMEOUT_SECONDS = 300.0
+
     # Act Execution
     DEFAULT_ACT_TIMEOUT_SECONDS = 300
@@ -218,6 +218,12 @@ def _expand_outline(scenario: Scenario) -> list[Scenario]:
     return expanded
 
 
+def find_feature_files(path: str | Path) -> list[Path]:
+    """Return the .feature file at path, or all .feature files under a directory (sorted)."""
+    path = Path(path)
+    return sorted(path.rglob("*.feature")) if path.is_dir() else [path]
+
+
 def compile_feature(
     feature_path: str | Path, strategy: str = "aggressive", tags: list[str] | None = None
 ) -> FeaturePlan:
@@ -18,7 +18,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from nova_act.cli.browser.services.intent_resolution.snapshot import SnapshotElement
 
@@ -69,17 +69,19 @@ def exact_match(target: str, elements: list[SnapshotElement]) -> SnapshotElement
 def token_set_match(target: str, elements: list[SnapshotElement]) -> MatchResult:
     """Tier 3: Fuzzy match via rapidfuzz token_set_ratio.
 
+    Scores all names in one vectorized rapidfuzz call and keeps only the top two
+    (ties go to the element that comes first in the document).
     Confident if best score >= FUZZY_SCORE_THRESHOLD AND gap to second-best >= FUZZY_GAP_THRESHOLD.
     """
     named = [e for e in elements if e.name]
     if not named:
         return MatchResult(element=None, score=0.0, confident=False)
 
-    scored = [(e, fuzz.token_set_ratio(target, e.name)) for e in named]
-    scored.sort(key=lambda x: x[1], reverse=True)
+    top = process.extract(target, [e.name for e in named], scorer=fuzz.token_set_ratio, limit=2)
 
-    best_elem, best_score = scored[0]
-    second_score = scored[1][1] if len(scored) > 1 else 0.0
+    _, best_score, best_index = top[0]
+    best_elem = named[best_index]
+    second_score = top[1][1] if len(top) > 1 else 0.0
     gap = best_score - second_score
 
     if best_score >= FUZZY_SCORE_THRESHOLD and gap >= FUZZY_GAP_THRESHOLD:
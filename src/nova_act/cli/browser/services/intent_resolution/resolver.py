@@ -15,10 +15,13 @@
 
 from __future__ import annotations
 
+import weakref
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from playwright.sync_api import Error as PlaywrightError
+
 from nova_act.cli.browser.services.intent_resolution.matching import (
     FUZZY_SCORE_THRESHOLD,
     detect_format,
@@ -26,6 +29,7 @@ from nova_act.cli.browser.services.intent_resolution.matching import (
     token_set_match,
 )
 from nova_act.cli.browser.services.intent_resolution.snapshot import (
+    IndexedSnapshot,
     SnapshotElement,
     flatten_snapshot,
 )
@@ -60,19 +64,68 @@ HEADING_LANDMARK_ROLES = frozenset(
 HEADING_LANDMARK_BONUS = 5
 
 
-def _filter_by_command(elements: list[SnapshotElement], command_type: str) -> list[SnapshotElement]:
-    """Filter elements by roles relevant to the command type."""
-    if command_type == "click":
-        return [e for e in elements if e.role in CLICKABLE_ROLES]
-    if command_type == "fill-form":
-        return [e for e in elements if e.role in FILLABLE_ROLES]
-    if command_type == "search":
-        return [e for e in elements if e.role in SEARCH_ROLES or "search" in (e.name or "").lower()]
-    # scroll-to: all elements (bonus applied in matching)
-    return elements
+# Installs (once per document) a MutationObserver that bumps a version counter, and returns
+# [url, document token, version]. Pending mutation records are flushed first so a change made
+# just before the call is always counted.
+_DOM_VERSION_JS = """() => {
+    let state = window.__novaActDomVersion;
+    if (!state) {
+        state = { token: Math.random().toString(36).slice(2), version: 0 };
+        state.observer = new MutationObserver(() => { state.version++; });
+        state.observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+        window.__novaActDomVersion = state;
+    }
+    if (state.observer.takeRecords().length) state.version++;
+    return [location.href, state.token, state.version];
+}"""
+
+# Page -> (DOM version key, snapshot). Weak so closed pages don't pin their snapshots.
+_snapshot_cache: weakref.WeakKeyDictionary[Page, tuple[list[object], IndexedSnapshot]] = weakref.WeakKeyDictionary()
 
 
-def resolve(target: str, command_type: str, page: "Page") -> ResolvedTarget:
+def get_indexed_snapshot(page: Page) -> IndexedSnapshot:
+    """Return the page's indexed accessibility snapshot, reusing it while the DOM is unchanged.
+
+    The cache is keyed by URL plus a DOM version counter maintained in the page, so any
+    navigation or DOM mutation forces a fresh snapshot. Property-only changes (e.g. a typed
+    input value) do not invalidate it; resolution only depends on roles, names and refs.
+    """
+    try:
+        version_key: list[object] | None = page.evaluate(_DOM_VERSION_JS)
+    except PlaywrightError:
+        version_key = None
+
+    cached = _snapshot_cache.get(page)
+    if version_key is not None and cached is not None and cached[0] == version_key:
+        return cached[1]
+
+    snapshot = IndexedSnapshot(flatten_snapshot(page.accessibility.snapshot()))
+    if version_key is not None:
+        _snapshot_cache[page] = (version_key, snapshot)
+    else:
+        _snapshot_cache.pop(page, None)
+    return snapshot
+
+
+def _filter_by_command(snapshot: IndexedSnapshot, command_type: str) -> list[SnapshotElement]:
+    """Filter elements by roles relevant to the command type (memoized per snapshot)."""
+    if command_type in snapshot.views:
+        return snapshot.views[command_type]
+
+    if command_type == "click":
+        filtered = snapshot.with_roles(CLICKABLE_ROLES)
+    elif command_type == "fill-form":
+        filtered = snapshot.with_roles(FILLABLE_ROLES)
+    elif command_type == "search":
+        filtered = [e for e in snapshot.elements if e.role in SEARCH_ROLES or "search" in (e.name or "").lower()]
+    else:
+        # scroll-to: all elements (bonus applied in matching)
+        filtered = snapshot.elements
+    snapshot.views[command_type] = filtered
+    return filtered
+
+
+def resolve(target: str, command_type: str, page: Page) -> ResolvedTarget:
     """Resolve agent intent to a fast or smart path.
 
     Args:
@@ -88,19 +141,15 @@ def resolve(target: str, command_type: str, page: "Page") -> ResolvedTarget:
     if fmt:
         if fmt.kind == "snapshot_ref":
             # Need snapshot to look up the ref
-            tree = page.accessibility.snapshot()
-            elements = flatten_snapshot(tree)
-            for elem in elements:
-                if elem.ref.lower() == fmt.value.lower():
-                    return ResolvedTarget(path=ResolutionPath.FAST, element=elem, confidence=100.0, match_method="ref")
+            elem = get_indexed_snapshot(page).find_ref(fmt.value)
+            if elem is not None:
+                return ResolvedTarget(path=ResolutionPath.FAST, element=elem, confidence=100.0, match_method="ref")
             return ResolvedTarget(path=ResolutionPath.SMART, match_method="ref_not_found")
         # CSS selector -- fast path directly
         return ResolvedTarget(path=ResolutionPath.FAST, confidence=100.0, match_method="selector")
 
     # Tier 2 & 3: Need snapshot
-    tree = page.accessibility.snapshot()
-    elements = flatten_snapshot(tree)
-    filtered = _filter_by_command(elements, command_type)
+    filtered = _filter_by_command(get_indexed_snapshot(page), command_type)
 
     # Tier 2: Exact match
     exact = exact_match(target, filtered)
@@ -63,3 +63,27 @@ def flatten_snapshot(tree: dict[str, object] | None) -> list[SnapshotElement]:
                     stack.append(child)
 
     return elements
+
+
+class IndexedSnapshot:
+    """Flattened snapshot with ref and role indexes, built once per page state."""
+
+    def __init__(self, elements: list[SnapshotElement]) -> None:
+        self.elements = elements
+        self._by_ref = {elem.ref.lower(): elem for elem in elements}
+        self._position = {elem.ref: i for i, elem in enumerate(elements)}
+        self._by_role: dict[str, list[SnapshotElement]] = {}
+        for elem in elements:
+            self._by_role.setdefault(elem.role, []).append(elem)
+        # Memoized filtered views, e.g. per command type
+        self.views: dict[str, list[SnapshotElement]] = {}
+
+    def find_ref(self, ref: str) -> SnapshotElement | None:
+        """Look up an element by ref (case-insensitive)."""
+        return self._by_ref.get(ref.lower())
+
+    def with_roles(self, roles: frozenset[str]) -> list[SnapshotElement]:
+        """Return elements with any of the given roles, in document order."""
+        selected = [elem for role in roles for elem in self._by_role.get(role, [])]
+        selected.sort(key=lambda elem: self._position[elem.ref])
+        return selected
@@ -19,19 +19,30 @@ Console capture (Phase 2b) reuses this same pattern.
 
 from __future__ import annotations
 
+import dataclasses
 import fnmatch
+import json
+import re
 import time
-from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, TextIO, TypeVar
 
 if TYPE_CHECKING:
     from playwright.sync_api import Page, Request, Response
 
 DEFAULT_MAX_ENTRIES = 500
+REDACTED_VALUE = "[REDACTED]"
+# Bound on remembered header-name redaction decisions (header names repeat heavily)
+_REDACTION_CACHE_SIZE = 1024
+_NO_HEADERS: dict[str, str] = {}
 
+_K = TypeVar("_K")
 
-@dataclass
+
+@dataclass(slots=True)
 class NetworkEntry:
     """Single captured network request/response pair."""
 
@@ -48,11 +59,137 @@ class NetworkEntry:
     failure_text: str | None = None
 
 
+class _NetworkRing:
+    """Fixed-capacity columnar ring buffer of network entries.
+
+    Each entry gets a monotonically increasing sequence number; its column slot is
+    ``seq % capacity``. Entries in ``[first_seq, next_seq)`` are live. Method and
+    status-class indexes are kept up to date on insert, status update and eviction.
+    """
+
+    __slots__ = (
+        "capacity",
+        "first_seq",
+        "next_seq",
+        "key",
+        "url",
+        "method",
+        "resource_type",
+        "timestamp",
+        "status",
+        "request_headers",
+        "response_headers",
+        "duration_ms",
+        "size",
+        "failure_text",
+        "by_method",
+        "by_status_class",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.first_seq = 0
+        self.next_seq = 0
+        self.key: list[str] = [""] * capacity
+        self.url: list[str] = [""] * capacity
+        self.method: list[str] = [""] * capacity
+        self.resource_type: list[str] = [""] * capacity
+        self.timestamp: list[float] = [0.0] * capacity
+        self.status: list[int | None] = [None] * capacity
+        self.request_headers: list[dict[str, str]] = [_NO_HEADERS] * capacity
+        self.response_headers: list[dict[str, str]] = [_NO_HEADERS] * capacity
+        self.duration_ms: list[float | None] = [None] * capacity
+        self.size: list[int | None] = [None] * capacity
+        # None while pending or completed; the failure text (possibly "") once failed
+        self.failure_text: list[str | None] = [None] * capacity
+        self.by_method: dict[str, set[int]] = {}
+        self.by_status_class: dict[int, set[int]] = {}
+
+    def __len__(self) -> int:
+        return self.next_seq - self.first_seq
+
+    def contains(self, seq: int) -> bool:
+        return self.first_seq <= seq < self.next_seq
+
+    def append(self, key: str, url: str, method: str, resource_type: str, request_headers: dict[str, str]) -> int:
+        """Store a new request, returning its sequence number. The ring must not be full."""
+        seq = self.next_seq
+        i = seq % self.capacity
+        self.key[i] = key
+        self.url[i] = url
+        self.method[i] = method
+        self.resource_type[i] = resource_type
+        self.timestamp[i] = time.time()
+        self.status[i] = None
+        self.request_headers[i] = request_headers
+        self.response_headers[i] = _NO_HEADERS
+        self.duration_ms[i] = None
+        self.size[i] = None
+        self.failure_text[i] = None
+        self.by_method.setdefault(method, set()).add(seq)
+        self.next_seq += 1
+        return seq
+
+    def evict_oldest(self) -> str:
+        """Drop the oldest entry, returning its request key."""
+        seq = self.first_seq
+        i = seq % self.capacity
+        self._unindex(self.by_method, self.method[i], seq)
+        status = self.status[i]
+        if status is not None:
+            self._unindex(self.by_status_class, status // 100, seq)
+        # Release header dicts now rather than when the slot is reused
+        self.request_headers[i] = _NO_HEADERS
+        self.response_headers[i] = _NO_HEADERS
+        self.first_seq += 1
+        return self.key[i]
+
+    def set_status(self, seq: int, status: int) -> None:
+        self.status[seq % self.capacity] = status
+        self.by_status_class.setdefault(status // 100, set()).add(seq)
+
+    def clear(self) -> None:
+        """Drop all entries; sequence numbers keep increasing so stale pending requests are ignored."""
+        self.first_seq = self.next_seq
+        self.request_headers = [_NO_HEADERS] * self.capacity
+        self.response_headers = [_NO_HEADERS] * self.capacity
+        self.by_method.clear()
+        self.by_status_class.clear()
+
+    def entry(self, seq: int) -> NetworkEntry:
+        """Materialize one entry (header dicts are copied so callers cannot mutate the buffer)."""
+        i = seq % self.capacity
+        failure_text = self.failure_text[i]
+        return NetworkEntry(
+            url=self.url[i],
+            method=self.method[i],
+            resource_type=self.resource_type[i],
+            timestamp=self.timestamp[i],
+            status=self.status[i],
+            request_headers=dict(self.request_headers[i]),
+            response_headers=dict(self.response_headers[i]),
+            duration_ms=self.duration_ms[i],
+            size=self.size[i],
+            failed=failure_text is not None,
+            failure_text=failure_text or None,
+        )
+
+    @staticmethod
+    def _unindex(index: dict[_K, set[int]], value: _K, seq: int) -> None:
+        seqs = index.get(value)
+        if seqs is not None:
+            seqs.discard(seq)
+            if not seqs:
+                del index[value]
+
+
 class NetworkCaptureService:
     """Captures network traffic from a Playwright page via event listeners.
 
-    Uses a ring buffer (deque with maxlen) to bound memory usage.
-    Designed as a clean template for other event-listener capture services.
+    Stores entries in a columnar ring buffer to bound memory usage, with
+    incremental indexes by method and status class so filtered queries touch
+    only matching entries. Designed as a clean template for other
+    event-listener capture services.
 
     Usage:
         capture = NetworkCaptureService()
@@ -67,10 +204,12 @@ class NetworkCaptureService:
         max_entries: int = DEFAULT_MAX_ENTRIES,
         redact_headers: list[str] | None = None,
     ) -> None:
-        self._entries: deque[NetworkEntry] = deque(maxlen=max_entries)
-        self._entry_index: dict[str, NetworkEntry] = {}  # request_key -> entry for O(1) lookup
-        self._pending: dict[str, float] = {}  # request_key -> start_time
-        self._redact_patterns = redact_headers or []
+        self._ring = _NetworkRing(max_entries)
+        self._pending: dict[str, tuple[int, float]] = {}  # request_key -> (seq, start_time)
+        self._redact_pattern = (
+            re.compile("|".join(fnmatch.translate(p.lower()) for p in redact_headers)) if redact_headers else None
+        )
+        self._redacted_names: dict[str, bool] = {}
         self._attached = False
 
     @property
@@ -112,78 +251,167 @@ class NetworkCaptureService:
                     or comparison (">=400").
             limit: Max entries to return (from most recent).
         """
-        result = list(self._entries)
+        if not limit or limit <= 0:
+            return list(self.iter_entries(url_filter=url_filter, method=method, status=status))
+
+        # Scan newest first and stop once `limit` matches are found
+        seqs: list[int] = []
+        for seq in self._matching_seqs(url_filter, method, status, newest_first=True):
+            seqs.append(seq)
+            if len(seqs) == limit:
+                break
+        return [self._ring.entry(seq) for seq in reversed(seqs)]
+
+    def iter_entries(
+        self,
+        *,
+        url_filter: str | None = None,
+        method: str | None = None,
+        status: str | None = None,
+    ) -> Iterator[NetworkEntry]:
+        """Lazily yield filtered entries, oldest first (same filters as get_entries)."""
+        for seq in self._matching_seqs(url_filter, method, status):
+            if self._ring.contains(seq):
+                yield self._ring.entry(seq)
 
-        if url_filter:
-            result = [e for e in result if fnmatch.fnmatch(e.url, url_filter)]
-        if method:
-            upper = method.upper()
-            result = [e for e in result if e.method == upper]
-        if status:
-            result = [e for e in result if _matches_status(e.status, status)]
-        if limit and limit > 0:
-            result = result[-limit:]
+    def export_jsonl(
+        self,
+        out: TextIO,
+        *,
+        url_filter: str | None = None,
+        method: str | None = None,
+        status: str | None = None,
+    ) -> int:
+        """Stream filtered entries to `out` as JSON Lines, one entry per line.
 
-        return result
+        Returns:
+            Number of entries written
+        """
+        count = 0
+        for entry in self.iter_entries(url_filter=url_filter, method=method, status=status):
+            out.write(json.dumps(dataclasses.asdict(entry)))
+            out.write("\n")
+            count += 1
+        return count
+
+    def export_har(
+        self,
+        out: TextIO,
+        *,
+        url_filter: str | None = None,
+        method: str | None = None,
+        status: str | None = None,
+    ) -> int:
+        """Stream filtered entries to `out` as a HAR 1.2 document.
+
+        Bodies and detailed timings are not captured, so those HAR fields hold
+        placeholder values (-1 or empty).
+
+        Returns:
+            Number of entries written
+        """
+        out.write('{"log": {"version": "1.2", "creator": {"name": "nova-act", "version": ""}, "entries": [')
+        count = 0
+        for entry in self.iter_entries(url_filter=url_filter, method=method, status=status):
+            if count:
+                out.write(",")
+            out.write(json.dumps(_to_har_entry(entry)))
+            count += 1
+        out.write("]}}\n")
+        return count
 
     def clear(self) -> None:
         """Clear all captured entries and pending requests."""
-        self._entries.clear()
-        self._entry_index.clear()
+        self._ring.clear()
         self._pending.clear()
 
     @property
     def entry_count(self) -> int:
-        return len(self._entries)
+        return len(self._ring)
+
+    def _matching_seqs(
+        self,
+        url_filter: str | None,
+        method: str | None,
+        status: str | None,
+        newest_first: bool = False,
+    ) -> Iterator[int]:
+        """Yield sequence numbers of live entries matching the filters."""
+        ring = self._ring
+        index_hits: list[set[int]] = []
+        if method:
+            index_hits.append(ring.by_method.get(method.upper(), set()))
+        status_class, status_check = _compile_status_filter(status) if status else (None, None)
+        if status_class is not None:
+            index_hits.append(ring.by_status_class.get(status_class, set()))
+
+        candidates: Iterable[int]
+        if index_hits:
+            candidates = sorted(index_hits[0].intersection(*index_hits[1:]), reverse=newest_first)
+        else:
+            live = range(ring.first_seq, ring.next_seq)
+            candidates = reversed(live) if newest_first else live
+
+        url_match = _compile_glob(url_filter).match if url_filter else None
+        capacity = ring.capacity
+        for seq in candidates:
+            i = seq % capacity
+            if status_check is not None:
+                code = ring.status[i]
+                if code is None or not status_check(code):
+                    continue
+            if url_match is not None and url_match(ring.url[i]) is None:
+                continue
+            yield seq
 
     def _redact(self, headers: dict[str, str]) -> dict[str, str]:
         """Replace values of headers matching redact patterns with '[REDACTED]'."""
-        if not self._redact_patterns:
-            return headers
-        return {
-            k: "[REDACTED]" if any(fnmatch.fnmatch(k.lower(), p.lower()) for p in self._redact_patterns) else v
-            for k, v in headers.items()
-        }
+        if self._redact_pattern is None:
+            return dict(headers)
+        decisions = self._redacted_names
+        result: dict[str, str] = {}
+        for name, value in headers.items():
+            redact = decisions.get(name)
+            if redact is None:
+                if len(decisions) >= _REDACTION_CACHE_SIZE:
+                    decisions.clear()
+                redact = decisions[name] = self._redact_pattern.match(name.lower()) is not None
+            result[name] = REDACTED_VALUE if redact else value
+        return result
 
     def _on_request(self, request: Request) -> None:
         key = _request_key(request)
-        self._pending[key] = time.monotonic()
-        entry = NetworkEntry(
-            url=request.url,
-            method=request.method,
-            resource_type=request.resource_type,
-            timestamp=time.time(),
-            request_headers=self._redact(dict(request.headers)),
-        )
-        self._entries.append(entry)
-        self._entry_index[key] = entry
+        ring = self._ring
+        if len(ring) == ring.capacity:
+            self._pending.pop(ring.evict_oldest(), None)
+        seq = ring.append(key, request.url, request.method, request.resource_type, self._redact(request.headers))
+        self._pending[key] = (seq, time.monotonic())
 
     def _on_response(self, response: Response) -> None:
-        request = response.request
-        key = _request_key(request)
-        start = self._pending.pop(key, None)
-        duration = (time.monotonic() - start) * 1000 if start is not None else None
-
-        entry = self._entry_index.pop(key, None)
-        if entry is not None:
-            entry.status = response.status
-            entry.response_headers = self._redact(dict(response.headers))
-            entry.duration_ms = round(duration, 1) if duration is not None else None
-            content_length = response.headers.get("content-length")
-            if content_length:
-                try:
-                    entry.size = int(content_length)
-                except ValueError:
-                    pass
+        pending = self._pending.pop(_request_key(response.request), None)
+        if pending is None:
+            return
+        seq, start = pending
+        ring = self._ring
+        if not ring.contains(seq):
+            return
 
-    def _on_request_failed(self, request: Request) -> None:
-        key = _request_key(request)
-        self._pending.pop(key, None)
+        i = seq % ring.capacity
+        headers = response.headers
+        ring.set_status(seq, response.status)
+        ring.response_headers[i] = self._redact(headers)
+        ring.duration_ms[i] = round((time.monotonic() - start) * 1000, 1)
+        content_length = headers.get("content-length")
+        if content_length:
+            try:
+                ring.size[i] = int(content_length)
+            except ValueError:
+                pass
 
-        entry = self._entry_index.pop(key, None)
-        if entry is not None:
-            entry.failed = True
-            entry.failure_text = request.failure
+    def _on_request_failed(self, request: Request) -> None:
+        pending = self._pending.pop(_request_key(request), None)
+        if pending is not None and self._ring.contains(pending[0]):
+            self._ring.failure_text[pending[0] % self._ring.capacity] = request.failure or ""
 
 
 def _request_key(request: Request) -> str:
@@ -191,25 +419,73 @@ def _request_key(request: Request) -> str:
     return f"{request.method}:{request.url}:{id(request)}"
 
 
-def _matches_status(actual: int | None, pattern: str) -> bool:
-    """Check if a status code matches a filter pattern.
+@lru_cache(maxsize=64)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _compile_status_filter(pattern: str) -> tuple[int | None, Callable[[int], bool] | None]:
+    """Split a status filter into an indexable status class and a residual check.
 
     Supports: exact ("200"), range ("4xx", "5xx"), comparison (">=400").
+    Invalid patterns match nothing.
+
+    Returns:
+        (status class to look up in the index or None, check on the status code or None)
     """
-    if actual is None:
-        return False
     if pattern.endswith("xx"):
         try:
-            prefix = int(pattern[0])
-            return actual // 100 == prefix
+            return int(pattern[0]), None
         except (ValueError, IndexError):
-            return False
+            return None, _match_nothing
     if pattern.startswith(">="):
         try:
-            return actual >= int(pattern[2:])
+            threshold = int(pattern[2:])
         except ValueError:
-            return False
+            return None, _match_nothing
+        return None, lambda code: code >= threshold
     try:
-        return actual == int(pattern)
+        exact = int(pattern)
     except ValueError:
-        return False
+        return None, _match_nothing
+    return exact // 100, lambda code: code == exact
+
+
+def _match_nothing(code: int) -> bool:
+    return False
+
+
+def _to_har_entry(entry: NetworkEntry) -> dict[str, object]:
+    """Convert an entry to a HAR 1.2 entry object."""
+    duration = entry.duration_ms if entry.duration_ms is not None else -1
+    return {
+        "startedDateTime": datetime.fromtimestamp(entry.timestamp, tz=timezone.utc).isoformat(),
+        "time": max(duration, 0),
+        "request": {
+            "method": entry.method,
+            "url": entry.url,
+            "httpVersion": "",
+            "cookies": [],
+            "headers": [{"name": k, "value": v} for k, v in entry.request_headers.items()],
+            "queryString": [],
+            "headersSize": -1,
+            "bodySize": -1,
+        },
+        "response": {
+            "status": entry.status or 0,
+            "statusText": entry.failure_text or "",
+            "httpVersion": "",
+            "cookies": [],
+            "headers": [{"name": k, "value": v} for k, v in entry.response_headers.items()],
+            "content": {
+                "size": entry.size if entry.size is not None else -1,
+                "mimeType": entry.response_headers.get("content-type", ""),
+            },
+            "redirectURL": entry.response_headers.get("location", ""),
+            "headersSize": -1,
+            "bodySize": entry.size if entry.size is not None else -1,
+        },
+        "cache": {},
+        "timings": {"send": 0, "wait": duration, "receive": 0},
+        "_resourceType": entry.resource_type,
+    }
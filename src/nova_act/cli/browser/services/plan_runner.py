@@ -0,0 +1,234 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Parallel runner for compiled Gherkin plans.
+
+Each scenario runs in its own browser session, created for the scenario and
+closed afterwards, so scenarios are isolated from each other and independent
+ones run concurrently (up to a concurrency limit). Plan steps run as CLI
+subprocesses against the scenario's session; a scenario stops at its first
+failing step.
+
+Scenarios that require human auth are serialized with each other (one at a
+time, in a headed browser) so a person can complete them.
+"""
+
+from __future__ import annotations
+
+import shlex
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from nova_act.cli.browser.services.browser_config import DefaultBrowserConfig
+from nova_act.cli.browser.services.gherkin_compiler import FeaturePlan, PlanStep, ScenarioPlan
+
+DEFAULT_CONCURRENCY = 4
+# Headroom over a step's own act timeout before the step process is killed
+STEP_TIMEOUT_MARGIN_SECONDS = 60
+# Trailing characters of a failed command's output kept in the report
+FAILURE_OUTPUT_CHARS = 2000
+
+_BLANK_PAGE = "about:blank"
+
+
+@dataclass
+class StepResult:
+    """Outcome of one plan step."""
+
+    cli: str
+    status: str  # passed, failed, skipped
+    duration_s: float = 0.0
+    exit_code: int | None = None
+    output: str | None = None
+
+
+@dataclass
+class ScenarioResult:
+    """Outcome of one scenario, run in its own session."""
+
+    feature: str
+    scenario: str
+    session_id: str
+    requires_human_auth: bool
+    status: str = "passed"  # passed, failed, error
+    duration_s: float = 0.0
+    error: str | None = None
+    steps: list[StepResult] = field(default_factory=list)
+
+
+@dataclass
+class RunReport:
+    """Aggregated results of a plan run."""
+
+    concurrency: int
+    wall_time_s: float
+    serial_time_s: float
+    total: int
+    passed: int
+    failed: int
+    scenarios: list[ScenarioResult]
+
+
+def _default_cli_prefix() -> list[str]:
+    return [sys.executable, "-m", "nova_act.cli.cli"]
+
+
+def _tail(text: str) -> str:
+    return text[-FAILURE_OUTPUT_CHARS:].strip()
+
+
+class PlanRunner:
+    """Runs compiled scenarios across isolated browser sessions with a concurrency limit."""
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        cli_prefix: list[str] | None = None,
+        step_timeout_s: float = DefaultBrowserConfig.DEFAULT_ACT_TIMEOUT_SECONDS + STEP_TIMEOUT_MARGIN_SECONDS,
+        on_scenario_done: Callable[[ScenarioResult], None] | None = None,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            concurrency: Maximum number of scenarios (and sessions) running at once
+            cli_prefix: Command that invokes the CLI (default: this interpreter's ``act``)
+            step_timeout_s: Seconds after which a step process is killed
+            on_scenario_done: Optional callback invoked as each scenario finishes
+        """
+        self.concurrency = max(1, concurrency)
+        self._cli_prefix = cli_prefix or _default_cli_prefix()
+        self._step_timeout_s = step_timeout_s
+        self._on_scenario_done = on_scenario_done
+        self._run_id = uuid.uuid4().hex[:6]
+        self._human_auth_lock = threading.Lock()
+
+    def run(self, plans: list[FeaturePlan]) -> RunReport:
+        """Run every scenario of every plan and aggregate the results in plan order."""
+        jobs = [(plan.feature, scenario) for plan in plans for scenario in plan.scenarios]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="qa-run") as pool:
+            futures = [
+                pool.submit(self._run_scenario, feature, scenario, f"qa-{self._run_id}-{index}")
+                for index, (feature, scenario) in enumerate(jobs, start=1)
+            ]
+            results = [future.result() for future in futures]
+        passed = sum(1 for r in results if r.status == "passed")
+        return RunReport(
+            concurrency=self.concurrency,
+            wall_time_s=round(time.perf_counter() - start, 2),
+            serial_time_s=round(sum(r.duration_s for r in results), 2),
+            total=len(results),
+            passed=passed,
+            failed=len(results) - passed,
+            scenarios=results,
+        )
+
+    def _run_scenario(self, feature: str, scenario: ScenarioPlan, session_id: str) -> ScenarioResult:
+        result = ScenarioResult(
+            feature=feature,
+            scenario=scenario.name,
+            session_id=session_id,
+            requires_human_auth=scenario.requires_human_auth,
+        )
+        start = time.perf_counter()
+        if scenario.requires_human_auth:
+            with self._human_auth_lock:
+                self._run_in_session(scenario, result)
+        else:
+            self._run_in_session(scenario, result)
+        result.duration_s = round(time.perf_counter() - start, 2)
+        if self._on_scenario_done is not None:
+            self._on_scenario_done(result)
+        return result
+
+    def _run_in_session(self, scenario: ScenarioPlan, result: ScenarioResult) -> None:
+        """Create the scenario's session, run its steps, and always close the session."""
+        steps = list(scenario.steps)
+        # Start the session on the first page instead of navigating there separately
+        starting_page = _BLANK_PAGE
+        if steps and steps[0].type == "navigate":
+            starting_page = _navigate_url(steps[0]) or _BLANK_PAGE
+            if starting_page != _BLANK_PAGE:
+                result.steps.append(StepResult(cli=steps.pop(0).cli, status="passed"))
+
+        create_args = [
+            "browser",
+            "session",
+            "create",
+            starting_page,
+            "--session-id",
+            result.session_id,
+            # Room for the run's own sessions on top of the user's
+            "--max-sessions",
+            str(DefaultBrowserConfig.DEFAULT_MAX_ACTIVE_SESSIONS + self.concurrency),
+            *(["--headed"] if scenario.requires_human_auth else []),
+        ]
+        created = self._run_cli(create_args)
+        if created.returncode != 0:
+            result.status = "error"
+            result.error = f"Failed to create session: {_tail(created.stdout + created.stderr)}"
+            result.steps.extend(StepResult(cli=step.cli, status="skipped") for step in steps)
+            return
+
+        try:
+            for step in steps:
+                if result.status != "passed":
+                    result.steps.append(StepResult(cli=step.cli, status="skipped"))
+                    continue
+                step_result = self._run_step(step, result.session_id)
+                result.steps.append(step_result)
+                if step_result.status != "passed":
+                    result.status = "failed"
+        finally:
+            self._run_cli(["browser", "session", "close", "--session-id", result.session_id])
+
+    def _run_step(self, step: PlanStep, session_id: str) -> StepResult:
+        argv = shlex.split(step.cli)
+        if argv and argv[0] == "act":
+            argv = argv[1:]
+        start = time.perf_counter()
+        completed = self._run_cli([*argv, "--session-id", session_id])
+        return StepResult(
+            cli=step.cli,
+            status="passed" if completed.returncode == 0 else "failed",
+            duration_s=round(time.perf_counter() - start, 2),
+            exit_code=completed.returncode,
+            output=_tail(completed.stdout + completed.stderr) if completed.returncode != 0 else None,
+        )
+
+    def _run_cli(self, args: list[str]) -> subprocess.CompletedProcess[str]:
+        try:
+            return subprocess.run(
+                [*self._cli_prefix, *args],
+                capture_output=True,
+                text=True,
+                stdin=subprocess.DEVNULL,
+                timeout=self._step_timeout_s,
+            )
+        except subprocess.TimeoutExpired as e:
+            output = e.stdout if isinstance(e.stdout, str) else ""
+            return subprocess.CompletedProcess(
+                e.cmd, returncode=124, stdout=output, stderr=f"Timed out after {self._step_timeout_s:.0f}s"
+            )
+
+
+def _navigate_url(step: PlanStep) -> str | None:
+    """Return the URL of a compiled navigate step (``act browser goto '<url>'``)."""
+    argv = shlex.split(step.cli)
+    return argv[-1] if len(argv) >= 4 and argv[2] == "goto" else None
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import io
+import logging
 from typing import TYPE_CHECKING
 
 from PIL import Image, ImageDraw, ImageFont
@@ -26,6 +27,8 @@ if TYPE_CHECKING:
 
     from nova_act.cli.browser.services.intent_resolution.snapshot import SnapshotElement
 
+logger = logging.getLogger(__name__)
+
 # Color-code by role
 ROLE_COLORS: dict[str, str] = {
     "button": "#3B82F6",  # blue
@@ -122,12 +125,66 @@ def annotate_screenshot(
     return buf.getvalue()
 
 
+def _collect_page_boxes(page: Page) -> dict[tuple[str, str], FloatRect]:
+    """Map (role, accessible name) to the viewport box of the first matching element.
+
+    Uses two CDP calls for the whole page -- the full accessibility tree (roles,
+    names and DOM node ids) and a DOM snapshot with layout -- instead of one
+    Playwright round trip per element. Only the main frame is covered, as with
+    ``page.get_by_role``.
+    """
+    cdp = page.context.new_cdp_session(page)
+    try:
+        ax_tree = cdp.send("Accessibility.getFullAXTree")
+        dom_snapshot = cdp.send("DOMSnapshot.captureSnapshot", {"computedStyles": []})
+    finally:
+        cdp.detach()
+
+    document = dom_snapshot["documents"][0]
+    backend_node_ids = document["nodes"]["backendNodeId"]
+    layout = document["layout"]
+    scroll_x = document.get("scrollOffsetX", 0)
+    scroll_y = document.get("scrollOffsetY", 0)
+    bounds_by_node_id = {
+        backend_node_ids[node_index]: bounds for node_index, bounds in zip(layout["nodeIndex"], layout["bounds"])
+    }
+
+    boxes: dict[tuple[str, str], FloatRect] = {}
+    for node in ax_tree["nodes"]:
+        if node.get("ignored"):
+            continue
+        key = (str(node.get("role", {}).get("value", "")), str(node.get("name", {}).get("value", "")))
+        if key in boxes:
+            continue
+        bounds = bounds_by_node_id.get(node.get("backendDOMNodeId"))
+        if bounds:
+            x, y, width, height = bounds
+            boxes[key] = {"x": x - scroll_x, "y": y - scroll_y, "width": width, "height": height}
+    return boxes
+
+
+def _resolve_element_boxes_with_locators(
+    page: Page, elements: list[SnapshotElement]
+) -> list[tuple[SnapshotElement, FloatRect]]:
+    """Resolve boxes one Playwright locator at a time (fallback when CDP is unavailable)."""
+    results: list[tuple[SnapshotElement, FloatRect]] = []
+    for elem in elements:
+        try:
+            locator = page.get_by_role(elem.role, name=elem.name).first  # type: ignore[arg-type]
+            bbox = locator.bounding_box()
+            if bbox:
+                results.append((elem, bbox))
+        except PlaywrightError:
+            continue
+    return results
+
+
 def resolve_element_boxes(
     page: Page,
     elements: list[SnapshotElement],
     role_filter: frozenset[str] | None = None,
 ) -> list[tuple[SnapshotElement, FloatRect]]:
-    """Resolve bounding boxes for snapshot elements via Playwright locators.
+    """Resolve bounding boxes for snapshot elements in a single batch.
 
     Args:
         page: Playwright Page object.
@@ -139,22 +196,17 @@ def resolve_element_boxes(
         List of (element, bbox_dict) for elements with valid bounding boxes.
     """
     allowed_roles = role_filter if role_filter is not None else INTERACTIVE_ROLES
-    results: list[tuple[SnapshotElement, FloatRect]] = []
+    candidates = [elem for elem in elements if elem.role in allowed_roles and elem.name]
+    if not candidates:
+        return []
 
-    for elem in elements:
-        if not elem.role or elem.role not in allowed_roles:
-            continue
-        if not elem.name:
-            continue
-        try:
-            locator = page.get_by_role(elem.role, name=elem.name).first  # type: ignore[arg-type]
-            bbox = locator.bounding_box()
-            if bbox:
-                results.append((elem, bbox))
-        except PlaywrightError:
-            continue
+    try:
+        boxes = _collect_page_boxes(page)
+    except (PlaywrightError, KeyError, IndexError, TypeError, ValueError):
+        logger.debug("Batched box resolution failed, falling back to per-element locators", exc_info=True)
+        return _resolve_element_boxes_with_locators(page, candidates)
 
-    return results
+    return [(elem, boxes[(elem.role, elem.name)]) for elem in candidates if (elem.role, elem.name) in boxes]
 
 
 def annotate_page_screenshot(
@@ -13,27 +13,52 @@
 # limitations under the License.
 """Session management services."""
 
-from nova_act.cli.browser.services.session.cdp_endpoint_manager import (
-    CdpEndpointManager,
-)
-from nova_act.cli.browser.services.session.chrome_launcher import ChromeLauncher
-from nova_act.cli.browser.services.session.chrome_terminator import ChromeTerminator
-from nova_act.cli.browser.services.session.closer import SessionCloser
-from nova_act.cli.browser.services.session.connector import NovaActConnector
-from nova_act.cli.browser.services.session.locking import SessionLockManager
-from nova_act.cli.browser.services.session.manager import (
-    ACTIVE_SESSION_STATES,
-    SessionManager,
-    filter_active_sessions,
-)
-from nova_act.cli.browser.services.session.models import (
-    BrowserOptions,
-    BrowserSource,
-    SessionInfo,
-    SessionState,
-)
-from nova_act.cli.browser.services.session.persistence import SessionPersistence
-from nova_act.cli.core.exceptions import SessionLockTimeout, SessionNotFoundError
+from typing import TYPE_CHECKING
+
+from nova_act.util import lazy_exports
+
+if TYPE_CHECKING:
+    from nova_act.cli.browser.services.session.cdp_endpoint_manager import (
+        CdpEndpointManager,
+    )
+    from nova_act.cli.browser.services.session.chrome_launcher import ChromeLauncher
+    from nova_act.cli.browser.services.session.chrome_terminator import ChromeTerminator
+    from nova_act.cli.browser.services.session.closer import SessionCloser
+    from nova_act.cli.browser.services.session.connector import NovaActConnector
+    from nova_act.cli.browser.services.session.locking import SessionLockManager
+    from nova_act.cli.browser.services.session.manager import (
+        ACTIVE_SESSION_STATES,
+        SessionManager,
+        filter_active_sessions,
+    )
+    from nova_act.cli.browser.services.session.models import (
+        BrowserOptions,
+        BrowserSource,
+        SessionInfo,
+        SessionState,
+    )
+    from nova_act.cli.browser.services.session.persistence import SessionPersistence
+    from nova_act.cli.core.exceptions import SessionLockTimeout, SessionNotFoundError
+
+# Resolved on first access so importing one submodule does not import them all
+_LAZY_EXPORTS: dict[str, str] = {
+    "CdpEndpointManager": "nova_act.cli.browser.services.session.cdp_endpoint_manager",
+    "ChromeLauncher": "nova_act.cli.browser.services.session.chrome_launcher",
+    "ChromeTerminator": "nova_act.cli.browser.services.session.chrome_terminator",
+    "SessionCloser": "nova_act.cli.browser.services.session.closer",
+    "NovaActConnector": "nova_act.cli.browser.services.session.connector",
+    "SessionLockManager": "nova_act.cli.browser.services.session.locking",
+    "ACTIVE_SESSION_STATES": "nova_act.cli.browser.services.session.manager",
+    "SessionManager": "nova_act.cli.browser.services.session.manager",
+    "filter_active_sessions": "nova_act.cli.browser.services.session.manager",
+    "BrowserOptions": "nova_act.cli.browser.services.session.models",
+    "BrowserSource": "nova_act.cli.browser.services.session.models",
+    "SessionInfo": "nova_act.cli.browser.services.session.models",
+    "SessionState": "nova_act.cli.browser.services.session.models",
+    "SessionPersistence": "nova_act.cli.browser.services.session.persistence",
+    "SessionLockTimeout": "nova_act.cli.core.exceptions",
+    "SessionNotFoundError": "nova_act.cli.core.exceptions",
+}
 
 __all__ = [
     "ACTIVE_SESSION_STATES",
@@ -53,3 +78,5 @@ __all__ = [
     "SessionState",
     "filter_active_sessions",
 ]
+
+lazy_exports.install(globals(), _LAZY_EXPORTS)
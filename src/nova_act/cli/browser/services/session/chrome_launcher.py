@@ -77,18 +77,37 @@ class ChromeLauncher:
     - Resolving and validating user-provided browser profiles
     """
 
-    def __init__(self, session_dir: str, get_used_ports_callback: Callable[[], set[int]]) -> None:
+    def __init__(
+        self,
+        session_dir: str,
+        get_used_ports_callback: Callable[[], set[int]],
+        lease_port_callback: Callable[[int, int, Callable[[int], bool]], int] | None = None,
+    ) -> None:
         """Initialize Chrome launcher.
 
         Args:
             session_dir: Directory for session storage
             get_used_ports_callback: Callback to get ports currently in use
+            lease_port_callback: Optional callback that atomically picks and reserves a port
+                given (start_port, end_port, is_port_free). Used instead of
+                get_used_ports_callback when provided.
         """
         self.session_dir = session_dir
         self._get_used_ports = get_used_ports_callback
+        self._lease_port = lease_port_callback
         self.cdp_manager = CdpEndpointManager()
         self._terminator = ChromeTerminator()
 
+    @staticmethod
+    def _is_port_free(port: int) -> bool:
+        """Check that a port can currently be bound on localhost."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            try:
+                s.bind(("localhost", port))
+                return True
+            except OSError:
+                return False
+
     def find_available_port(self, start_port: int | None = None, end_port: int | None = None) -> int:
         """Find available port in range for CDP.
 
@@ -97,9 +116,10 @@ class ChromeLauncher:
         Chrome's --remote-debugging-port=0 would auto-select, but doesn't reliably
         report the chosen port back to the parent process.
 
-        Note: This is a best-effort check with an inherent TOCTOU race condition --
-        the port could be claimed by another process between our check and Chrome's
-        bind. The caller handles this via try/except around Chrome launch.
+        With a lease callback, the port is reserved in the session index so concurrent
+        CLI processes never pick the same one. A process outside the CLI can still
+        claim the port before Chrome binds it; the caller handles this via try/except
+        around Chrome launch.
 
         Args:
             start_port: Start of port range (default: CDP_PORT_RANGE_START)
@@ -114,18 +134,14 @@ class ChromeLauncher:
         start_port = start_port or DefaultBrowserConfig.CDP_PORT_RANGE_START
         end_port = end_port or DefaultBrowserConfig.CDP_PORT_RANGE_END
 
+        if self._lease_port is not None:
+            return self._lease_port(start_port, end_port, self._is_port_free)
+
         used_ports = self._get_used_ports()
 
         for port in range(start_port, end_port + 1):
-            if port in used_ports:
-                continue
-
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                try:
-                    s.bind(("localhost", port))
-                    return port
-                except OSError:
-                    continue
+            if port not in used_ports and self._is_port_free(port):
+                return port
         raise RuntimeError(f"No available ports in range {start_port}-{end_port}")
 
     def detect_chrome_path(self) -> str:
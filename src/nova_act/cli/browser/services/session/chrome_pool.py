@@ -0,0 +1,235 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Warm pool of idle, pre-launched headless Chrome processes.
+
+Setting NOVA_ACT_BROWSER_POOL_SIZE=N keeps up to N headless Chrome processes
+running with CDP enabled, each on its own leased port and throwaway user data
+directory. `session create` with default browser options leases one instead of
+launching Chrome, and a detached filler process launches its replacement.
+
+Each pooled Chrome serves exactly one session and is terminated when that
+session closes: handing it to another session would leak cookies and storage.
+Members are health-checked when leased and recycled once idle for
+CHROME_POOL_IDLE_TTL_SECONDS. Unsetting the variable drains the pool on the
+next session create or prune.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from filelock import FileLock
+from filelock import Timeout as FileLockTimeout
+
+from nova_act.cli.browser.services.browser_config import DefaultBrowserConfig
+from nova_act.cli.browser.services.session.cdp_endpoint_manager import (
+    CdpEndpointManager,
+)
+from nova_act.cli.browser.services.session.chrome_launcher import ChromeLauncher
+from nova_act.cli.browser.services.session.chrome_terminator import ChromeTerminator
+from nova_act.cli.browser.services.session.models import PooledChrome
+from nova_act.cli.browser.services.session.persistence import SessionPersistence
+from nova_act.cli.core.process import is_process_running
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE_ENV_VAR = "NOVA_ACT_BROWSER_POOL_SIZE"
+
+
+def get_pool_size() -> int:
+    """Return the configured warm pool size (0 when the pool is disabled)."""
+    raw = os.environ.get(POOL_SIZE_ENV_VAR, "").strip()
+    if not raw:
+        return 0
+    try:
+        size = int(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r; expected an integer", POOL_SIZE_ENV_VAR, raw)
+        return 0
+    return max(0, min(size, DefaultBrowserConfig.CHROME_POOL_MAX_SIZE))
+
+
+class ChromePool:
+    """Launches, tracks, health-checks and leases warm pool members.
+
+    Pool membership lives in the session index, so every CLI process sees the same
+    pool and a member is leased by at most one of them.
+    """
+
+    def __init__(
+        self,
+        persistence: SessionPersistence,
+        launcher: ChromeLauncher,
+        terminator: ChromeTerminator,
+        pool_dir: Path,
+        idle_ttl_seconds: float = DefaultBrowserConfig.CHROME_POOL_IDLE_TTL_SECONDS,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            persistence: Session index holding pool membership
+            launcher: Launcher used to start new members
+            terminator: Terminator used to stop discarded members
+            pool_dir: Directory holding member user data directories and the filler log
+            idle_ttl_seconds: Age after which an idle member is recycled
+        """
+        self._persistence = persistence
+        self._launcher = launcher
+        self._terminator = terminator
+        self.pool_dir = pool_dir
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._cdp_manager = CdpEndpointManager()
+
+    def _is_expired(self, member: PooledChrome) -> bool:
+        return time.time() - member.launched_at > self.idle_ttl_seconds
+
+    def _is_healthy(self, member: PooledChrome) -> bool:
+        """Check that the member's process is alive and its CDP endpoint answers."""
+        if not is_process_running(member.browser_pid):
+            return False
+        try:
+            self._cdp_manager.validate_cdp_endpoint(member.cdp_endpoint)
+        except RuntimeError:
+            return False
+        return True
+
+    def _discard(self, member: PooledChrome) -> None:
+        """Terminate a member and delete its user data directory."""
+        self._terminator.terminate(member.browser_pid)
+        shutil.rmtree(member.user_data_dir, ignore_errors=True)
+        self._persistence.delete_pool_member(member.member_id)
+
+    def acquire(self) -> PooledChrome | None:
+        """Lease a healthy, unexpired member, discarding any bad ones found on the way.
+
+        Returns:
+            The leased member (now owned by the caller), or None if the pool has none
+        """
+        while (member := self._persistence.claim_pool_member()) is not None:
+            if not self._is_expired(member) and self._is_healthy(member):
+                return member
+            logger.info("Discarding unusable pooled Chrome (pid %d)", member.browser_pid)
+            self._discard(member)
+        return None
+
+    def _fill_lock(self) -> FileLock:
+        return FileLock(str(self.pool_dir / "fill.lock"))
+
+    def is_filling(self) -> bool:
+        """Check whether a filler process currently holds the fill lock."""
+        if not self.pool_dir.exists():
+            return False
+        try:
+            with self._fill_lock().acquire(timeout=0):
+                return False
+        except FileLockTimeout:
+            return True
+
+    def prune(self, size: int) -> None:
+        """Discard dead and expired members, and any beyond the configured size.
+
+        Only checks process liveness, so it is cheap enough to run on every session create.
+
+        Args:
+            size: Number of members to keep at most
+        """
+        members = self._persistence.list_pool_members()
+        alive = []
+        for member in members:
+            if self._is_expired(member) or not is_process_running(member.browser_pid):
+                self._discard(member)
+            else:
+                alive.append(member)
+        # Keep the newest members; they have the most idle time left
+        for member in alive[: max(0, len(alive) - size)]:
+            self._discard(member)
+
+    def fill(self, size: int) -> None:
+        """Launch members until the pool holds `size` of them.
+
+        Only one filler runs at a time; concurrent calls return immediately.
+
+        Args:
+            size: Target number of members
+        """
+        self.pool_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        try:
+            with self._fill_lock().acquire(timeout=0):
+                self.prune(size)
+                for _ in range(size - len(self._persistence.list_pool_members())):
+                    if not self._launch_member():
+                        break
+        except FileLockTimeout:
+            logger.debug("Another process is already filling the Chrome pool")
+
+    def _launch_member(self) -> bool:
+        member_id = uuid.uuid4().hex[:12]
+        user_data_dir = self.pool_dir / member_id
+        user_data_dir.mkdir(mode=0o700)
+        try:
+            launch = self._launcher.launch_chrome_with_user_data_dir(user_data_dir=user_data_dir, headless=True)
+        except RuntimeError as e:
+            logger.warning("Failed to launch pooled Chrome: %s", e)
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            return False
+        self._persistence.add_pool_member(
+            PooledChrome(
+                member_id=member_id,
+                browser_pid=launch.process.pid,
+                cdp_port=launch.port,
+                cdp_endpoint=launch.ws_url,
+                user_data_dir=str(user_data_dir),
+                launched_at=time.time(),
+            )
+        )
+        logger.info("Added pooled Chrome (pid %d, port %d)", launch.process.pid, launch.port)
+        return True
+
+    def fill_in_background(self, session_dir: str) -> None:
+        """Start a detached process that fills the pool, so the caller does not wait for Chrome.
+
+        Args:
+            session_dir: Session directory of the caller's session index
+        """
+        self.pool_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        try:
+            with open(self.pool_dir / "pool.log", "ab") as log_file:
+                subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-c",
+                        f"import sys; from {__name__} import _main; _main(sys.argv[1:])",
+                        session_dir,
+                    ],
+                    stdin=subprocess.DEVNULL,
+                    stdout=log_file,
+                    stderr=log_file,
+                    start_new_session=True,
+                    close_fds=True,
+                )
+        except OSError:
+            logger.debug("Failed to start Chrome pool filler", exc_info=True)
+
+
+def _main(argv: list[str]) -> None:
+    """Entry point of the pool filler process."""
+    from nova_act.cli.browser.services.session.manager import SessionManager  # noqa: PLC0415
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    SessionManager(session_dir=argv[0]).fill_chrome_pool()
@@ -94,15 +94,13 @@ class SessionCloser:
         self._lock_manager.remove_lock(session_id)
 
     def _cleanup_session_files(self, session_id: str, sessions: dict[str, SessionInfo]) -> None:
-        """Remove session metadata file and in-memory reference.
+        """Remove session metadata and in-memory reference.
 
         Args:
             session_id: ID of session to clean up
             sessions: In-memory session dictionary
         """
-        file_path = self._persistence.get_session_file_path(session_id)
-        if file_path.exists():
-            file_path.unlink()
+        self._persistence.delete_session_metadata(session_id)
 
         if session_id in sessions:
             del sessions[session_id]
@@ -19,7 +19,6 @@ import contextlib
 import logging
 from typing import TYPE_CHECKING
 
-from nova_act import NovaAct
 from nova_act.cli.browser.services.session.chrome_terminator import ChromeTerminator
 from nova_act.cli.browser.services.session.models import (
     SessionInfo,
@@ -30,16 +29,18 @@ from nova_act.cli.browser.utils.auth import AuthConfig, AuthMode
 from nova_act.cli.browser.utils.log_capture import get_log_dir, suppress_sdk_output
 from nova_act.cli.core.output import is_verbose_mode
 from nova_act.cli.core.process import is_process_running
-from nova_act.types.workflow import BotoSessionKwargs
 
 if TYPE_CHECKING:
-    from nova_act.types.workflow import Workflow
+    from nova_act import NovaAct
+    from nova_act.types.workflow import BotoSessionKwargs, Workflow
 
 logger = logging.getLogger(__name__)
 
 
 def _build_boto_kwargs(auth_config: AuthConfig) -> BotoSessionKwargs:
     """Build boto3.Session kwargs from AuthConfig."""
+    from nova_act.types.workflow import BotoSessionKwargs  # noqa: PLC0415
+
     kwargs = BotoSessionKwargs()
     if auth_config.profile:
         kwargs["profile_name"] = auth_config.profile
@@ -261,6 +262,9 @@ class NovaActConnector:
         This is the single point where all NovaAct instances are created, so suppression here
         covers all commands (create, close, close-all, and any prepare_session-based command).
         """
+        # Imported here: loading the SDK dominates CLI startup, and most commands reuse a live instance
+        from nova_act import NovaAct  # noqa: PLC0415
+
         if is_verbose_mode():
             nova_act = NovaAct(**constructor_args)  # type: ignore[arg-type]
             nova_act.start()
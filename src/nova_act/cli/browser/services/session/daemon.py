@@ -0,0 +1,430 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Opt-in per-session daemon that keeps Playwright attached across CLI commands.
+
+Each CLI invocation normally starts Python, imports the SDK, starts Playwright and
+reconnects to Chrome over CDP before doing any work. With ``NOVA_ACT_BROWSER_DAEMON=1``
+browsing and extraction commands are instead forwarded to a long-lived process per
+session, which runs them against the NovaAct instance it already holds.
+
+Protocol (JSON Lines over a Unix socket at ``<session_dir>/<session_id>.sock``):
+
+    client -> daemon: {"argv": [...], "cwd": ..., "env": {...}, "tty": {"stdout": ..., "stderr": ...}}
+    daemon -> client: {"stdout": "..."} / {"stderr": "..."} ... then {"exit_code": N}
+
+The daemon answers ``{"unavailable": true}`` (and exits) when its session is gone or was
+changed by a process other than itself; the client then runs the command the usual way.
+Commands are served one at a time, in the daemon's main thread, as required by
+Playwright's sync API. The daemon exits after DEFAULT_IDLE_TIMEOUT_S without requests.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import IO, BinaryIO
+
+from nova_act.cli.browser.services.session.persistence import SessionPersistence
+from nova_act.cli.core.config import get_session_dir
+from nova_act.cli.core.process import is_process_running
+
+logger = logging.getLogger(__name__)
+
+DAEMON_ENV_VAR = "NOVA_ACT_BROWSER_DAEMON"
+DEFAULT_IDLE_TIMEOUT_S = 30 * 60
+DAEMON_START_TIMEOUT_S = 10.0
+DAEMON_STOP_TIMEOUT_S = 2.0
+# After a daemon fails to listen, commands run the usual way instead of respawning it for this long
+DAEMON_FAILURE_RETRY_S = 10 * 60
+SOCKET_PERMISSIONS = 0o600
+# sun_path is 104 bytes on macOS and 108 on Linux, including the terminating NUL
+MAX_SOCKET_PATH_BYTES = 103
+
+# Set in the daemon process so commands it runs are never routed back to a daemon
+_serving_session_id: str | None = None
+
+
+def is_daemon_enabled() -> bool:
+    """Check whether commands should be routed to a session daemon."""
+    if _serving_session_id is not None or not hasattr(socket, "AF_UNIX") or sys.platform == "win32":
+        return False
+    return os.environ.get(DAEMON_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+def get_daemon_socket_path(session_id: str) -> Path:
+    """Get path to the daemon's Unix socket for a session."""
+    return get_session_dir() / f"{session_id}.sock"
+
+
+def _get_daemon_pid_path(session_id: str) -> Path:
+    # Not named *.lock: SessionLockManager.cleanup_stale_locks deletes those
+    return get_session_dir() / f"{session_id}.daemon"
+
+
+def _get_daemon_failure_path(session_id: str) -> Path:
+    return get_session_dir() / f"{session_id}.daemon.failed"
+
+
+def _send_message(wfile: BinaryIO, message: Mapping[str, object]) -> None:
+    wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+    wfile.flush()
+
+
+class _FramedWriter(io.TextIOBase):
+    """Text stream that forwards writes to the client as framed messages.
+
+    Write failures (e.g. the client was interrupted) are swallowed so the
+    command still runs to completion and leaves the session consistent.
+    """
+
+    def __init__(self, wfile: BinaryIO, stream_name: str, isatty: bool):
+        self._wfile = wfile
+        self._stream_name = stream_name
+        self._isatty = isatty
+        self._closed = False
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return "utf-8"
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if not isinstance(s, str):
+            # Click probes streams with write(b"") to detect binary writers
+            raise TypeError(f"write() argument must be str, not {type(s).__name__}")
+        if s and not self._closed:
+            try:
+                _send_message(self._wfile, {self._stream_name: s})
+            except OSError:
+                self._closed = True
+        return len(s)
+
+
+class SessionDaemon:
+    """Serve CLI commands for one browser session over a Unix socket."""
+
+    def __init__(self, session_id: str, idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S):
+        """Initialize the daemon.
+
+        Args:
+            session_id: Session whose commands this daemon serves
+            idle_timeout_s: Seconds without requests before the daemon exits
+        """
+        self._session_id = session_id
+        self._idle_timeout_s = idle_timeout_s
+        self._socket_path = get_daemon_socket_path(session_id)
+        self._session_revision: int | None = None
+        self._persistence: SessionPersistence | None = None
+
+    def serve(self) -> None:
+        """Serve requests until idle, stopped, or the session goes away."""
+        import fcntl  # noqa: PLC0415 -- POSIX only; the daemon is never enabled on Windows
+
+        global _serving_session_id
+
+        from nova_act.cli.browser.services.session.manager import SessionManager  # noqa: PLC0415
+        from nova_act.cli.browser.utils.session import set_shared_session_manager  # noqa: PLC0415
+
+        pid_path = _get_daemon_pid_path(self._session_id)
+        pid_file = open(pid_path, "a+")
+        try:
+            fcntl.flock(pid_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.info("Daemon for session '%s' is already running", self._session_id)
+            pid_file.close()
+            return
+
+        pid_file.truncate(0)
+        pid_file.write(str(os.getpid()))
+        pid_file.flush()
+
+        # Holding the pid file lock means any existing socket file is stale
+        self._socket_path.unlink(missing_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        def _terminate(signum: int, frame: object) -> None:
+            # Exit immediately, even mid-command: SystemExit would be caught as the command's exit code
+            self._socket_path.unlink(missing_ok=True)
+            pid_path.unlink(missing_ok=True)
+            os._exit(0)
+
+        signal.signal(signal.SIGTERM, _terminate)
+        _serving_session_id = self._session_id
+        self._persistence = SessionPersistence(str(get_session_dir()))
+        set_shared_session_manager(SessionManager())
+        try:
+            try:
+                server.bind(str(self._socket_path))
+                os.chmod(self._socket_path, SOCKET_PERMISSIONS)
+                server.listen()
+            except OSError:
+                # Tell clients to stop spawning daemons for this session; the non-zero exit ends their wait
+                _get_daemon_failure_path(self._session_id).touch()
+                raise
+            _get_daemon_failure_path(self._session_id).unlink(missing_ok=True)
+            server.settimeout(self._idle_timeout_s)
+            logger.info("Daemon for session '%s' listening on %s", self._session_id, self._socket_path)
+
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    logger.info("Daemon for session '%s' idle, exiting", self._session_id)
+                    break
+                with conn:
+                    conn.settimeout(None)
+                    if not self._handle_connection(conn):
+                        break
+        finally:
+            server.close()
+            self._socket_path.unlink(missing_ok=True)
+            set_shared_session_manager(None)
+            _serving_session_id = None
+            pid_path.unlink(missing_ok=True)
+            pid_file.close()
+
+    def _session_is_usable(self, persistence: SessionPersistence) -> bool:
+        """Check that the session still exists and was not changed behind the daemon's back."""
+        if self._session_revision is None:
+            # First request: the command itself reconnects to (or creates) the session
+            return True
+        if persistence.get_session_revision(self._session_id) != self._session_revision:
+            return False
+        try:
+            browser_pid = persistence.load_session(self._session_id).browser_pid
+        except (OSError, ValueError, KeyError):
+            return False
+        return browser_pid is None or is_process_running(browser_pid)
+
+    def _handle_connection(self, conn: socket.socket) -> bool:
+        """Handle one request. Returns False when the daemon should exit."""
+        with conn.makefile("rb") as rfile, conn.makefile("wb") as wfile:
+            try:
+                request = json.loads(rfile.readline())
+            except (OSError, ValueError):
+                logger.debug("Ignoring malformed daemon request", exc_info=True)
+                return True
+            if not isinstance(request, dict):
+                return True
+
+            try:
+                if request.get("stop"):
+                    _send_message(wfile, {"exit_code": 0})
+                    return False
+                persistence = self._persistence
+                assert persistence is not None, "Requests are only handled while serving"
+                if not self._session_is_usable(persistence):
+                    _send_message(wfile, {"unavailable": True})
+                    return False
+
+                exit_code = self._run_command(request, wfile)
+                self._session_revision = persistence.get_session_revision(self._session_id)
+                _send_message(wfile, {"exit_code": exit_code})
+            except OSError:
+                logger.debug("Client disconnected before the response was sent", exc_info=True)
+        return self._session_revision is not None
+
+    def _run_command(self, request: dict[str, object], wfile: BinaryIO) -> int:
+        """Run a CLI command with the client's working directory, environment and streams."""
+        from nova_act.cli.cli import main  # noqa: PLC0415
+
+        raw_argv, env, tty = request.get("argv"), request.get("env"), request.get("tty")
+        argv = [str(arg) for arg in raw_argv] if isinstance(raw_argv, list) else []
+        env = env if isinstance(env, dict) else {}
+        tty = tty if isinstance(tty, dict) else {}
+        old_cwd = os.getcwd()
+        old_env = dict(os.environ)
+        old_stdout, old_stderr = sys.stdout, sys.stderr
+        try:
+            os.chdir(str(request.get("cwd") or old_cwd))
+            os.environ.clear()
+            os.environ.update({str(k): str(v) for k, v in env.items()})
+            sys.stdout = _FramedWriter(wfile, "stdout", bool(tty.get("stdout")))
+            sys.stderr = _FramedWriter(wfile, "stderr", bool(tty.get("stderr")))
+
+            def _invoke() -> int:
+                try:
+                    main.main(args=argv, prog_name="act")
+                except SystemExit as e:
+                    if e.code is None or isinstance(e.code, int):
+                        return e.code or 0
+                    print(e.code, file=sys.stderr)
+                    return 1
+                return 0
+
+            # Fresh context so per-command ContextVars (JSON mode, log paths) start from their defaults
+            return contextvars.Context().run(_invoke)
+        finally:
+            sys.stdout, sys.stderr = old_stdout, old_stderr
+            os.environ.clear()
+            os.environ.update(old_env)
+            os.chdir(old_cwd)
+
+
+def _connect(socket_path: Path, timeout: float | None = None) -> socket.socket | None:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _spawn_daemon(session_id: str) -> subprocess.Popen[bytes]:
+    log_path = get_session_dir() / f"{session_id}.daemon.log"
+    with open(log_path, "ab") as log_file:
+        return subprocess.Popen(
+            # Not "-m": the daemon must share this module's state with the CLI code it runs
+            [sys.executable, "-c", f"import sys; from {__name__} import _main; _main(sys.argv[1:])", session_id],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            start_new_session=True,
+            close_fds=True,
+        )
+
+
+def _daemon_recently_failed(session_id: str) -> bool:
+    try:
+        return time.time() - _get_daemon_failure_path(session_id).stat().st_mtime < DAEMON_FAILURE_RETRY_S
+    except OSError:
+        return False
+
+
+def _connect_or_spawn(session_id: str) -> socket.socket | None:
+    socket_path = get_daemon_socket_path(session_id)
+    sock = _connect(socket_path)
+    if sock is not None:
+        return sock
+
+    if len(os.fsencode(socket_path)) > MAX_SOCKET_PATH_BYTES:
+        logger.debug("Daemon socket path %s is too long for a Unix socket", socket_path)
+        return None
+    if _daemon_recently_failed(session_id):
+        return None
+    if not SessionPersistence(str(get_session_dir())).session_exists(session_id):
+        # Let the cold path create the session; later commands start the daemon
+        return None
+    try:
+        process = _spawn_daemon(session_id)
+    except OSError:
+        logger.debug("Failed to start daemon for session '%s'", session_id, exc_info=True)
+        return None
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT_S
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        sock = _connect(socket_path)
+        if sock is not None:
+            return sock
+        if process.poll():
+            # Failed to start; a zero exit means another daemon for the session is starting
+            logger.debug("Daemon for session '%s' exited with status %d", session_id, process.returncode)
+            return None
+    logger.debug("Daemon for session '%s' did not start within %.0fs", session_id, DAEMON_START_TIMEOUT_S)
+    return None
+
+
+def run_in_session_daemon(session_id: str, argv: list[str]) -> int | None:
+    """Run a CLI command in the session's daemon, starting the daemon if needed.
+
+    Args:
+        session_id: Session the command targets
+        argv: Full CLI arguments, as passed to the root ``act`` command
+
+    Returns:
+        The command's exit code, or None if the daemon is unavailable and the
+        command should run in this process instead.
+    """
+    sock = _connect_or_spawn(session_id)
+    if sock is None:
+        return None
+
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        "tty": {"stdout": sys.stdout.isatty(), "stderr": sys.stderr.isatty()},
+    }
+    streams: dict[str, IO[str]] = {"stdout": sys.stdout, "stderr": sys.stderr}
+    with sock, sock.makefile("rb") as rfile, sock.makefile("wb") as wfile:
+        try:
+            _send_message(wfile, request)
+            for line in rfile:
+                message = json.loads(line)
+                if "exit_code" in message:
+                    return int(message["exit_code"])
+                if message.get("unavailable"):
+                    return None
+                for stream_name, data in message.items():
+                    stream = streams.get(stream_name)
+                    if stream is not None:
+                        stream.write(data)
+                        stream.flush()
+        except (OSError, ValueError):
+            logger.debug("Lost connection to daemon for session '%s'", session_id, exc_info=True)
+            return None
+    # Daemon exited mid-command; the command may have partially run, so don't retry it
+    logger.warning("Daemon for session '%s' exited before the command finished", session_id)
+    return 1
+
+
+def stop_session_daemon(session_id: str) -> None:
+    """Stop the session's daemon if one is running. Never raises."""
+    if _serving_session_id == session_id:
+        # Called from a command running inside the daemon; it exits once the command returns
+        return
+    _get_daemon_failure_path(session_id).unlink(missing_ok=True)
+    socket_path = get_daemon_socket_path(session_id)
+    if not socket_path.exists():
+        return
+
+    sock = _connect(socket_path, timeout=DAEMON_STOP_TIMEOUT_S)
+    if sock is not None:
+        try:
+            with sock, sock.makefile("rb") as rfile, sock.makefile("wb") as wfile:
+                _send_message(wfile, {"stop": True})
+                rfile.readline()
+            return
+        except OSError:
+            logger.debug("Daemon for session '%s' did not acknowledge stop", session_id, exc_info=True)
+
+    # Busy or wedged: fall back to a signal
+    try:
+        pid = int(_get_daemon_pid_path(session_id).read_text().strip())
+        os.kill(pid, signal.SIGTERM)
+    except (OSError, ValueError):
+        logger.debug("Could not signal daemon for session '%s'", session_id, exc_info=True)
+
+
+def _main(argv: list[str]) -> None:
+    """Entry point of the daemon process."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    SessionDaemon(argv[0]).serve()
@@ -17,6 +17,7 @@ Thin wrapper around core/locking.py's FileLockManager for session-specific locki
 """
 
 import logging
+from collections.abc import Callable
 from pathlib import Path
 
 from filelock import Timeout as FileLockTimeout
@@ -41,16 +42,16 @@ class SessionLockManager(FileLockManager):
         """
         super().__init__(session_dir, default_timeout=DefaultBrowserConfig.SESSION_LOCK_TIMEOUT_SECONDS)
 
-    def cleanup_stale_locks(self, known_session_ids: set[str]) -> None:
+    def cleanup_stale_locks(self, known_session_ids: set[str], is_persisted: Callable[[str], bool]) -> None:
         """Remove lock files for sessions that no longer exist on disk or in memory.
 
         Args:
             known_session_ids: Set of session IDs currently tracked in memory.
+            is_persisted: Checks whether a session still has persisted metadata.
         """
         for lock_file in self.lock_dir.glob("*.lock"):
             session_id = lock_file.stem
-            session_file = self.lock_dir / f"{session_id}.json"
-            if not session_file.exists() and session_id not in known_session_ids:
+            if session_id not in known_session_ids and not is_persisted(session_id):
                 lock_file.unlink(missing_ok=True)
 
     def try_acquire(self, session_id: str, timeout: float = 2.0) -> bool:
@@ -23,6 +23,8 @@ import os
 import platform
 import re
 import subprocess
+import time
+from collections.abc import Callable
 from contextlib import AbstractContextManager
 from datetime import datetime
 from pathlib import Path
@@ -30,9 +32,11 @@ from typing import TYPE_CHECKING
 
 from nova_act.cli.browser.services.browser_config import DefaultBrowserConfig
 from nova_act.cli.browser.services.session.chrome_launcher import ChromeLauncher
+from nova_act.cli.browser.services.session.chrome_pool import ChromePool, get_pool_size
 from nova_act.cli.browser.services.session.chrome_terminator import ChromeTerminator
 from nova_act.cli.browser.services.session.closer import SessionCloser
 from nova_act.cli.browser.services.session.connector import NovaActConnector
+from nova_act.cli.browser.services.session.daemon import stop_session_daemon
 from nova_act.cli.browser.services.session.locking import SessionLockManager
 from nova_act.cli.browser.services.session.models import (
     BrowserOptions,
@@ -40,6 +44,7 @@ from nova_act.cli.browser.services.session.models import (
     SessionState,
 )
 from nova_act.cli.browser.services.session.persistence import SessionPersistence
+from nova_act.cli.browser.services.session.profile_template import ProfileTemplateCache
 from nova_act.cli.browser.services.session.pruner import PruneResult, SessionPruner
 from nova_act.cli.core.config import get_browser_cli_dir, get_session_dir
 from nova_act.cli.core.exceptions import (
@@ -54,6 +59,9 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from nova_act.cli.browser.utils.auth import AuthConfig
 
+# Chrome's default user data directory on macOS
+_SYSTEM_CHROME_DATA_DIR = "~/Library/Application Support/Google/Chrome"
+
 # Active session states for filtering
 ACTIVE_SESSION_STATES = frozenset({SessionState.STARTING, SessionState.STARTED})
 
@@ -85,9 +93,19 @@ class SessionManager:
         self._session_dir = session_dir or str(get_session_dir())
         self._sessions: dict[str, SessionInfo] = {}
         self._lock_manager = SessionLockManager(Path(self._session_dir))
-        self._chrome_launcher = ChromeLauncher(self._session_dir, self._get_used_ports)
+        self._chrome_launcher = ChromeLauncher(self._session_dir, self._get_used_ports, self._lease_port)
         self._chrome_terminator = ChromeTerminator()
         self._persistence = SessionPersistence(self._session_dir)
+        self._chrome_pool = ChromePool(
+            self._persistence,
+            self._chrome_launcher,
+            self._chrome_terminator,
+            get_browser_cli_dir() / "chrome_pool",
+        )
+        self._profile_template = ProfileTemplateCache(
+            get_browser_cli_dir() / "chrome_profile_template",
+            Path(_SYSTEM_CHROME_DATA_DIR).expanduser(),
+        )
         self._nova_act_connector = NovaActConnector(
             self._persistence,
             self._chrome_terminator,
@@ -132,7 +150,7 @@ class SessionManager:
 
     def _cleanup_stale_locks(self) -> None:
         """Remove lock files for sessions that no longer exist."""
-        self._lock_manager.cleanup_stale_locks(set(self._sessions.keys()))
+        self._lock_manager.cleanup_stale_locks(set(self._sessions.keys()), self._persistence.session_exists)
 
     def _get_used_ports(self) -> set[int]:
         """Get ports in use by both in-memory and persisted sessions."""
@@ -140,6 +158,11 @@ class SessionManager:
         disk_ports = self._persistence.read_used_ports(set(self._sessions.keys()))
         return in_memory_ports | disk_ports
 
+    def _lease_port(self, start_port: int, end_port: int, is_port_free: Callable[[int], bool]) -> int:
+        """Atomically lease a CDP port not held by any in-memory or persisted session."""
+        in_memory_ports = {s.cdp_port for s in self._sessions.values() if s.cdp_port is not None}
+        return self._persistence.lease_port(start_port, end_port, is_port_free, exclude_ports=in_memory_ports)
+
     def with_session_lock(self, session_id: str, timeout: float | None = None) -> AbstractContextManager[None]:
         """Context manager for file-based session locking.
 
@@ -274,7 +297,7 @@ class SessionManager:
         """
         if platform.system() != "Darwin":
             return False
-        default_chrome_dir = os.path.expanduser("~/Library/Application Support/Google/Chrome")
+        default_chrome_dir = os.path.expanduser(_SYSTEM_CHROME_DATA_DIR)
         try:
             resolved = str(Path(path).resolve())
             default_resolved = str(Path(default_chrome_dir).resolve())
@@ -282,40 +305,57 @@ class SessionManager:
         except (OSError, ValueError):
             return False
 
-    def _rsync_and_launch_chrome(
+    def _sync_profile_and_launch_chrome(
         self,
         session_info: SessionInfo,
         working_dir: str,
         *,
+        use_template: bool,
         headless: bool,
         executable_path: str | None,
         launch_args: list[str] | None = None,
     ) -> None:
-        """Rsync default Chrome profile to working_dir, remove SingletonLock, and launch Chrome.
+        """Copy default Chrome profile to working_dir, remove SingletonLock, and launch Chrome.
+
+        Managed working directories receive a clone of the cached profile template.
+        A user-chosen working directory is rsynced from the system profile instead,
+        keeping its documented mirror semantics.
 
         Updates session_info with user_data_dir, browser_pid, cdp_endpoint, cdp_port.
 
         Args:
             session_info: Session to update with browser details
-            working_dir: Directory to rsync Chrome data into and launch from
+            working_dir: Directory to copy Chrome data into and launch from
+            use_template: Whether to clone the profile template instead of rsyncing
             headless: Whether to launch in headless mode
             executable_path: Optional custom browser executable
             launch_args: Additional Chrome launch arguments
         """
+        start = time.perf_counter()
         try:
-            from nova_act import rsync_from_default_user_data  # noqa: PLC0415
+            if use_template:
+                method = self._profile_template.clone_into(Path(working_dir))
+            else:
+                from nova_act import rsync_from_default_user_data  # noqa: PLC0415
 
-            rsync_from_default_user_data(working_dir)
+                rsync_from_default_user_data(working_dir)
+                method = "rsync"
         except (ImportError, subprocess.CalledProcessError, OSError) as e:
             self._handle_browser_setup_failure(
                 session_info,
                 e,
-                f"Failed to rsync Chrome profile for session '{session_info.session_id}'",
+                f"Failed to copy Chrome profile for session '{session_info.session_id}'",
             )
+        logger.info(
+            "Prepared Chrome profile for session '%s' in %.2fs (%s)",
+            session_info.session_id,
+            time.perf_counter() - start,
+            method,
+        )
 
         session_info.user_data_dir = working_dir
 
-        # Remove SingletonLock as safety net (rsync excludes Singleton* but belt-and-suspenders)
+        # Remove SingletonLock as safety net (copies exclude Singleton* but belt-and-suspenders)
         (Path(working_dir) / "SingletonLock").unlink(missing_ok=True)
 
         try:
@@ -340,8 +380,8 @@ class SessionManager:
 
         Used when --browser-profile-path points at Chrome's default data directory
         (or a subdirectory like Default/). Chrome blocks CDP on its own default
-        data dir, so we rsync to a managed copy first -- same approach as
-        --use-default-chrome.
+        data dir, so we clone the cached profile template into a managed copy
+        first -- same approach as --use-default-chrome.
 
         Args:
             session_info: Session to configure with browser details
@@ -354,7 +394,7 @@ class SessionManager:
         # at a profile subdir rather than the top-level Chrome data dir.
         assert options.profile_path is not None, "profile_path required for system Chrome sync"
         profile_dir = Path(options.profile_path).expanduser().resolve()
-        default_chrome_dir = Path(os.path.expanduser("~/Library/Application Support/Google/Chrome")).resolve()
+        default_chrome_dir = Path(os.path.expanduser(_SYSTEM_CHROME_DATA_DIR)).resolve()
         profile_directory: str | None = None
         if profile_dir != default_chrome_dir:
             # User pointed at a subdirectory like Default/ or "Profile 1/"
@@ -370,9 +410,10 @@ class SessionManager:
         if profile_directory:
             launch_args.append(f"--profile-directory={profile_directory}")
 
-        self._rsync_and_launch_chrome(
+        self._sync_profile_and_launch_chrome(
             session_info,
             working_dir,
+            use_template=True,
             headless=options.headless,
             executable_path=options.executable_path,
             launch_args=launch_args or None,
@@ -394,7 +435,7 @@ class SessionManager:
             str(Path(options.profile_path).expanduser().resolve())
         ):
             self._launch_with_rsynced_profile(session_info, options)
-        else:
+        elif not (self._is_pool_compatible(options) and self._lease_pooled_browser(session_info)):
             self._launch_new_browser(
                 session_info,
                 options.headless,
@@ -403,6 +444,44 @@ class SessionManager:
                 options.launch_args or None,
             )
 
+    @staticmethod
+    def _is_pool_compatible(options: BrowserOptions) -> bool:
+        """Check whether options match how warm pool members are launched (default headless Chrome)."""
+        return (
+            get_pool_size() > 0
+            and options.headless
+            and not options.headed
+            and not options.executable_path
+            and not options.profile_path
+            and not options.launch_args
+        )
+
+    def _lease_pooled_browser(self, session_info: SessionInfo) -> bool:
+        """Hand a warm pool Chrome to the session and start refilling the pool unless a filler is running.
+
+        Args:
+            session_info: Session to update with browser details
+
+        Returns:
+            True if a pooled Chrome was leased, False if the pool had none
+        """
+        member = self._chrome_pool.acquire()
+        # Spawning a filler costs a Python process start; a running filler already tops the pool up
+        if not self._chrome_pool.is_filling():
+            self._chrome_pool.fill_in_background(self._session_dir)
+        if member is None:
+            return False
+        session_info.browser_pid = member.browser_pid
+        session_info.cdp_endpoint = member.cdp_endpoint
+        session_info.cdp_port = member.cdp_port
+        session_info.user_data_dir = member.user_data_dir
+        logger.info("Leased pooled Chrome (pid %d) for session '%s'", member.browser_pid, session_info.session_id)
+        return True
+
+    def fill_chrome_pool(self) -> None:
+        """Launch warm pool members up to the configured pool size (blocking)."""
+        self._chrome_pool.fill(get_pool_size())
+
     def _setup_default_chrome(self, session_info: SessionInfo, options: BrowserOptions) -> None:
         """Rsync Chrome profile and prepare session for NovaAct's default Chrome flow.
 
@@ -428,9 +507,10 @@ class SessionManager:
             profile_dir.mkdir(parents=True, exist_ok=True)
             working_dir = str(profile_dir)
 
-        self._rsync_and_launch_chrome(
+        self._sync_profile_and_launch_chrome(
             session_info,
             working_dir,
+            use_template=not options.user_data_dir,
             headless=options.headless,
             executable_path=options.executable_path,
             launch_args=options.launch_args or None,
@@ -442,15 +522,14 @@ class SessionManager:
         return sum(1 for s in self._sessions.values() if s.state in (SessionState.STARTING, SessionState.STARTED))
 
     def _cleanup_failed_session(self, session_id: str, session_info: SessionInfo) -> None:
-        """Terminate browser, remove metadata file, remove lock, and delete from memory.
+        """Terminate browser, remove metadata, remove lock, and delete from memory.
 
         Args:
             session_id: ID of the failed session
             session_info: Session info for the failed session
         """
         self._chrome_terminator.terminate(session_info.browser_pid)
-        session_file = self._persistence.get_session_file_path(session_id)
-        session_file.unlink(missing_ok=True)
+        self._persistence.delete_session_metadata(session_id)
         self._lock_manager.remove_lock(session_id)
         self._sessions.pop(session_id, None)
 
@@ -586,7 +665,7 @@ class SessionManager:
         """Check if a session exists without reconnecting or modifying state."""
         if session_id in self._sessions:
             return True
-        return self._persistence.get_session_file_path(session_id).exists()
+        return self._persistence.session_exists(session_id)
 
     def save_session_metadata(self, session_info: SessionInfo) -> None:
         """Persist current session metadata to disk.
@@ -637,6 +716,9 @@ class SessionManager:
             SessionNotFoundError: If session_id does not exist
             RuntimeError: If NovaAct.stop() fails (only when force=False)
         """
+        # A daemon would otherwise keep serving commands against the closed browser
+        stop_session_daemon(session_id)
+
         session_info = self._session_closer.load_session_for_close(session_id, force, self._sessions, self.get_session)
 
         if force:
@@ -660,6 +742,8 @@ class SessionManager:
             List of PruneResult for each pruned session.
         """
         self._load_existing_sessions()
+        if not dry_run:
+            self._chrome_pool.prune(get_pool_size())
         return self._session_pruner.prune(
             self._sessions,
             ignore_ttl=ignore_ttl,
@@ -85,6 +85,27 @@ class BrowserOptions:
     cdp_endpoint_url: str | None = None
 
 
+@dataclass(frozen=True)
+class PooledChrome:
+    """An idle, pre-launched headless Chrome waiting in the warm pool.
+
+    Attributes:
+        member_id: Unique identifier for the pool member
+        browser_pid: Process ID of the Chrome process
+        cdp_port: Port the Chrome process serves CDP on
+        cdp_endpoint: Chrome DevTools Protocol WebSocket URL
+        user_data_dir: Throwaway user data directory the Chrome process owns
+        launched_at: Unix timestamp when the Chrome process was launched
+    """
+
+    member_id: str
+    browser_pid: int
+    cdp_port: int
+    cdp_endpoint: str
+    user_data_dir: str
+    launched_at: float
+
+
 @dataclass
 class SessionInfo:
     """Information about a Nova Act session.
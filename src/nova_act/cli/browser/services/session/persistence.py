@@ -13,21 +13,28 @@
 # limitations under the License.
 """Session persistence module for managing session metadata storage.
 
-This module handles all file-based session metadata operations including:
+This module handles all session metadata operations including:
 - Creating and managing session directory
-- Reading/writing session metadata to JSON files
+- Reading/writing session metadata in a SQLite index (WAL mode) shared by all CLI processes
+- Leasing CDP ports atomically so concurrent session creates never pick the same port
+- Tracking the warm pool of pre-launched Chrome processes
 - Loading existing sessions from disk on startup
+- Migrating legacy per-session JSON files into the index
 """
 
 import json
 import logging
 import os
-import tempfile
+import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import TypedDict
 
 from nova_act.cli.browser.services.session.models import (
+    PooledChrome,
     SessionInfo,
     SessionState,
 )
@@ -50,18 +57,51 @@ logger = logging.getLogger(__name__)
 # Secure directory permissions: owner read/write/execute only
 SESSION_DIR_PERMISSIONS = 0o700
 
+SESSION_INDEX_FILENAME = "sessions.db"
+SESSION_INDEX_BUSY_TIMEOUT_MS = 10_000
+# A lease reserves a port between picking it and persisting the session that uses it
+PORT_LEASE_TTL_SECONDS = 300.0
+# Stored as PRAGMA user_version once the schema exists and legacy JSON files were migrated;
+# bump it when either changes so existing indexes run the setup again
+SESSION_INDEX_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    metadata TEXT NOT NULL,
+    cdp_port INTEGER,
+    revision INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS port_leases (
+    port INTEGER PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chrome_pool (
+    member_id TEXT PRIMARY KEY,
+    browser_pid INTEGER NOT NULL,
+    cdp_port INTEGER NOT NULL,
+    cdp_endpoint TEXT NOT NULL,
+    user_data_dir TEXT NOT NULL,
+    launched_at REAL NOT NULL
+);
+"""
+
 
 class SessionPersistence:
-    """Manages file-based session metadata storage and retrieval."""
+    """Manages session metadata storage and retrieval in the session index."""
 
     def __init__(self, session_dir: str):
         """Initialize session persistence manager.
 
         Args:
-            session_dir: Directory path for storing session metadata files
+            session_dir: Directory path for the session index
         """
         self.session_dir = session_dir
         self._ensure_session_directory()
+        self._connection = self._open_index()
+        (index_version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if index_version < SESSION_INDEX_VERSION:
+            self._initialize_index()
 
     def _ensure_session_directory(self) -> None:
         """Create session directory if it doesn't exist with secure permissions."""
@@ -72,37 +112,85 @@ class SessionPersistence:
             # Ensure correct permissions on existing directory
             os.chmod(self.session_dir, SESSION_DIR_PERMISSIONS)
 
-    def get_session_file_path(self, session_id: str) -> Path:
-        """Get path to session metadata file.
+    def _open_index(self) -> sqlite3.Connection:
+        """Open (creating if needed) the SQLite session index."""
+        connection = sqlite3.connect(
+            Path(self.session_dir) / SESSION_INDEX_FILENAME,
+            timeout=SESSION_INDEX_BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,  # Autocommit; multi-statement writes use explicit transactions
+        )
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
 
-        Args:
-            session_id: Unique identifier for the session
+    def _initialize_index(self) -> None:
+        """Switch the index to WAL mode, create its schema and migrate legacy JSON files.
 
-        Returns:
-            Path to session JSON file
+        All three persist in the database file, so this runs once per SESSION_INDEX_VERSION
+        rather than on every construction.
         """
-        return Path(self.session_dir) / f"{session_id}.json"
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._migrate_json_files()
+        self._connection.execute(f"PRAGMA user_version={SESSION_INDEX_VERSION}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a write transaction, taking the write lock up front."""
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._connection
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def _migrate_json_files(self) -> None:
+        """Import legacy per-session JSON files into the index, then remove them.
+
+        Rows already in the index win, so a stale file never overwrites newer metadata.
+        Files that are not session metadata are left in place.
+        """
+        for session_file in Path(self.session_dir).glob("*.json"):
+            try:
+                metadata = json.loads(session_file.read_text(encoding="utf-8"))
+                if not isinstance(metadata, dict) or "session_id" not in metadata:
+                    logger.debug("Skipping %s: not a session metadata file", session_file.name)
+                    continue
+                session_id = str(metadata["session_id"])
+                cdp_port = metadata.get("cdp_port")
+                with self._transaction() as db:
+                    db.execute(
+                        "INSERT OR IGNORE INTO sessions (session_id, metadata, cdp_port) VALUES (?, ?, ?)",
+                        (session_id, json.dumps(metadata), cdp_port if isinstance(cdp_port, int) else None),
+                    )
+                session_file.unlink(missing_ok=True)
+                logger.debug("Migrated session metadata file %s into the session index", session_file.name)
+            except json.JSONDecodeError:
+                logger.debug("Skipping %s: not a session metadata file", session_file.name)
+            except OSError as e:
+                logger.warning("Failed to migrate session file '%s': %s", session_file.name, e)
 
     def write_session_metadata(self, session_info: SessionInfo) -> None:
-        """Write session metadata to JSON file.
+        """Write session metadata to the index.
+
+        Also releases any port lease for the session's CDP port, which the session row now holds.
 
         Args:
             session_info: SessionInfo object to serialize
         """
         metadata = session_info.to_dict()
-
-        file_path = self.get_session_file_path(session_info.session_id)
-        fd, tmp_path = tempfile.mkstemp(dir=str(file_path.parent), suffix=".tmp")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
-            os.replace(tmp_path, file_path)
-        except BaseException:
-            os.unlink(tmp_path)
-            raise
+        with self._transaction() as db:
+            db.execute(
+                "INSERT INTO sessions (session_id, metadata, cdp_port) VALUES (?, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET "
+                "metadata = excluded.metadata, cdp_port = excluded.cdp_port, revision = revision + 1",
+                (session_info.session_id, json.dumps(metadata), session_info.cdp_port),
+            )
+            if session_info.cdp_port is not None:
+                db.execute("DELETE FROM port_leases WHERE port = ?", (session_info.cdp_port,))
 
     def read_session_metadata(self, session_id: str) -> dict[str, object]:
-        """Read session metadata from JSON file.
+        """Read session metadata from the index.
 
         Args:
             session_id: Unique identifier for the session
@@ -111,13 +199,29 @@ class SessionPersistence:
             Dictionary containing session metadata
 
         Raises:
-            FileNotFoundError: If session file doesn't exist
-            json.JSONDecodeError: If session file is corrupted
+            FileNotFoundError: If the session is not in the index
+            json.JSONDecodeError: If the stored metadata is corrupted
         """
-        file_path = self.get_session_file_path(session_id)
-        with open(file_path, "r", encoding="utf-8") as f:
-            result: dict[str, object] = json.load(f)
-            return result
+        row = self._connection.execute("SELECT metadata FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"No metadata for session '{session_id}'")
+        result: dict[str, object] = json.loads(row[0])
+        return result
+
+    def session_exists(self, session_id: str) -> bool:
+        """Check whether a session has persisted metadata."""
+        row = self._connection.execute("SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        return row is not None
+
+    def get_session_revision(self, session_id: str) -> int | None:
+        """Return a counter bumped on every metadata write, or None if the session is not persisted."""
+        row = self._connection.execute("SELECT revision FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        return int(row[0]) if row is not None else None
+
+    def delete_session_metadata(self, session_id: str) -> None:
+        """Remove a session's metadata from the index (no-op if absent)."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
 
     def load_session(self, session_id: str) -> SessionInfo:
         """Load a single session from disk by ID.
@@ -129,8 +233,8 @@ class SessionPersistence:
             SessionInfo object with nova_act_instance=None (state determined by PID liveness)
 
         Raises:
-            FileNotFoundError: If session file doesn't exist
-            json.JSONDecodeError: If session file is corrupted
+            FileNotFoundError: If the session is not in the index
+            json.JSONDecodeError: If the stored metadata is corrupted
             KeyError: If required metadata fields are missing
             ValueError: If metadata values are invalid
         """
@@ -218,8 +322,60 @@ class SessionPersistence:
             "browser_options_meta": browser_options_raw if isinstance(browser_options_raw, dict) else {},
         }
 
+    def add_pool_member(self, member: PooledChrome) -> None:
+        """Add an idle Chrome to the warm pool, releasing the port lease its port was taken under."""
+        with self._transaction() as db:
+            db.execute(
+                "INSERT INTO chrome_pool (member_id, browser_pid, cdp_port, cdp_endpoint, user_data_dir, launched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    member.member_id,
+                    member.browser_pid,
+                    member.cdp_port,
+                    member.cdp_endpoint,
+                    member.user_data_dir,
+                    member.launched_at,
+                ),
+            )
+            db.execute("DELETE FROM port_leases WHERE port = ?", (member.cdp_port,))
+
+    def claim_pool_member(self) -> PooledChrome | None:
+        """Atomically remove and return the oldest warm pool member, or None if the pool is empty.
+
+        The member's port is leased again until a session is persisted with it.
+        """
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT member_id, browser_pid, cdp_port, cdp_endpoint, user_data_dir, launched_at "
+                "FROM chrome_pool ORDER BY launched_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            member = PooledChrome(*row)
+            db.execute("DELETE FROM chrome_pool WHERE member_id = ?", (member.member_id,))
+            db.execute(
+                "INSERT OR REPLACE INTO port_leases (port, expires_at) VALUES (?, ?)",
+                (member.cdp_port, time.time() + PORT_LEASE_TTL_SECONDS),
+            )
+            return member
+
+    def list_pool_members(self) -> list[PooledChrome]:
+        """Return all warm pool members, oldest first."""
+        return [
+            PooledChrome(*row)
+            for row in self._connection.execute(
+                "SELECT member_id, browser_pid, cdp_port, cdp_endpoint, user_data_dir, launched_at "
+                "FROM chrome_pool ORDER BY launched_at"
+            )
+        ]
+
+    def delete_pool_member(self, member_id: str) -> None:
+        """Remove a member from the warm pool (no-op if absent)."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM chrome_pool WHERE member_id = ?", (member_id,))
+
     def read_used_ports(self, exclude_ids: set[str]) -> set[int]:
-        """Read CDP port numbers from session metadata files without loading full sessions.
+        """Read CDP ports held by persisted sessions, pooled Chrome or live port leases.
 
         Args:
             exclude_ids: Session IDs to skip (already in memory)
@@ -227,29 +383,66 @@ class SessionPersistence:
         Returns:
             Set of port numbers in use by persisted sessions
         """
-        session_dir = Path(self.session_dir)
-        if not session_dir.exists():
-            return set()
-
-        ports: set[int] = set()
-        for session_file in session_dir.glob("*.json"):
-            if session_file.stem in exclude_ids:
-                continue
-            try:
-                with open(session_file, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
-                    if port := metadata.get("cdp_port"):
-                        ports.add(port)
-            except (json.JSONDecodeError, OSError):
-                continue
+        ports = {
+            int(port)
+            for session_id, port in self._connection.execute(
+                "SELECT session_id, cdp_port FROM sessions WHERE cdp_port IS NOT NULL"
+            )
+            if session_id not in exclude_ids
+        }
+        ports.update(
+            int(port)
+            for (port,) in self._connection.execute("SELECT port FROM port_leases WHERE expires_at > ?", (time.time(),))
+        )
+        ports.update(int(port) for (port,) in self._connection.execute("SELECT cdp_port FROM chrome_pool"))
         return ports
 
+    def lease_port(
+        self,
+        start_port: int,
+        end_port: int,
+        is_port_free: Callable[[int], bool],
+        exclude_ports: set[int] | None = None,
+    ) -> int:
+        """Atomically pick and reserve a CDP port no session, pooled Chrome or lease holds.
+
+        The pick runs inside a write transaction, so concurrent callers (in any process)
+        are serialized and never receive the same port. The lease expires after
+        PORT_LEASE_TTL_SECONDS, or as soon as a session is persisted with that port.
+
+        Args:
+            start_port: Start of port range (inclusive)
+            end_port: End of port range (inclusive)
+            is_port_free: Check that a candidate port is actually bindable
+            exclude_ports: Extra ports to skip (e.g. held by in-memory sessions)
+
+        Returns:
+            The leased port number
+
+        Raises:
+            RuntimeError: If no available ports in range
+        """
+        now = time.time()
+        with self._transaction() as db:
+            db.execute("DELETE FROM port_leases WHERE expires_at <= ?", (now,))
+            used = set(exclude_ports or ())
+            used.update(int(p) for (p,) in db.execute("SELECT cdp_port FROM sessions WHERE cdp_port IS NOT NULL"))
+            used.update(int(p) for (p,) in db.execute("SELECT port FROM port_leases"))
+            used.update(int(p) for (p,) in db.execute("SELECT cdp_port FROM chrome_pool"))
+            for port in range(start_port, end_port + 1):
+                if port in used or not is_port_free(port):
+                    continue
+                db.execute(
+                    "INSERT INTO port_leases (port, expires_at) VALUES (?, ?)", (port, now + PORT_LEASE_TTL_SECONDS)
+                )
+                return port
+        raise RuntimeError(f"No available ports in range {start_port}-{end_port}")
+
     def load_existing_sessions(self, existing_session_ids: set[str]) -> dict[str, SessionInfo]:
-        """Load existing sessions from disk.
+        """Load existing sessions from the index.
 
-        Discovers session metadata files in session_dir and reconstructs
-        SessionInfo objects. Handles corrupted files gracefully by logging
-        warnings and skipping them.
+        Reconstructs SessionInfo objects for every persisted session. Handles corrupted
+        metadata gracefully by logging warnings and skipping it.
 
         Args:
             existing_session_ids: Set of session IDs already in memory (to skip)
@@ -262,20 +455,14 @@ class SessionPersistence:
 
         Session state is determined by checking if the browser PID is still alive.
         """
-        session_dir = Path(self.session_dir)
-        if not session_dir.exists():
-            return {}
-
-        session_files = [f for f in session_dir.glob("*.json") if f.stem not in existing_session_ids]
-
         loaded_sessions: dict[str, SessionInfo] = {}
-        for session_file in session_files:
-            session_id = session_file.stem
+        for session_id, raw_metadata in self._connection.execute("SELECT session_id, metadata FROM sessions"):
+            if session_id in existing_session_ids:
+                continue
             try:
-                metadata = self.read_session_metadata(session_id)
-                session_info = self._reconstruct_session_from_metadata(metadata)
+                session_info = self._reconstruct_session_from_metadata(json.loads(raw_metadata))
                 loaded_sessions[session_info.session_id] = session_info
-            except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError) as e:
+            except (json.JSONDecodeError, KeyError, ValueError) as e:
                 logger.warning("Failed to load session '%s': %s", session_id, e)
 
         return loaded_sessions
@@ -0,0 +1,224 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cached template of the system Chrome profile for default-Chrome sessions.
+
+Mirroring a multi-GB Chrome profile for every session is slow and multiplies disk
+usage. Instead, the system profile is mirrored into a single template directory
+(without caches or Singleton files), refreshed once it is older than
+PROFILE_TEMPLATE_MAX_AGE_SECONDS or the system profile's sign-in state changed,
+and each session receives a clone of it.
+
+Clones are copy-on-write (clonefile on APFS, reflinks on Btrfs/XFS) where the
+filesystem supports it, and a parallel file copy otherwise. Hardlinks are never
+used: Chrome rewrites its databases in place, which would corrupt the template.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from filelock import FileLock
+
+from nova_act.cli.browser.services.browser_config import DefaultBrowserConfig
+
+logger = logging.getLogger(__name__)
+
+# Regenerable data stripped from the template (rsync patterns, matched at any depth)
+PROFILE_TEMPLATE_EXCLUDES = (
+    "Singleton*",
+    "Cache",
+    "Code Cache",
+    "GPUCache",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "DawnCache",
+    "DawnGraphiteCache",
+    "DawnWebGPUCache",
+    "ShaderCache",
+    "ScriptCache",
+    "CacheStorage",
+    "component_crx_cache",
+    "extensions_crx_cache",
+    "Crashpad",
+)
+
+# File used to probe copy-on-write support; present in every Chrome user data dir
+_PROBE_FILENAME = "Local State"
+
+# Source files whose changes (e.g. a new sign-in) make the template stale, relative to the user data dir
+PROFILE_TEMPLATE_KEY_FILES = ("Local State", "*/Cookies", "*/Network/Cookies", "*/Login Data")
+
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _clone_command(source: str, dest: str) -> list[str] | None:
+    """Return the copy-on-write ``cp`` command for this platform, if there is one."""
+    if sys.platform == "darwin":
+        return ["cp", "-c", "-R", source, dest]
+    if sys.platform.startswith("linux"):
+        return ["cp", "-a", "--reflink=always", source, dest]
+    return None
+
+
+def _supports_clone(src_dir: Path, dest_dir: Path) -> bool:
+    """Check whether a single file can be cloned copy-on-write from src_dir into dest_dir."""
+    probe_src = src_dir / _PROBE_FILENAME
+    probe_dest = dest_dir / _PROBE_FILENAME
+    command = _clone_command(str(probe_src), str(probe_dest))
+    if command is None or not probe_src.is_file():
+        return False
+    result = subprocess.run(command, capture_output=True)
+    probe_dest.unlink(missing_ok=True)
+    return result.returncode == 0
+
+
+def _parallel_copy_tree(src_dir: Path, dest_dir: Path) -> None:
+    """Copy a directory tree using a thread pool for the file copies.
+
+    Directories are created up front; symlinks are copied as symlinks.
+
+    Raises:
+        OSError: If any file fails to copy
+    """
+    copies: list[tuple[str, str]] = []
+    for root, dirs, files in os.walk(src_dir):
+        target_root = dest_dir / os.path.relpath(root, src_dir)
+        target_root.mkdir(parents=True, exist_ok=True)
+        for name in dirs:
+            source = os.path.join(root, name)
+            if os.path.islink(source):
+                copies.append((source, str(target_root / name)))
+        copies.extend((os.path.join(root, name), str(target_root / name)) for name in files)
+
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        for _ in pool.map(lambda pair: shutil.copy2(pair[0], pair[1], follow_symlinks=False), copies):
+            pass
+
+
+class ProfileTemplateCache:
+    """Keeps a cleaned mirror of the system Chrome profile and clones it per session.
+
+    A file lock serializes refreshes and clones across CLI processes, so a session
+    never clones a half-written template.
+    """
+
+    def __init__(
+        self,
+        template_dir: Path,
+        source_dir: Path,
+        max_age_seconds: float = DefaultBrowserConfig.PROFILE_TEMPLATE_MAX_AGE_SECONDS,
+    ) -> None:
+        """Initialize the template cache.
+
+        Args:
+            template_dir: Directory holding the template profile
+            source_dir: Chrome user data directory the template mirrors
+            max_age_seconds: Age after which the template is refreshed from source_dir
+        """
+        self.template_dir = template_dir
+        self.source_dir = source_dir
+        self.max_age_seconds = max_age_seconds
+        self._ready_marker = template_dir.with_name(f"{template_dir.name}.ready")
+        self._lock = FileLock(str(template_dir.with_name(f"{template_dir.name}.lock")))
+
+    def is_fresh(self) -> bool:
+        """Check whether the template can be cloned without a refresh.
+
+        It can if it exists, was refreshed within max_age_seconds, and none of the
+        PROFILE_TEMPLATE_KEY_FILES in source_dir changed since.
+        """
+        try:
+            refreshed_at = self._ready_marker.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        if time.time() - refreshed_at >= self.max_age_seconds:
+            return False
+        return not self._source_changed_since(refreshed_at)
+
+    def _source_changed_since(self, timestamp: float) -> bool:
+        for pattern in PROFILE_TEMPLATE_KEY_FILES:
+            for path in self.source_dir.glob(pattern):
+                try:
+                    if path.stat().st_mtime > timestamp:
+                        return True
+                except OSError:
+                    continue
+        return False
+
+    def refresh(self) -> None:
+        """Mirror source_dir into the template, skipping PROFILE_TEMPLATE_EXCLUDES.
+
+        Quits the system Chrome first so its profile is consistent on disk. After the
+        first refresh, rsync only transfers files that changed.
+
+        Raises:
+            subprocess.CalledProcessError: If rsync fails
+        """
+        from nova_act.impl.common import quit_default_chrome_browser  # noqa: PLC0415
+
+        quit_default_chrome_browser()
+
+        self._ready_marker.unlink(missing_ok=True)
+        self.template_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        excludes = [f"--exclude={pattern}" for pattern in PROFILE_TEMPLATE_EXCLUDES]
+        rsync_cmd = [
+            "rsync",
+            "-a",
+            "--delete",
+            "--delete-excluded",
+            *excludes,
+            f"{self.source_dir}/",
+            str(self.template_dir),
+        ]
+        logger.info("Refreshing Chrome profile template from %s", self.source_dir)
+        subprocess.run(rsync_cmd, check=True)
+        self._ready_marker.touch()
+
+    def clone_into(self, dest_dir: Path) -> str:
+        """Replace dest_dir with a clone of the template, refreshing the template if stale.
+
+        Args:
+            dest_dir: Session user data directory to create
+
+        Returns:
+            The clone method used: "clone" (copy-on-write) or "copy"
+
+        Raises:
+            subprocess.CalledProcessError: If refreshing the template fails
+            OSError: If the clone fails or the template lock times out
+        """
+        with self._lock.acquire(timeout=DefaultBrowserConfig.PROFILE_TEMPLATE_LOCK_TIMEOUT_SECONDS):
+            if not self.is_fresh():
+                self.refresh()
+
+            shutil.rmtree(dest_dir, ignore_errors=True)
+            dest_dir.mkdir(parents=True, mode=0o700)
+
+            # "<dir>/." copies the directory's contents with both BSD and GNU cp
+            command = _clone_command(f"{self.template_dir}/.", str(dest_dir))
+            if command is not None and _supports_clone(self.template_dir, dest_dir):
+                result = subprocess.run(command, capture_output=True, text=True)
+                if result.returncode == 0:
+                    return "clone"
+                logger.warning("Copy-on-write clone failed, falling back to copy: %s", result.stderr.strip())
+                shutil.rmtree(dest_dir, ignore_errors=True)
+                dest_dir.mkdir(parents=True, mode=0o700)
+
+            _parallel_copy_tree(self.template_dir, dest_dir)
+            return "copy"
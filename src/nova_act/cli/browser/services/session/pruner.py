@@ -126,8 +126,7 @@ class SessionPruner:
             if _should_delete_user_data_dir(session_info):
                 assert session_info.user_data_dir is not None  # guaranteed by _should_delete_user_data_dir
                 shutil.rmtree(session_info.user_data_dir, ignore_errors=True)
-            session_file = self._persistence.get_session_file_path(session_info.session_id)
-            session_file.unlink(missing_ok=True)
+            self._persistence.delete_session_metadata(session_info.session_id)
             cleanup_session_logs(session_info.session_id)
             sessions.pop(session_info.session_id, None)
             self._lock_manager.remove_lock(session_info.session_id)
@@ -20,6 +20,7 @@ import logging
 import os
 import tempfile
 from datetime import datetime
+from pathlib import Path
 from typing import TypedDict
 
 from typing_extensions import NotRequired
@@ -55,36 +56,156 @@ class SessionManifest(TypedDict):
 
 logger = logging.getLogger(__name__)
 
+# Legacy single-document manifest; migrated to the append log on first load
 MANIFEST_FILENAME = "recording.json"
+RECORDING_LOG_FILENAME = "recording.jsonl"
+RECORDING_INDEX_FILENAME = "recording.index.json"
+
+# Rewrite the index once this many commands have been appended since it was last written
+INDEX_COMPACTION_INTERVAL = 50
+TAIL_READ_CHUNK_BYTES = 64 * 1024
+
+
+class _RecordingIndex(TypedDict):
+    """Session header plus the number of commands in the first ``log_bytes`` of the log."""
+
+    session_id: str
+    started_at: str
+    command_count: int
+    log_bytes: int
+
+
+def _parse_entries(lines: list[bytes]) -> list[CommandEntry]:
+    """Parse log lines, skipping any left malformed by a crash mid-append."""
+    entries: list[CommandEntry] = []
+    for line in lines:
+        try:
+            entries.append(json.loads(line))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            logger.debug("Skipping malformed session recording entry")
+    return entries
+
+
+def _read_tail_lines(path: Path, count: int) -> list[bytes]:
+    """Read the last ``count`` non-empty lines of a file without reading the rest."""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b""
+        while position > 0 and data.count(b"\n") <= count:
+            read_size = min(TAIL_READ_CHUNK_BYTES, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    lines = data.splitlines()
+    if position > 0:
+        lines = lines[1:]  # Partial first line
+    return [line for line in lines if line.strip()][-count:]
 
 
 class SessionRecorder:
-    """Records every command invocation in a session as a JSON manifest.
+    """Records every command invocation in a session as an append-only JSON Lines log.
 
-    The manifest is written to the session's log directory and updated
-    after each command completes. No explicit start/stop -- recording is
-    always active.
+    Each command is appended (and fsync'd) to ``recording.jsonl`` as it completes, so
+    recording costs O(1) per command regardless of session length. A small index file
+    holds the session header and a command count, and is rewritten every
+    INDEX_COMPACTION_INTERVAL commands; only log lines past the indexed offset need
+    counting. No explicit start/stop -- recording is always active.
     """
 
     def __init__(self, session_id: str) -> None:
         self.session_id = session_id
         self._log_dir = get_log_dir(session_id)
         self._manifest_path = self._log_dir / MANIFEST_FILENAME
-        self._manifest: SessionManifest = self._load_or_create()
+        self._log_path = self._log_dir / RECORDING_LOG_FILENAME
+        self._index_path = self._log_dir / RECORDING_INDEX_FILENAME
+        self._migrate_legacy_manifest()
+        self._index: _RecordingIndex = self._load_or_create_index()
 
-    def _load_or_create(self) -> SessionManifest:
-        """Load existing manifest or create a new one."""
-        if self._manifest_path.exists():
+    def _migrate_legacy_manifest(self) -> None:
+        """Convert a legacy recording.json manifest into the append log and index."""
+        if not self._manifest_path.exists():
+            return
+        if not self._log_path.exists():
             try:
-                data: SessionManifest = json.loads(self._manifest_path.read_text())
-                return data
-            except (json.JSONDecodeError, OSError):
-                logger.debug("Corrupt manifest at %s, creating new", self._manifest_path)
-        return SessionManifest(
-            session_id=self.session_id,
-            started_at=datetime.now().isoformat(),
-            commands=[],
-        )
+                manifest: SessionManifest = json.loads(self._manifest_path.read_text())
+                commands = manifest["commands"]
+                self._atomic_write(self._log_path, "".join(json.dumps(c) + "\n" for c in commands))
+                self._write_index(
+                    _RecordingIndex(
+                        session_id=manifest.get("session_id", self.session_id),
+                        started_at=manifest["started_at"],
+                        command_count=len(commands),
+                        log_bytes=self._log_path.stat().st_size,
+                    )
+                )
+            except (json.JSONDecodeError, KeyError, TypeError):
+                logger.debug("Corrupt manifest at %s, not migrating", self._manifest_path)
+            except OSError as e:
+                logger.warning("Failed to migrate session manifest: %s", e)
+                return
+        self._manifest_path.unlink(missing_ok=True)
+
+    def _load_or_create_index(self) -> _RecordingIndex:
+        """Load the index, rebuilding it from the log if it is missing or corrupt."""
+        if self._index_path.exists():
+            try:
+                index: _RecordingIndex = json.loads(self._index_path.read_text())
+                if index["log_bytes"] <= self._log_size():
+                    return index
+            except (json.JSONDecodeError, KeyError, TypeError, OSError):
+                pass
+            logger.debug("Corrupt recording index at %s, rebuilding", self._index_path)
+
+        started_at = datetime.now().isoformat()
+        first = _parse_entries(self._read_first_line())
+        if first and first[0].get("timestamp"):
+            started_at = first[0]["timestamp"]
+        # command_count/log_bytes start at zero; unindexed lines are counted on demand
+        return _RecordingIndex(session_id=self.session_id, started_at=started_at, command_count=0, log_bytes=0)
+
+    def _log_size(self) -> int:
+        try:
+            return self._log_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _read_first_line(self) -> list[bytes]:
+        """Read only the first non-empty log line, as a list of at most one line."""
+        try:
+            with open(self._log_path, "rb") as f:
+                for line in iter(f.readline, b""):
+                    if line.strip():
+                        return [line]
+        except FileNotFoundError:
+            pass
+        return []
+
+    def _read_lines_from(self, offset: int) -> tuple[list[bytes], int]:
+        """Read the non-empty log lines starting at a byte offset, and the offset read up to."""
+        try:
+            with open(self._log_path, "rb") as f:
+                f.seek(offset)
+                lines = [line for line in f if line.strip()]
+                return lines, f.tell()
+        except FileNotFoundError:
+            return [], 0
+
+    @property
+    def total_commands(self) -> int:
+        """Number of commands recorded, counting only log lines past the indexed offset."""
+        return self._index["command_count"] + len(_parse_entries(self._read_lines_from(self._index["log_bytes"])[0]))
+
+    @property
+    def started_at(self) -> str:
+        return self._index["started_at"]
+
+    @property
+    def last_updated(self) -> str | None:
+        """Time of the last recorded command (the log's modification time)."""
+        try:
+            return datetime.fromtimestamp(self._log_path.stat().st_mtime).isoformat()
+        except FileNotFoundError:
+            return None
 
     def record_step(
         self,
@@ -97,7 +218,7 @@ class SessionRecorder:
         log_file: str | None = None,
         steps_file: str | None = None,
     ) -> None:
-        """Append a command entry to the manifest and persist to disk."""
+        """Append a command entry to the recording log."""
         entry: CommandEntry = {
             "command": command_name,
             "args": args or {},
@@ -114,31 +235,79 @@ class SessionRecorder:
         if steps_file:
             entry["steps_file"] = steps_file
 
-        self._manifest["commands"].append(entry)
-        self._manifest["last_updated"] = datetime.now().isoformat()
-        self._persist()
+        self._append(entry)
+        if not self._index_path.exists():
+            self._write_index(self._index)
+        else:
+            unindexed, log_bytes = self._read_lines_from(self._index["log_bytes"])
+            if len(unindexed) >= INDEX_COMPACTION_INTERVAL:
+                self._write_index(
+                    _RecordingIndex(
+                        session_id=self._index["session_id"],
+                        started_at=self._index["started_at"],
+                        command_count=self._index["command_count"] + len(_parse_entries(unindexed)),
+                        log_bytes=log_bytes,
+                    )
+                )
 
-    def get_manifest(self) -> SessionManifest:
-        """Return the current manifest."""
-        return self._manifest
+    def get_manifest(self, limit: int | None = None) -> SessionManifest:
+        """Return the session manifest, optionally with only the last N commands.
+
+        Without a limit this reads the whole log; prefer a limit for long sessions.
+        """
+        manifest = SessionManifest(
+            session_id=self._index["session_id"],
+            started_at=self._index["started_at"],
+            commands=self.get_commands(limit),
+        )
+        last_updated = self.last_updated
+        if last_updated is not None:
+            manifest["last_updated"] = last_updated
+        return manifest
 
     def get_commands(self, limit: int | None = None) -> list[CommandEntry]:
-        """Return recorded commands, optionally limited to last N."""
-        commands = self._manifest["commands"]
+        """Return recorded commands, optionally limited to last N (read from the end of the log)."""
         if limit is not None and limit > 0:
-            return commands[-limit:]
-        return commands
+            try:
+                return _parse_entries(_read_tail_lines(self._log_path, limit))
+            except FileNotFoundError:
+                return []
+        return _parse_entries(self._read_lines_from(0)[0])
+
+    def _append(self, entry: CommandEntry) -> None:
+        """Durably append one entry to the log."""
+        self._log_dir.mkdir(parents=True, exist_ok=True)
+        line = (json.dumps(entry) + "\n").encode("utf-8")
+        try:
+            with open(self._log_path, "ab") as f:
+                if f.tell() > 0:
+                    # Terminate a partial line left by a crash so this entry parses
+                    with open(self._log_path, "rb") as r:
+                        r.seek(-1, os.SEEK_END)
+                        if r.read(1) != b"\n":
+                            line = b"\n" + line
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.warning("Failed to append to session recording: %s", e)
+            raise
+
+    def _write_index(self, index: _RecordingIndex) -> None:
+        """Atomically rewrite the index file."""
+        self._atomic_write(self._index_path, json.dumps(index, indent=2))
+        self._index = index
 
-    def _persist(self) -> None:
-        """Atomically write manifest to disk."""
+    def _atomic_write(self, path: Path, content: str) -> None:
+        """Atomically write a file in the log directory."""
         self._log_dir.mkdir(parents=True, exist_ok=True)
         fd, tmp_path = tempfile.mkstemp(dir=str(self._log_dir), suffix=".tmp")
         try:
             with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(self._manifest, f, indent=2)
-            os.replace(tmp_path, str(self._manifest_path))
+                f.write(content)
+            os.replace(tmp_path, str(path))
         except BaseException as e:
-            logger.warning("Failed to persist session manifest: %s", e)
+            logger.warning("Failed to write session recording file %s: %s", path.name, e)
             try:
                 os.unlink(tmp_path)
             except OSError:
@@ -15,7 +15,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict
@@ -29,8 +28,8 @@ if TYPE_CHECKING:
 
 
 # ---------------------------------------------------------------------------
-# TypedDicts for the trajectory JSON written by the SDK's run_info_compiler.
-# The SDK has no exported types for this format, so we define them CLI-side.
+# TypedDicts for the trajectory records streamed by the SDK's dispatcher.
+# Records are read with the SDK's TrajectoryReader and validated CLI-side.
 # ---------------------------------------------------------------------------
 
 
@@ -84,6 +83,9 @@ def patch_nova_act_for_step_snapshots(nova_act: NovaAct, snapshots_out: list[lis
     Patches the dispatcher's program runner to capture an accessibility snapshot
     after each program execution (i.e. after each step). Snapshots accumulate in
     ``snapshots_out`` (passed by reference). Snapshot failure never breaks act().
+
+    Patching again (e.g. for the next command in a session daemon) replaces the previous
+    patch instead of wrapping it.
     """
     try:
         runner = nova_act.dispatcher._program_runner
@@ -91,7 +93,8 @@ def patch_nova_act_for_step_snapshots(nova_act: NovaAct, snapshots_out: list[lis
         logger.debug("Cannot patch NovaAct -- dispatcher or _program_runner not found")
         return
 
-    original_run = runner.run
+    original_run = getattr(runner, "_cli_original_run", runner.run)
+    runner._cli_original_run = original_run  # type: ignore[attr-defined]
 
     def _patched_run(program, *args, **kwargs):  # type: ignore[no-untyped-def]
         result = original_run(program, *args, **kwargs)
@@ -115,7 +118,7 @@ def write_steps_summary(
     snapshots: list[list[SnapshotElement]],
     log_dir: Path,
 ) -> dict[str, object] | None:
-    """Parse trajectory JSON, merge with monkey-patch snapshots, write steps summary.
+    """Parse trajectory records, merge with monkey-patch snapshots, write steps summary.
 
     Args:
         trajectory_dir: Directory containing SDK trajectory files.
@@ -131,7 +134,7 @@ def write_steps_summary(
             logger.debug("No trajectory file found in %s", trajectory_dir)
             return None
 
-        trajectory = json.loads(trajectory_file.read_text())
+        trajectory = _load_trajectory(trajectory_file)
         steps_data = _extract_steps(trajectory)
         step_transitions = _compute_step_transitions(snapshots)
 
@@ -162,17 +165,29 @@ def write_steps_summary(
             "time_worked_s": round(time_worked, 1),
             "steps_path": str(steps_path),
         }
-    except (OSError, json.JSONDecodeError):
+    except (OSError, ValueError):
         logger.debug("Failed to write steps summary", exc_info=True)
         return None
 
 
 def _find_latest_trajectory(directory: Path) -> Path | None:
-    """Find the most recently modified trajectory JSON in *directory* (recursive)."""
-    candidates = sorted(directory.rglob("*trajectory*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    """Find the most recently modified trajectory file in *directory* (recursive)."""
+    candidates = sorted(directory.rglob("*trajectory*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)
     return candidates[0] if candidates else None
 
 
+def _load_trajectory(trajectory_file: Path) -> dict[str, object]:
+    """Load step records and metadata from a streamed trajectory, skipping screenshots."""
+    from nova_act.impl.trajectory.reader import TrajectoryReader
+
+    reader = TrajectoryReader(str(trajectory_file))
+    metadata = reader.metadata
+    return {
+        "steps": [record.model_dump(mode="json") for record in reader.step_records()],
+        "metadata": metadata.model_dump(mode="json") if metadata is not None else {},
+    }
+
+
 def _extract_steps(trajectory: dict[str, object]) -> list[dict[str, object]]:
     """Extract action/detail/url from trajectory steps."""
     raw_steps = trajectory.get("steps", [])
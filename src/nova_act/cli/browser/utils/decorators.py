@@ -80,7 +80,7 @@ def common_browser_options(func: F) -> F:  # type: ignore[explicit-any]
         "--use-default-chrome",
         is_flag=True,
         default=False,
-        help="Use default Chrome browser with extensions (quits running Chrome, rsyncs profile)",
+        help="Use default Chrome browser with extensions (quits running Chrome when its profile copy needs a refresh)",
     )(func)
     func = click.option(
         "--launch-arg",
@@ -23,7 +23,6 @@ import click
 import yaml
 from playwright.sync_api import Error as PlaywrightError
 
-from nova_act import NovaAct
 from nova_act.cli.browser.services.browser_actions.utils import run_observe
 from nova_act.cli.browser.services.session.models import SessionInfo
 from nova_act.cli.browser.services.step_tracking import write_steps_summary
@@ -35,6 +34,7 @@ from nova_act.cli.core.output import get_cli_stdout
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from nova_act import NovaAct
     from nova_act.cli.browser.services.intent_resolution.snapshot import SnapshotElement
     from nova_act.cli.browser.types import CommandParams
 
@@ -26,7 +26,6 @@ from typing import TYPE_CHECKING
 import click
 from playwright.sync_api import Error as PlaywrightError
 
-from nova_act import NovaAct
 from nova_act.cli.browser.services.session.manager import SessionManager
 from nova_act.cli.browser.services.session.models import (
     BrowserOptions,
@@ -56,6 +55,7 @@ from nova_act.cli.core.output import get_cli_stdout
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
+    from nova_act import NovaAct
     from nova_act.cli.browser.services.intent_resolution.snapshot import SnapshotElement
     from nova_act.cli.browser.types import CommandParams
 
@@ -183,19 +183,23 @@ def patch_active_tab(nova_act: NovaAct, session_info: SessionInfo) -> None:
     This makes AI commands (act, ask, execute, navigate, explore, etc.)
     operate on the tab chosen via tab-select.
 
-    Safe: each CLI invocation is a fresh process, so the patch is isolated.
+    Patching again (e.g. for the next command in a session daemon) replaces the
+    previous patch instead of wrapping it, and index 0 restores the original.
     """
     idx = session_info.active_tab_index
+    pm = getattr(getattr(nova_act, "_actuator", None), "_playwright_manager", None)
     if idx == 0:
-        return  # Default behavior -- no patch needed
+        # Default behavior -- no patch needed, but undo one left by a previous command
+        if pm is not None and hasattr(pm, "_cli_original_get_page"):
+            pm.get_page = pm._cli_original_get_page
+        return
 
-    try:
-        pm = nova_act._actuator._playwright_manager  # type: ignore[attr-defined]
-    except AttributeError:
+    if pm is None:
         logger.debug("Cannot patch active tab: actuator has no _playwright_manager")
         return
 
-    original_get_page = pm.get_page
+    original_get_page = getattr(pm, "_cli_original_get_page", pm.get_page)
+    pm._cli_original_get_page = original_get_page
 
     def patched_get_page(index: int):  # type: ignore[no-untyped-def]
         if index == -1:
@@ -210,9 +214,19 @@ def patch_active_tab(nova_act: NovaAct, session_info: SessionInfo) -> None:
     pm.get_page = patched_get_page
 
 
+# Long-lived manager installed by the session daemon so its NovaAct instances survive across commands
+_shared_session_manager: SessionManager | None = None
+
+
+def set_shared_session_manager(manager: SessionManager | None) -> None:
+    """Make get_session_manager() return the given manager (None restores a fresh one per call)."""
+    global _shared_session_manager
+    _shared_session_manager = manager
+
+
 def get_session_manager() -> SessionManager:
     """Get SessionManager instance for managing browser sessions."""
-    return SessionManager()
+    return _shared_session_manager or SessionManager()
 
 
 @contextmanager
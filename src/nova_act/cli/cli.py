@@ -29,18 +29,27 @@ from nova_act.cli.__version__ import VERSION
 from nova_act.cli.browser import browser
 from nova_act.cli.core.styling import initialize_theme
 from nova_act.cli.core.theme import ThemeName, set_active_theme
-from nova_act.cli.group import StyledGroup
-from nova_act.cli.workflow.commands.create import create
-from nova_act.cli.workflow.commands.delete import delete
-from nova_act.cli.workflow.commands.deploy import deploy
-from nova_act.cli.workflow.commands.list import list
-from nova_act.cli.workflow.commands.list_runs import list_runs
-from nova_act.cli.workflow.commands.run import run
-from nova_act.cli.workflow.commands.show import show
-from nova_act.cli.workflow.commands.update import update
+from nova_act.cli.group import LazyGroup, StyledGroup
 
+_WORKFLOW_COMMANDS = "nova_act.cli.workflow.commands"
 
-@click.group(cls=StyledGroup)
+
+class WorkflowGroup(LazyGroup):
+    """Workflow command group; each command's module is imported only when it is dispatched."""
+
+    lazy_commands = {
+        "create": f"{_WORKFLOW_COMMANDS}.create:create",
+        "update": f"{_WORKFLOW_COMMANDS}.update:update",
+        "delete": f"{_WORKFLOW_COMMANDS}.delete:delete",
+        "show": f"{_WORKFLOW_COMMANDS}.show:show",
+        "deploy": f"{_WORKFLOW_COMMANDS}.deploy:deploy",
+        "run": f"{_WORKFLOW_COMMANDS}.run:run",
+        "list": f"{_WORKFLOW_COMMANDS}.list:list",
+        "list-runs": f"{_WORKFLOW_COMMANDS}.list_runs:list_runs",
+    }
+
+
+@click.group(cls=WorkflowGroup)
 @click.option("--profile", help="AWS profile to use (from ~/.aws/credentials)")
 @click.pass_context
 def workflow(ctx: click.Context, profile: str | None) -> None:
@@ -49,16 +58,6 @@ def workflow(ctx: click.Context, profile: str | None) -> None:
         os.environ["AWS_PROFILE"] = profile
 
 
-workflow.add_command(create)
-workflow.add_command(update)
-workflow.add_command(delete)
-workflow.add_command(show)
-workflow.add_command(deploy)
-workflow.add_command(run)
-workflow.add_command(list)
-workflow.add_command(list_runs)
-
-
 @click.group(cls=StyledGroup)
 @click.version_option(version=VERSION)
 @click.option("--no-color", is_flag=True, help="Disable colored output")
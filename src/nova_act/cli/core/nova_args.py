@@ -19,8 +19,6 @@ from typing import get_type_hints
 
 from pydantic import BaseModel
 
-from nova_act import NovaAct
-
 
 def parse_nova_arg(arg_string: str) -> tuple[str, str]:
     """Parse a single --nova-arg key=value string.
@@ -129,6 +127,8 @@ def validate_and_coerce_nova_args(args: dict[str, object]) -> dict[str, object]:
 
 def _gather_nova_act_params() -> tuple[dict[str, inspect.Parameter], dict[str, type]]:
     """Gather valid parameter names and type hints from NovaAct.__init__ and act()."""
+    from nova_act import NovaAct  # noqa: PLC0415 -- only needed when --nova-arg is given
+
     sig = inspect.signature(NovaAct.__init__)
     valid_params = {name: param for name, param in sig.parameters.items() if name != "self"}
 
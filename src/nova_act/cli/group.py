@@ -11,7 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Custom Click Group with styled help formatting."""
+"""Custom Click Groups with styled help formatting and lazily loaded commands."""
+
+import importlib
+from collections.abc import Mapping
+from typing import ClassVar
 
 import click
 
@@ -139,3 +143,33 @@ For detailed command help, use: {secondary(help_cmd)}
 
 {header("Commands:")}
   workflow     Workflow management commands for AWS AgentCore deployment."""
+
+
+class LazyGroup(StyledGroup):
+    """StyledGroup whose commands are imported only when they are dispatched.
+
+    Subclasses declare `lazy_commands`, a static registry mapping each command name
+    to ``"module.path:attribute"``, so building the group (and listing its command
+    names) imports none of them. Group help still imports every command, for its
+    short help text.
+    """
+
+    lazy_commands: ClassVar[Mapping[str, str]] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load_command(cmd_name)
+        return command
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_commands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy command {cmd_name!r} resolved to {command!r}, not a click.Command")
+        # Cache it so later lookups (and help listings) skip the import machinery
+        self.add_command(command, cmd_name)
+        return command
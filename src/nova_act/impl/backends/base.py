@@ -19,6 +19,7 @@ from typing import Literal, cast
 
 from pydantic import JsonValue
 
+from nova_act.impl.backends.telemetry import DEFAULT_FLUSH_TIMEOUT_S
 from nova_act.impl.interpreter import NovaActInterpreter
 from nova_act.impl.program.base import Call, CallResult, Program
 from nova_act.tools.actuator.interface.actuator import ActionType
@@ -126,6 +127,9 @@ class Backend(ABC):
     ) -> None:
         """Send environment telemetry. By default, do not send any."""
 
+    def flush_telemetry(self, timeout_s: float = DEFAULT_FLUSH_TIMEOUT_S) -> None:
+        """Wait for any telemetry queued in the background to be sent. By default, there is none."""
+
 
 class AwlBackend(Backend):
     """Legacy Backends which pass AWL + AST."""
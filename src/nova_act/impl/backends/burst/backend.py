@@ -31,6 +31,7 @@ from nova_act.impl.backends.burst.types import (
     UpdateActRequest,
     UpdateWorkflowRunRequest,
 )
+from nova_act.impl.backends.telemetry import DEFAULT_FLUSH_TIMEOUT_S
 from nova_act.impl.program.base import Call as SdkCall
 from nova_act.impl.program.base import CallResult as SdkCallResult
 from nova_act.impl.program.base import Program as SdkProgram
@@ -137,6 +138,9 @@ class BurstBackend(Backend, Generic[T]):
             session_id=session_id, actuator_type=actuator_type, sdk_variant=sdk_variant
         )
 
+    def flush_telemetry(self, timeout_s: float = DEFAULT_FLUSH_TIMEOUT_S) -> None:
+        self._client.flush_telemetry(timeout_s)
+
     def step(
         self, act: Act, call_results: list[SdkCallResult], tool_map: dict[str, ActionType] = {}
     ) -> StepWithProgram:
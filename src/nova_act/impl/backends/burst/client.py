@@ -68,3 +68,6 @@ class BurstClient(ABC):
         sdk_variant: Literal["SYNC", "ASYNC"],
     ) -> None:
         """Send environment telemetry. By default, do not send any."""
+
+    def flush_telemetry(self, timeout_s: float) -> None:
+        """Wait for any telemetry queued in the background to be sent. By default, there is none."""
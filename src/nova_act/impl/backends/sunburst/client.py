@@ -11,12 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import gzip
+import json
 import os
 import platform
+import random
 import sys
-from typing import Literal
+import threading
+import time
+from typing import TYPE_CHECKING, Literal
 
 import requests
+from pydantic import JsonValue
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from nova_act.__version__ import VERSION
 from nova_act.impl.backends.burst.client import BurstClient
@@ -35,6 +43,7 @@ from nova_act.impl.backends.burst.types import (
     UpdateWorkflowRunResponse,
 )
 from nova_act.impl.backends.common import assert_json_response, get_client_source
+from nova_act.impl.backends.telemetry import DEFAULT_FLUSH_TIMEOUT_S, TelemetryDispatcher, get_telemetry_dispatcher
 from nova_act.types.act_errors import (
     ActAPIError,
     ActBadRequestError,
@@ -52,19 +61,112 @@ from nova_act.types.errors import AuthError, NovaActError
 from nova_act.types.state.act import Act
 from nova_act.util.logging import create_warning_box, setup_logging
 
+if TYPE_CHECKING:
+    from urllib3 import BaseHTTPResponse
+
 _LOGGER = setup_logging(__name__)
 
+DEFAULT_CONNECT_TIMEOUT_S = 10.0
+DEFAULT_READ_TIMEOUT_S = 60.0
+DEFAULT_POOL_MAXSIZE = 64
+DEFAULT_TOTAL_MAX_ATTEMPTS = 2
+RETRY_BACKOFF_FACTOR_S = 0.5
+RETRY_BACKOFF_JITTER_S = 0.5
+MAX_RETRY_AFTER_S = 5.0
+# Statuses returned before the service processes a request; a 500, 502 or 504 may follow a step the
+# service already consumed, and every call is a non-idempotent PUT or POST, so those are not retried
+RETRY_STATUS_CODES = frozenset({429, 503})
+COMPRESS_REQUESTS_ENV_VAR = "NOVA_ACT_COMPRESS_REQUESTS"
+MIN_COMPRESSION_SIZE_BYTES = 10 * 1024
+GZIP_COMPRESSION_LEVEL = 1
+
+
+class _JitteredRetry(Retry):
+    """Retry with a random jitter added to the exponential backoff, and a capped Retry-After wait.
+
+    Implemented as an override rather than `backoff_jitter` to support urllib3 1.26.
+    """
+
+    def get_retry_after(self, response: "BaseHTTPResponse") -> float | None:
+        # A quota response may ask for an hour; never block a request on more than a few seconds
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER_S)
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.uniform(0, RETRY_BACKOFF_JITTER_S)
+
+
+def create_http_session(
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    total_max_attempts: int = DEFAULT_TOTAL_MAX_ATTEMPTS,
+) -> requests.Session:
+    """Create a keep-alive requests Session with connection pooling and retries.
+
+    Requests that fail to connect, or that are throttled (429) or turned away as unavailable
+    (503), are retried with jittered exponential backoff, waiting at most MAX_RETRY_AFTER_S for
+    a Retry-After header. Reads and other 5xx responses are never retried, since the service may
+    already have processed the request. Once attempts are exhausted the last response is
+    returned as-is, so errors still surface through `SunburstClient._translate_response_error`.
+    """
+    retry = _JitteredRetry(
+        total=total_max_attempts - 1,
+        read=0,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "POST", "PUT"}),
+        backoff_factor=RETRY_BACKOFF_FACTOR_S,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry, pool_block=False)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SHARED_SESSION: requests.Session | None = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def get_shared_http_session() -> requests.Session:
+    """Return the process-wide Session shared by every SunburstClient.
+
+    Sharing one pool lets many NovaAct instances in a process reuse warm TLS connections.
+    Headers are passed per request, so clients with different API keys can share it safely.
+    """
+    global _SHARED_SESSION
+    with _SHARED_SESSION_LOCK:
+        if _SHARED_SESSION is None:
+            _SHARED_SESSION = create_http_session()
+        return _SHARED_SESSION
+
 
 class SunburstClient(BurstClient):
     def __init__(
         self,
         api_key: str,
+        session: requests.Session | None = None,
+        timeout: tuple[float, float] = (DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S),
+        telemetry_dispatcher: TelemetryDispatcher | None = None,
+        compress_requests: bool | None = None,
     ) -> None:
         self._resolve_endpoints(
         )
 
         self._api_key = api_key
         self._client_source = get_client_source().value
+        self._session = session or get_shared_http_session()
+        self._timeout = timeout
+        self._telemetry = telemetry_dispatcher or get_telemetry_dispatcher()
+        if compress_requests is None:
+            compress_requests = bool(os.environ.get(COMPRESS_REQUESTS_ENV_VAR))
+        self._compress_requests = compress_requests
 
     def _resolve_endpoints(
         self,
@@ -90,7 +192,7 @@ class SunburstClient(BurstClient):
             by_alias=True, exclude={"session_id", "workflow_definition_name", "workflow_run_id"}, exclude_none=True
         )
 
-        response = requests.put(url=url, headers=self._headers, json=payload)
+        response = self._session.put(url=url, headers=self._headers, json=payload, timeout=self._timeout)
         if response.status_code != requests.codes.created:
             raise type(self)._translate_response_error(response)
 
@@ -106,7 +208,7 @@ class SunburstClient(BurstClient):
             by_alias=True, exclude={"workflow_definition_name", "workflow_run_id"}, exclude_none=True
         )
 
-        response = requests.put(url=url, headers=self._headers, json=payload)
+        response = self._session.put(url=url, headers=self._headers, json=payload, timeout=self._timeout)
         if response.status_code != requests.codes.created:
             raise type(self)._translate_response_error(response)
 
@@ -117,7 +219,7 @@ class SunburstClient(BurstClient):
         url = f"{self._api_url}/agent/workflow-definitions/{request.workflow_definition_name}/workflow-runs"
         payload = request.model_dump(by_alias=True, exclude={"workflow_definition_name"}, exclude_none=True)
 
-        response = requests.put(url=url, headers=self._headers, json=payload)
+        response = self._session.put(url=url, headers=self._headers, json=payload, timeout=self._timeout)
         if response.status_code != requests.codes.created:
             raise type(self)._translate_response_error(response)
 
@@ -136,19 +238,51 @@ class SunburstClient(BurstClient):
             exclude_none=True,
         )
 
-        response = requests.put(url=url, headers=self._headers, json=payload)
+        response = self._put_step(url, payload)
         if response.status_code != requests.codes.ok:
             raise type(self)._translate_response_error(response)
 
         data = response.json()
         return InvokeActStepResponse.model_validate(data)
 
+    def _put_step(self, url: str, payload: dict[str, JsonValue]) -> requests.Response:
+        """PUT a step payload, gzip-compressing the body when compression is enabled.
+
+        Steps carry a base64 screenshot and the simplified DOM, so their bodies are large.
+        If the endpoint rejects the compressed body as unsupported, compression is turned
+        off for this client and the request is resent as plain JSON.
+        """
+        if not self._compress_requests:
+            return self._session.put(url=url, headers=self._headers, json=payload, timeout=self._timeout)
+
+        start_time = time.perf_counter()
+        body = json.dumps(payload).encode("utf-8")
+        if len(body) < MIN_COMPRESSION_SIZE_BYTES:
+            return self._session.put(url=url, headers=self._headers, data=body, timeout=self._timeout)
+
+        compressed_body = gzip.compress(body, compresslevel=GZIP_COMPRESSION_LEVEL)
+        _LOGGER.debug(
+            "Compressed step payload from %d to %d bytes in %.1fms",
+            len(body),
+            len(compressed_body),
+            (time.perf_counter() - start_time) * 1000,
+        )
+
+        headers = {**self._headers, "Content-Encoding": "gzip"}
+        response = self._session.put(url=url, headers=headers, data=compressed_body, timeout=self._timeout)
+        if response.status_code == requests.codes.unsupported_media_type:
+            _LOGGER.debug("Endpoint does not accept compressed requests; falling back to plain JSON")
+            self._compress_requests = False
+            response = self._session.put(url=url, headers=self._headers, data=body, timeout=self._timeout)
+        return response
+
     def send_act_telemetry(self, act: Act, success: ActGetResult | None, error: NovaActError | None) -> None:
-        """Send telemetry for an act."""
+        """Queue telemetry for an act to be sent in the background."""
         latency = -1.0
         if act.end_time is not None:
             latency = act.end_time - act.start_time
 
+        result: dict[str, JsonValue]
         if error:
             result = {
                 "result_type": "ERROR",
@@ -165,7 +299,7 @@ class SunburstClient(BurstClient):
         else:
             return
 
-        payload = {
+        payload: dict[str, JsonValue] = {
             "act": {
                 "actId": act.id,
                 "latency": latency,
@@ -175,14 +309,7 @@ class SunburstClient(BurstClient):
             "type": "ACT",
         }
 
-        try:
-            url = self._api_url + "/agent/telemetry"
-            response = requests.post(url=url, json=payload, headers=self._headers)
-            if response.status_code != 200:
-                _LOGGER.debug("Failed to send act telemetry: %s", response.text)
-        except Exception as e:
-            # Swallow any exceptions
-            _LOGGER.debug("Error sending act telemetry: %s", e)
+        self._telemetry.submit(f"act:{act.id}", lambda: self._post_telemetry(payload))
 
     def send_environment_telemetry(
         self,
@@ -190,14 +317,14 @@ class SunburstClient(BurstClient):
         actuator_type: Literal["custom", "playwright"],
         sdk_variant: Literal["SYNC", "ASYNC"],
     ) -> None:
-        """Send environment telemetry."""
+        """Queue environment telemetry to be sent in the background."""
         python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
 
         system_name = platform.system().lower() or "unknown"
         system_release = platform.release().lower() or "unknown"
         system = f"{system_name}/{system_release}"
 
-        payload = {
+        payload: dict[str, JsonValue] = {
             "environment": {
                 "actuatorType": actuator_type,
                 "pythonVersion": python_version,
@@ -209,14 +336,17 @@ class SunburstClient(BurstClient):
             "type": "ENVIRONMENT",
         }
 
-        try:
-            url = self._api_url + "/agent/telemetry"
-            response = requests.post(url=url, json=payload, headers=self._headers)
-            if response.status_code != 200:
-                _LOGGER.debug("Failed to send environment telemetry: %s", response.text)
-        except Exception as e:
-            # Swallow any exceptions
-            _LOGGER.debug("Error sending environment telemetry: %s", e)
+        self._telemetry.submit(f"environment:{session_id}", lambda: self._post_telemetry(payload))
+
+    def _post_telemetry(self, payload: dict[str, JsonValue]) -> None:
+        url = self._api_url + "/agent/telemetry"
+        response = self._session.post(url=url, json=payload, headers=self._headers, timeout=self._timeout)
+        if response.status_code != 200:
+            raise RuntimeError(f"Failed to send {payload.get('type')} telemetry: {response.text}")
+
+    def flush_telemetry(self, timeout_s: float = DEFAULT_FLUSH_TIMEOUT_S) -> None:
+        """Wait for queued telemetry to be sent."""
+        self._telemetry.flush(timeout_s)
 
     def update_act(self, request: UpdateActRequest) -> UpdateActResponse:
         url = (
@@ -229,7 +359,7 @@ class SunburstClient(BurstClient):
             exclude_none=True,
         )
 
-        response = requests.put(url=url, headers=self._headers, json=payload)
+        response = self._session.put(url=url, headers=self._headers, json=payload, timeout=self._timeout)
         if response.status_code != requests.codes.ok:
             raise type(self)._translate_response_error(response)
 
@@ -245,7 +375,7 @@ class SunburstClient(BurstClient):
             by_alias=True, exclude={"workflow_definition_name", "workflow_run_id"}, exclude_none=True
         )
 
-        response = requests.put(url=url, headers=self._headers, json=payload)
+        response = self._session.put(url=url, headers=self._headers, json=payload, timeout=self._timeout)
         if response.status_code != requests.codes.ok:
             raise type(self)._translate_response_error(response)
 
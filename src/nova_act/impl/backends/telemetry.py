@@ -0,0 +1,144 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from nova_act.util.logging import setup_logging
+
+_LOGGER = setup_logging(__name__)
+
+DEFAULT_MAX_QUEUED_EVENTS = 256
+DEFAULT_MAX_BATCH_SIZE = 16
+DEFAULT_FLUSH_TIMEOUT_S = 2.0
+
+
+@dataclass(frozen=True)
+class TelemetryCounters:
+    """Snapshot of a TelemetryDispatcher's event counters."""
+
+    queued: int
+    sent: int
+    dropped: int
+    failed: int
+
+
+class TelemetryDispatcher:
+    """Send telemetry events from a background worker thread.
+
+    Events are submitted as zero-argument send callables keyed by an event key. Submitting
+    a key that is still pending replaces the pending event, so repeated events coalesce.
+    When the queue is full new events are dropped rather than blocking the caller.
+    The worker drains pending events in batches and exits once the queue is empty;
+    it is restarted on the next submit.
+    """
+
+    def __init__(
+        self,
+        max_queued_events: int = DEFAULT_MAX_QUEUED_EVENTS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        self._max_queued_events = max_queued_events
+        self._max_batch_size = max_batch_size
+        self._pending: OrderedDict[str, Callable[[], None]] = OrderedDict()
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._in_flight = 0
+        self._queued = 0
+        self._sent = 0
+        self._dropped = 0
+        self._failed = 0
+
+    @property
+    def counters(self) -> TelemetryCounters:
+        with self._condition:
+            return TelemetryCounters(queued=self._queued, sent=self._sent, dropped=self._dropped, failed=self._failed)
+
+    def submit(self, key: str, send: Callable[[], None]) -> bool:
+        """Queue an event for sending. Returns False if it was dropped due to backpressure."""
+        with self._condition:
+            if key in self._pending:
+                # Coalesce: the newest event for a key replaces the pending one
+                self._pending[key] = send
+                self._dropped += 1
+                return True
+
+            if len(self._pending) >= self._max_queued_events:
+                self._dropped += 1
+                _LOGGER.debug("Dropping telemetry event %s: queue is full", key)
+                return False
+
+            self._pending[key] = send
+            self._queued += 1
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="nova-act-telemetry", daemon=True)
+                self._worker.start()
+            return True
+
+    def flush(self, timeout_s: float = DEFAULT_FLUSH_TIMEOUT_S) -> bool:
+        """Wait until all queued events are sent. Returns False if the timeout expired first."""
+        deadline = time.monotonic() + timeout_s
+        with self._condition:
+            while self._pending or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    _LOGGER.debug("Timed out flushing %d telemetry events", len(self._pending) + self._in_flight)
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def _next_batch(self) -> list[Callable[[], None]]:
+        with self._condition:
+            batch: list[Callable[[], None]] = []
+            while self._pending and len(batch) < self._max_batch_size:
+                batch.append(self._pending.popitem(last=False)[1])
+            self._in_flight = len(batch)
+            if not batch:
+                self._worker = None
+                self._condition.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        while batch := self._next_batch():
+            for send in batch:
+                try:
+                    send()
+                    sent = True
+                except Exception as e:
+                    _LOGGER.debug("Error sending telemetry: %s", e)
+                    sent = False
+                with self._condition:
+                    self._in_flight -= 1
+                    if sent:
+                        self._sent += 1
+                    else:
+                        self._failed += 1
+                    self._condition.notify_all()
+
+
+_SHARED_DISPATCHER: TelemetryDispatcher | None = None
+_SHARED_DISPATCHER_LOCK = threading.Lock()
+
+
+def get_telemetry_dispatcher() -> TelemetryDispatcher:
+    """Return the process-wide TelemetryDispatcher."""
+    global _SHARED_DISPATCHER
+    with _SHARED_DISPATCHER_LOCK:
+        if _SHARED_DISPATCHER is None:
+            _SHARED_DISPATCHER = TelemetryDispatcher()
+        return _SHARED_DISPATCHER
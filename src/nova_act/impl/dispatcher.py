@@ -26,8 +26,12 @@ from nova_act.impl.inputs import validate_viewport_dimensions
 from nova_act.impl.program.base import Call, Program
 from nova_act.impl.program.runner import ProgramRunner, format_return_value
 from nova_act.impl.thinker import Thinker
+from nova_act.impl.trajectory.writer import TrajectoryWriter
 from nova_act.tools.actuator.interface.actuator import ActionType, ActuatorBase
-from nova_act.tools.browser.default.util.image_helpers import get_source_image_from_data_url
+from nova_act.tools.browser.default.util.image_helpers import (
+    get_source_image_from_data_url,
+    probe_image_metadata,
+)
 from nova_act.tools.browser.interface.types.agent_redirect_error import (
     AgentRedirectError,
 )
@@ -225,6 +229,14 @@ class ActDispatcher:
         step_object = None
         step_idx = 0
 
+        # Stream steps to the trajectory file as they are taken
+        session_logs_dir = get_session_logs_directory()
+        trajectory_writer = (
+            TrajectoryWriter(build_trajectory_file_path(session_logs_dir, act.id, act.prompt), act.prompt)
+            if session_logs_dir
+            else None
+        )
+
         # Create and run initial Program
         initial_calls: list[Call] = []
         if act.observation_delay_ms:
@@ -260,8 +272,13 @@ class ActDispatcher:
                         observation.return_value
                     ):
                         screenshot_b64 = browser_observation["screenshotBase64"]
-                        screenshot_pil = get_source_image_from_data_url(screenshot_b64)
-                        validate_viewport_dimensions(*screenshot_pil.size, warn=act.ignore_screen_dims_check)
+                        # Read the dimensions from the image header; decode the full image only if that fails
+                        if screenshot_metadata := probe_image_metadata(screenshot_b64):
+                            screenshot_size = (screenshot_metadata.width, screenshot_metadata.height)
+                        else:
+                            screenshot_pil = get_source_image_from_data_url(screenshot_b64)
+                            screenshot_size = screenshot_pil.size
+                        validate_viewport_dimensions(*screenshot_size, warn=act.ignore_screen_dims_check)
 
                 # Get a Program from the model
                 set_logging_session_state(SessionState.THINKING)
@@ -271,6 +288,8 @@ class ActDispatcher:
                 self._human_input_callbacks.most_recent_screenshot = step_object.model_input.image
 
                 act.add_step(step_object)
+                if trajectory_writer is not None:
+                    trajectory_writer.append_step(step_object)
                 program = step_object.program
 
                 # Log the model output
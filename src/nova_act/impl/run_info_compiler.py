@@ -12,26 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import base64
+import binascii
 import html
 import io
 import json
 import os
 import re
 import secrets
-from urllib.parse import urlparse
+from typing import Callable, TextIO
+from urllib.parse import quote, urlparse
 
-from PIL import Image, ImageDraw
+from PIL import Image, UnidentifiedImageError
 
-from nova_act.__version__ import VERSION
 from nova_act.impl.program.base import CallResult
-from nova_act.impl.trajectory.types import Trajectory, TrajectoryMetadata, TrajectoryStep
+from nova_act.impl.trajectory.types import TrajectoryMetadata
+from nova_act.impl.trajectory.writer import (
+    append_trajectory_metadata,
+    get_trajectory_image_directory,
+    write_trajectory_image,
+)
 from nova_act.types.act_errors import ActInvalidModelGenerationError
-from nova_act.types.act_metadata import ActMetadata, _format_duration
+from nova_act.types.act_metadata import ActMetadata, _format_duration, build_trajectory_file_path
 from nova_act.types.act_result import ActResult
 from nova_act.types.api.trace import ExternalTraceDict
 from nova_act.types.errors import ValidationFailed
 from nova_act.types.state.act import Act
-from nova_act.types.state.step import StepWithProgram
 from nova_act.types.workflow_run import WorkflowRun
 from nova_act.util.logging import setup_logging
 
@@ -249,6 +254,29 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             grid-template-columns: repeat(2, 1fr);
             gap: 16px;
         }}
+        .step-image {{
+            position: relative;
+            height: fit-content;
+        }}
+        .step-image img {{
+            display: block;
+            width: 100%;
+            border-radius: 5px;
+            background-color: lightblue;
+        }}
+        .step-image-overlay {{
+            position: absolute;
+            inset: 0;
+            width: 100%;
+            height: 100%;
+            pointer-events: none;
+        }}
+        .step-image-overlay rect {{
+            fill: none;
+            stroke: red;
+            stroke-width: 3;
+            vector-effect: non-scaling-stroke;
+        }}
 
         @media (max-width: 767px) {{
             .metadata-container {{
@@ -441,29 +469,29 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 
 
 _BBOX_MATCHER = re.compile(r"<box>(\d+),(\d+),(\d+),(\d+)</box>")
-_IMAGE_PREFIX_MATCHER = re.compile(r"^data:image/[^;]+;base64,(.+)$")
+_IMAGE_PREFIX_MATCHER = re.compile(r"^data:image/[^;]+;base64,")
 
-_LOGGER = setup_logging(__name__)
+# Enough base64 to cover the header of any screenshot, so probing its size does not decode the whole image
+_IMAGE_HEADER_PROBE_CHARS = 64 * 1024
 
+EMBED_REPORT_IMAGES_ENV_VAR = "NOVA_ACT_EMBED_REPORT_IMAGES"
 
-def _save_image_as_jpeg_base64(pil_image: Image.Image, image_bytes_io: io.BytesIO) -> str:
-    """Save PIL image as JPEG and return base64-encoded data URI."""
-    pil_image.save(image_bytes_io, format="JPEG")
-    return "data:image/jpeg;base64," + base64.b64encode(image_bytes_io.getvalue()).decode("utf-8")
+# The run info HTML is streamed to disk: the template before the steps, each step, then the rest
+_HTML_HEAD, _HTML_TAIL = HTML_TEMPLATE.split("{run_info}")
 
+_LOGGER = setup_logging(__name__)
 
-def _add_bbox_to_image(image: str, response: str) -> str:
-    if not image:
-        return image
 
+def _parse_bbox(response: str) -> tuple[int, int, int, int] | None:
+    """Find the (top, left, bottom, right) bounding box acted on in a model response, if any."""
     # Find the first bbox in the response. Right now there can ever only be on bbox. The agent will only take one
     # action at a time and then observe before taking the next one.
     bbox_match = _BBOX_MATCHER.search(response)
     if not bbox_match:
-        return image
+        return None
     top, left, bottom, right = map(int, bbox_match.groups())
 
-    # Validate bounding box coordinates - PIL requires x1 >= x0 and y1 >= y0
+    # Validate bounding box coordinates
     if right < left or bottom < top:
         raise ActInvalidModelGenerationError(
             message=(
@@ -473,20 +501,46 @@ def _add_bbox_to_image(image: str, response: str) -> str:
             ),
             raw_response=response,
         )
+    return top, left, bottom, right
+
+
+def _get_data_url_image_size(image: str) -> tuple[int, int] | None:
+    """Read the (width, height) of a base64 image from its header, without decoding the pixels."""
+    image = _IMAGE_PREFIX_MATCHER.sub("", image, count=1)
+    header = image[: _IMAGE_HEADER_PROBE_CHARS - _IMAGE_HEADER_PROBE_CHARS % 4]
+    try:
+        with Image.open(io.BytesIO(base64.b64decode(header))) as pil_image:
+            return pil_image.size
+    except (binascii.Error, OSError, UnidentifiedImageError):
+        return None
+
+
+def _get_file_image_size(image_path: str) -> tuple[int, int] | None:
+    """Read the (width, height) of an image file from its header, without decoding the pixels."""
+    try:
+        with Image.open(image_path) as pil_image:
+            return pil_image.size
+    except (OSError, UnidentifiedImageError):
+        return None
+
 
-    # Strip the data prefix in the base64 image.
-    image_match = _IMAGE_PREFIX_MATCHER.match(image)
-    if image_match:
-        image = image_match.group(1)
+def _format_step_image_html(image_src: str, image_size: tuple[int, int] | None, response: str) -> str:
+    """Render a step screenshot with the acted-on bounding box drawn over it as SVG."""
+    bbox = _parse_bbox(response)
 
-    # Add the rectangle to the image.
-    pil_image = Image.open(io.BytesIO(base64.b64decode(image)))
-    draw = ImageDraw.Draw(pil_image)
-    draw.rectangle((left, top, right, bottom), outline="red", width=3)
-    image_bytes_io = io.BytesIO()
+    overlay = ""
+    if bbox is not None and image_size is not None:
+        top, left, bottom, right = bbox
+        width, height = image_size
+        overlay = f"""
+                        <svg class="step-image-overlay" viewBox="0 0 {width} {height}" preserveAspectRatio="none">
+                            <rect x="{left}" y="{top}" width="{right - left}" height="{bottom - top}"></rect>
+                        </svg>"""
 
-    # Return the modified image with the data prefix.
-    return _save_image_as_jpeg_base64(pil_image, image_bytes_io)
+    return f"""
+                    <div class="step-image">
+                        <img src="{html.escape(image_src)}" alt="Step screenshot">{overlay}
+                    </div>"""
 
 
 def sanitize_url(url: str) -> str:
@@ -567,12 +621,19 @@ def format_run_info(
     response: str,
     server_time_s: float | None = None,
     call_results: list[CallResult] | None = None,
+    image_size: tuple[int, int] | None = None,
 ) -> str:
-    image = _add_bbox_to_image(image, response)
+    """Render one step of the run info report.
+
+    `image` may be a data URL or a URL relative to the report; `image_size` is read from
+    the image header when not given.
+    """
+    if image_size is None and image:
+        image_size = _get_data_url_image_size(image)
+    image_html = _format_step_image_html(image, image_size, response) if image else ""
 
     # HTML escape the url and response to prevent HTML interpretation of <box> tags and to protect against xss
     escaped_response = html.escape(response)
-    escaped_image = html.escape(image)
     escaped_time = html.escape(time)
     escaped_url = sanitize_url(url)
 
@@ -597,12 +658,7 @@ def format_run_info(
                 <span class="step-title">Step {steps}</span>
             </div>
             <div class="step-body">
-                <div class="run-step-body">
-                    <img src="{escaped_image}"
-                        style="border-radius: 5px;
-                        object-fit: contain;
-                        background-color: lightblue;
-                        width: 100%;">
+                <div class="run-step-body">{image_html}
                     <pre style="height: fit-content;">{escaped_response}</pre>
                     {call_results_html}
                     <div>
@@ -622,14 +678,16 @@ def format_run_info(
     """
 
 
-def _write_html_file(session_logs_directory: str, file_name_prefix: str, html_content: str) -> str:
+def _write_html_file(
+    session_logs_directory: str, file_name_prefix: str, write_content: Callable[[TextIO], None]
+) -> str:
     """
-    Write HTML content to a file.
+    Stream HTML content to a file.
 
     Args:
         session_logs_directory: Directory to write the file to
         file_name_prefix: Prefix for the file name
-        html_content: HTML content to write
+        write_content: Writes the HTML content to the open file
 
     Returns:
         Path to the written file
@@ -637,7 +695,7 @@ def _write_html_file(session_logs_directory: str, file_name_prefix: str, html_co
     output_file_path = os.path.join(session_logs_directory, file_name_prefix + ".html")
     try:
         with open(output_file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            write_content(f)
         return output_file_path
     except OSError as e:
         _LOGGER.warning(f"Failed to write html to file: {e}")
@@ -683,20 +741,9 @@ def _write_traces_json_file(session_logs_directory: str, file_name_prefix: str,
         _LOGGER.warning(f"Failed to write trace data to file {json_file_path}: {e}")
 
 
-def dump_trajectory_string(steps: list[StepWithProgram], metadata: ActMetadata, workflow: WorkflowRun | None) -> str:
-    """Build a trajectory JSON string from act steps and metadata."""
-    if not steps:
-        raise ValueError("Cannot serialize an empty trajectory.")
-    trajectory_steps: list[TrajectoryStep] = [
-        TrajectoryStep(
-            active_url=step.model_input.active_url,
-            image=step.model_input.image,
-            simplified_dom=step.model_input.simplified_dom,
-            program=step.program,
-        )
-        for step in steps
-    ]
-    trajectory_metadata = TrajectoryMetadata(
+def build_trajectory_metadata(metadata: ActMetadata, workflow: WorkflowRun | None) -> TrajectoryMetadata:
+    """Build the trajectory metadata record for an act."""
+    return TrajectoryMetadata(
         session_id=metadata.session_id,
         act_id=metadata.act_id,
         num_steps_executed=metadata.num_steps_executed,
@@ -709,12 +756,6 @@ def dump_trajectory_string(steps: list[StepWithProgram], metadata: ActMetadata,
         workflow_definition_name=workflow.workflow_definition_name if workflow else None,
         workflow_run_id=workflow.workflow_run_id if workflow else None,
     )
-    return Trajectory(
-        sdk_version=VERSION,
-        prompt=metadata.prompt,
-        steps=trajectory_steps,
-        metadata=trajectory_metadata,
-    ).model_dump_json()
 
 
 class RunInfoCompiler:
@@ -723,10 +764,21 @@ class RunInfoCompiler:
     def __init__(
         self,
         session_logs_directory: str,
+        embed_images: bool | None = None,
     ):
+        """
+        Args:
+            session_logs_directory: Directory to write run info files to
+            embed_images: Embed step screenshots in the HTML report as data URLs, instead of
+                referencing them as files next to it. Defaults to the NOVA_ACT_EMBED_REPORT_IMAGES
+                environment variable.
+        """
         self._session_logs_directory = session_logs_directory
         if not self._session_logs_directory:
             raise ValidationFailed(f"Invalid logs directory: {self._session_logs_directory}")
+        if embed_images is None:
+            embed_images = bool(os.environ.get(EMBED_REPORT_IMAGES_ENV_VAR))
+        self._embed_images = embed_images
 
     @staticmethod
     def _safe_filename(s: str, max_length: int) -> str:
@@ -737,16 +789,38 @@ class RunInfoCompiler:
 
         return safe[:max_length]
 
-    def _generate_html_content(self, act: Act, result: ActResult | None) -> str:
+    def _get_step_image(
+        self, image_directory: str | None, index: int, image: str
+    ) -> tuple[str, tuple[int, int] | None]:
+        """
+        Get the image source and size for a step screenshot.
+
+        The screenshot is referenced from the act's sidecar image directory, written there
+        if the trajectory writer has not already done so. It is embedded as a data URL if
+        image_directory is None or the file cannot be written.
+
+        Returns:
+            The image source and its (width, height), if it could be read
+        """
+        if image_directory is not None and image:
+            try:
+                os.makedirs(image_directory, exist_ok=True)
+                image_name, _ = write_trajectory_image(image_directory, index, image, overwrite=False)
+                image_src = quote(f"{os.path.basename(image_directory)}/{image_name}")
+                return image_src, _get_file_image_size(os.path.join(image_directory, image_name))
+            except (OSError, binascii.Error) as e:
+                _LOGGER.warning(f"Failed to write step image to file, embedding it instead: {e}")
+        return image, _get_data_url_image_size(image) if image else None
+
+    def _write_html_content(self, f: TextIO, act: Act, result: ActResult | None, image_directory: str | None) -> None:
         """
-        Generate HTML content from act steps.
+        Stream HTML content for act steps, one step at a time.
 
         Args:
+            f: File to write the HTML content to
             act: Act object containing steps
             result: ActResult object containing metadata (optional)
-
-        Returns:
-            Generated HTML content
+            image_directory: Directory to write step images to, or None to embed them
         """
 
         # Extract time worked from result metadata
@@ -762,18 +836,42 @@ class RunInfoCompiler:
             else:
                 time_worked_display = f'<div style="padding: 8px 0;"><b>Time Worked:</b> {time_worked_str}</div>'
 
-        run_info = ""
+        # Prepare prompt for display (no truncation, using scrollable container)
+        prompt_display = html.escape(act.prompt)
+
+        # Calculate step count
+        step_count = len(act.steps)
+
+        # Generate a cryptographically secure nonce for CSP
+        nonce = secrets.token_urlsafe(32)
+
+        # Compile Workflow View
+        f.write(
+            _HTML_HEAD.format(
+                session_id=act.session_id,
+                act_id=act.id,
+                prompt_display=prompt_display,
+                step_count=step_count,
+                nonce=nonce,
+                time_worked=time_worked_display,
+            )
+        )
+
         for i, step in enumerate(act.steps):
             tool_results = _get_tool_call_results(step.model_input.call_results)
             step_call_results: list[CallResult] | None = tool_results or None
-            run_info += format_run_info(
-                steps=i + 1,
-                url=step.model_input.active_url,
-                time=str(step.observed_time),
-                image=step.model_input.image,
-                response=step.model_output.awl_raw_program,
-                server_time_s=step.server_time_s,
-                call_results=step_call_results,
+            image_src, image_size = self._get_step_image(image_directory, i, step.model_input.image)
+            f.write(
+                format_run_info(
+                    steps=i + 1,
+                    url=step.model_input.active_url,
+                    time=str(step.observed_time),
+                    image=image_src,
+                    response=step.model_output.awl_raw_program,
+                    server_time_s=step.server_time_s,
+                    call_results=step_call_results,
+                    image_size=image_size,
+                )
             )
         if result is not None:
             # Escape any HTML which might be in serialized ActResult string to avoid risk
@@ -789,28 +887,9 @@ class RunInfoCompiler:
                     <div style="font-weight: bold;">Nova Act Result</div>
                     <pre>{escaped_result_str}</pre>
                 </div>"""
-            run_info += result_div
-
-        # Prepare prompt for display (no truncation, using scrollable container)
-        prompt_display = html.escape(act.prompt)
+            f.write(result_div)
 
-        # Calculate step count
-        step_count = len(act.steps)
-
-        # Generate a cryptographically secure nonce for CSP
-        nonce = secrets.token_urlsafe(32)
-
-        # Compile Workflow View
-        html_content = HTML_TEMPLATE.format(
-            run_info=run_info,
-            session_id=act.session_id,
-            act_id=act.id,
-            prompt_display=prompt_display,
-            step_count=step_count,
-            nonce=nonce,
-            time_worked=time_worked_display,
-        )
-        return html_content
+        f.write(_HTML_TAIL.format(nonce=nonce))
 
     def compile(self, act: Act, result: ActResult | None = None) -> str:
         """
@@ -827,27 +906,31 @@ class RunInfoCompiler:
         prompt_filename_snippet = self._safe_filename(act.prompt, 30)
         file_name_prefix = f"act_{act.id}_{prompt_filename_snippet}"
 
-        # Generate HTML content
-        html_content = self._generate_html_content(act=act, result=result)
+        # Step images are shared with the act's trajectory, which the dispatcher may have already written
+        image_directory = None
+        if not self._embed_images:
+            image_directory = get_trajectory_image_directory(
+                build_trajectory_file_path(self._session_logs_directory, act.id, act.prompt)
+            )
 
         # Write HTML file
         output_file_path = _write_html_file(
             session_logs_directory=self._session_logs_directory,
             file_name_prefix=file_name_prefix,
-            html_content=html_content,
+            write_content=lambda f: self._write_html_content(
+                f, act=act, result=result, image_directory=image_directory
+            ),
         )
 
-        # Write trajectory JSON file
-        if result is not None and result.metadata and result.metadata.trajectory_file_path and act.steps:
+        # Finish the trajectory streamed by the dispatcher with the act metadata
+        metadata = result.metadata if result is not None else act.metadata
+        if metadata.trajectory_file_path and act.steps:
             try:
-                metadata = result.metadata
-                trajectory_file_path = metadata.trajectory_file_path
-                if trajectory_file_path is not None:
-                    trajectory_json = dump_trajectory_string(act.steps, metadata, act.workflow_run)
-                    with open(trajectory_file_path, "w", encoding="utf-8") as f:
-                        f.write(trajectory_json)
-            except (OSError, ValueError) as e:
-                _LOGGER.warning(f"Failed to write trajectory to file: {e}")
+                append_trajectory_metadata(
+                    metadata.trajectory_file_path, build_trajectory_metadata(metadata, act.workflow_run)
+                )
+            except OSError as e:
+                _LOGGER.warning(f"Failed to write trajectory metadata to file: {e}")
 
         # Write trace JSON file
         _write_traces_json_file(
@@ -0,0 +1,108 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lazy reader for streamed (JSON Lines) trajectories written by TrajectoryWriter."""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+from functools import cached_property
+from typing import Iterator
+
+from pydantic import JsonValue
+
+from nova_act.impl.trajectory.types import (
+    Trajectory,
+    TrajectoryHeader,
+    TrajectoryMetadata,
+    TrajectoryStep,
+    TrajectoryStepRecord,
+)
+from nova_act.util.logging import setup_logging
+
+_LOGGER = setup_logging(__name__)
+
+
+class TrajectoryReader:
+    """Read a streamed trajectory one record at a time.
+
+    Step records are parsed as they are iterated and screenshots are only loaded from their
+    sidecar files when a full TrajectoryStep is requested, so large trajectories can be
+    inspected without holding them in memory.
+    """
+
+    def __init__(self, file_path: str):
+        self._file_path = file_path
+        self._directory = os.path.dirname(file_path)
+
+    def _records(self, record_type: str) -> Iterator[dict[str, JsonValue]]:
+        with open(self._file_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash while appending can leave a partial last line behind
+                    _LOGGER.debug(f"Skipping malformed trajectory record at {self._file_path}:{line_number}")
+                    continue
+                if isinstance(record, dict) and record.get("type") == record_type:
+                    yield record
+
+    @cached_property
+    def header(self) -> TrajectoryHeader:
+        for record in self._records("header"):
+            return TrajectoryHeader.model_validate(record)
+        raise ValueError(f"Trajectory file has no header: {self._file_path}")
+
+    @cached_property
+    def metadata(self) -> TrajectoryMetadata | None:
+        """The act metadata, or None if the act did not finish writing its trajectory."""
+        metadata = None
+        for record in self._records("metadata"):
+            metadata = TrajectoryMetadata.model_validate(record)
+        return metadata
+
+    def step_records(self) -> Iterator[TrajectoryStepRecord]:
+        """Iterate over step records without loading their screenshots."""
+        for record in self._records("step"):
+            yield TrajectoryStepRecord.model_validate(record)
+
+    def load_image(self, record: TrajectoryStepRecord) -> str:
+        """Load a step's screenshot in the form it was originally captured in."""
+        with open(os.path.join(self._directory, record.image_path), "rb") as f:
+            image = base64.b64encode(f.read()).decode("utf-8")
+        if record.image_media_type is None:
+            return image
+        return f"data:{record.image_media_type};base64,{image}"
+
+    def steps(self) -> Iterator[TrajectoryStep]:
+        """Iterate over steps, loading each screenshot as its step is reached."""
+        for record in self.step_records():
+            yield TrajectoryStep(
+                active_url=record.active_url,
+                image=self.load_image(record),
+                simplified_dom=record.simplified_dom,
+                program=record.program,
+            )
+
+    def load(self) -> Trajectory:
+        """Reconstruct the full Trajectory model."""
+        return Trajectory(
+            sdk_version=self.header.sdk_version,
+            prompt=self.header.prompt,
+            steps=list(self.steps()),
+            metadata=self.metadata,
+        )
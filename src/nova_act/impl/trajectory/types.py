@@ -43,6 +43,28 @@ class TrajectoryMetadata(BaseModel):
     workflow_run_id: str | None = None
 
 
+class TrajectoryHeader(BaseModel):
+    """First record of a streamed trajectory file."""
+
+    sdk_version: str
+    prompt: str
+
+
+class TrajectoryStepRecord(BaseModel):
+    """A streamed trajectory step whose screenshot is stored in a sidecar file.
+
+    `image_path` is relative to the directory containing the trajectory file.
+    `image_media_type` is None when the screenshot was not a data URL.
+    """
+
+    index: int
+    active_url: str
+    image_path: str
+    image_media_type: str | None = None
+    simplified_dom: str
+    program: Program
+
+
 class Trajectory(BaseModel):
     """Serializable class for a Trajectory created by NovaAct."""
 
@@ -0,0 +1,146 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Append-only writer for streamed (JSON Lines) trajectories.
+
+A streamed trajectory file holds one JSON record per line:
+
+    {"type": "header", "sdk_version": ..., "prompt": ...}
+    {"type": "step", "index": 0, "active_url": ..., "image_path": ..., ...}
+    ...
+    {"type": "metadata", "session_id": ..., "act_id": ..., ...}
+
+Screenshots are written as binary sidecar files next to the trajectory file, so
+each step record stays small. The metadata record is appended once the act ends;
+a trajectory without one was interrupted.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import os
+import re
+
+from pydantic import BaseModel
+
+from nova_act.__version__ import VERSION
+from nova_act.impl.trajectory.types import (
+    TrajectoryHeader,
+    TrajectoryMetadata,
+    TrajectoryStepRecord,
+)
+from nova_act.types.state.step import StepWithProgram
+from nova_act.util.logging import setup_logging
+
+_LOGGER = setup_logging(__name__)
+
+_DATA_URL_PREFIX_MATCHER = re.compile(r"data:(image/([a-z]+));base64,")
+
+
+def get_trajectory_image_directory(trajectory_file_path: str) -> str:
+    """Return the sidecar image directory for a trajectory file."""
+    return os.path.splitext(trajectory_file_path)[0] + "_images"
+
+
+def write_trajectory_image(
+    image_directory: str, index: int, image: str, overwrite: bool = True
+) -> tuple[str, str | None]:
+    """Write a step screenshot to its sidecar file.
+
+    Args:
+        image_directory: The sidecar image directory, which must already exist
+        index: The step index
+        image: The screenshot, as a data URL or bare base64
+        overwrite: Whether to rewrite the file if it already exists
+
+    Returns:
+        The image file name and the screenshot's media type (None if it was not a data URL)
+    """
+    media_type: str | None = None
+    extension = "bin"
+    payload = image
+    if prefix_match := _DATA_URL_PREFIX_MATCHER.match(image):
+        media_type, extension = prefix_match.groups()
+        payload = image[prefix_match.end() :]
+
+    image_name = f"step_{index:04d}.{extension}"
+    image_path = os.path.join(image_directory, image_name)
+    if overwrite or not os.path.exists(image_path):
+        with open(image_path, "wb") as f:
+            f.write(base64.b64decode(payload))
+    return image_name, media_type
+
+
+def _dump_record(record_type: str, record: BaseModel) -> str:
+    return json.dumps({"type": record_type, **record.model_dump(mode="json")}) + "\n"
+
+
+def append_trajectory_metadata(trajectory_file_path: str, metadata: TrajectoryMetadata) -> None:
+    """Append the final metadata record to an existing streamed trajectory.
+
+    Does nothing if no steps were streamed to the file.
+    """
+    if not os.path.exists(trajectory_file_path):
+        return
+    with open(trajectory_file_path, "a", encoding="utf-8") as f:
+        f.write(_dump_record("metadata", metadata))
+
+
+class TrajectoryWriter:
+    """Stream an act's steps to a JSON Lines trajectory file as they are taken.
+
+    The file is created (or truncated) on the first step and reopened in append mode for
+    each later one, so every completed step is on disk even if the process crashes.
+    Write failures are logged once and disable the writer; they never fail the act.
+    """
+
+    def __init__(self, file_path: str, prompt: str):
+        self._file_path = file_path
+        self._image_directory = get_trajectory_image_directory(file_path)
+        self._prompt = prompt
+        self._num_steps = 0
+        self._failed = False
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    def append_step(self, step: StepWithProgram) -> None:
+        """Write a step's screenshot and append its record to the trajectory file."""
+        if self._failed:
+            return
+
+        try:
+            index = self._num_steps
+            if index == 0:
+                os.makedirs(self._image_directory, exist_ok=True)
+            image_name, image_media_type = write_trajectory_image(self._image_directory, index, step.model_input.image)
+            record = TrajectoryStepRecord(
+                index=index,
+                active_url=step.model_input.active_url,
+                image_path=os.path.join(os.path.basename(self._image_directory), image_name),
+                image_media_type=image_media_type,
+                simplified_dom=step.model_input.simplified_dom,
+                program=step.program,
+            )
+
+            with open(self._file_path, "a" if index else "w", encoding="utf-8") as f:
+                if index == 0:
+                    f.write(_dump_record("header", TrajectoryHeader(sdk_version=VERSION, prompt=self._prompt)))
+                f.write(_dump_record("step", record))
+            self._num_steps += 1
+        except (OSError, binascii.Error) as e:
+            self._failed = True
+            _LOGGER.warning(f"Failed to write trajectory step to file: {e}")
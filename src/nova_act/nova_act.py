@@ -42,6 +42,7 @@ from nova_act.impl.inputs import (
 )
 from nova_act.impl.run_info_compiler import RunInfoCompiler
 from nova_act.tools.actuator.interface.actuator import ActionType, ActuatorBase
+from nova_act.tools.browser.default.browser_pool import BrowserPool
 from nova_act.tools.browser.default.default_nova_local_browser_actuator import (
     DefaultNovaLocalBrowserActuator,
 )
@@ -75,7 +76,7 @@ from nova_act.types.errors import (
 from nova_act.types.events import EventType, LogType
 from nova_act.types.features import PreviewFeatures, SecurityOptions
 from nova_act.types.guardrail import GuardrailCallable
-from nova_act.types.hooks import StopHook
+from nova_act.types.hooks import ActCompleteHook, StopHook
 from nova_act.types.state.act import Act
 from nova_act.types.workflow import Workflow, get_current_workflow
 from nova_act.types.workflow_run import WorkflowRun
@@ -183,6 +184,7 @@ class NovaAct:
         workflow: Workflow | None = None,
         replayable: bool = False,
         browser_auth: BrowserAuth = None,
+        browser_pool: BrowserPool | None = None,
     ):
         """Initialize a client object.
 
@@ -282,6 +284,11 @@ class NovaAct:
             injection) or ``BrowserSessionProvider`` subclass (for full session persistence).
             Built-in options: ``LocalFileSessionProvider``, ``S3SessionProvider``,
             ``AgentCoreBrowserSessionProvider``. Defaults to None (no authentication).
+        browser_pool: BrowserPool, optional
+            A started BrowserPool to lease an isolated browser context from instead of launching a browser.
+            The pool's browsers determine headless mode and channel, and the page viewport is exactly
+            screen_width x screen_height. Cannot be combined with user_data_dir, profile_directory,
+            playwright_instance or CDP.
         """
         self._workflow_run: WorkflowRun | None = None
 
@@ -357,6 +364,11 @@ class NovaAct:
             ignore_screen_dims_check=ignore_screen_dims_check,
         )
 
+        if browser_pool is not None and user_data_dir:
+            raise ValidationFailed(
+                "Cannot specify a user_data_dir when using a browser pool; use browser_auth to restore a session"
+            )
+
         self._session_user_data_dir_is_temp: bool = False
         if user_data_dir:  # pragma: no cover
             if clone_user_data_dir:
@@ -440,6 +452,7 @@ class NovaAct:
             user_browser_args=user_browser_args,
             security_options=security_options,
             browser_auth_mode=self._browser_auth,
+            browser_pool=browser_pool,
         )
         self._cdp_endpoint_url = cdp_endpoint_url
         self._allowed_file_open_paths = security_options.allowed_file_open_paths
@@ -789,6 +802,16 @@ class NovaAct:
             raise ValueError(f"Stop hook {hook} is not registered.")
         self._stop_hooks.remove(hook)
 
+    def _execute_act_complete_hooks(self, act_id: str) -> None:
+        """Call all registered stop hooks that also implement ActCompleteHook."""
+        for hook in self._stop_hooks:
+            if not isinstance(hook, ActCompleteHook):
+                continue
+            try:
+                hook.on_act_complete(self, act_id)
+            except Exception as e:
+                _LOGGER.error(f"Error in act complete hook {hook}: {e}", exc_info=True)
+
     def _execute_stop_hooks(self) -> None:
         """Call all registered stop hooks."""
         for hook in self._stop_hooks:
@@ -803,6 +826,8 @@ class NovaAct:
             self._dispatcher.cancel_prompt()
             self._actuator.stop()
 
+            self._backend.flush_telemetry()
+
             # Log session-level time worked summary
             if self._session_act_count > 0 and self._session_total_time_worked_s > 0:
                 from nova_act.types.act_metadata import _format_duration
@@ -1068,6 +1093,7 @@ class NovaAct:
                     log_level=LogType.INFO,
                     data=f"** View your act run here: {file_path}",
                 )
+                self._execute_act_complete_hooks(act.id)
 
             # Update act status based on execution result on Finally
             if isinstance(self._backend, (StarburstBackend, SunburstBackend)):
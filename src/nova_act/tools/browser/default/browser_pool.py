@@ -0,0 +1,300 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# WARNING: this file is auto-generated by scripts/generate_sync.py
+# Source: src/nova_act/asyncio/tools/browser/default/browser_pool.py
+# DO NOT EDIT — changes will be overwritten. Modify the async source instead.
+"""Share a few Chromium processes among many NovaAct instances.
+
+By default every NovaAct launches its own Chromium with a persistent user data
+dir. A BrowserPool instead launches ``max_browsers`` processes once and leases
+each NovaAct a fresh BrowserContext (``browser.new_context()``) on the least
+loaded browser. Contexts do not share cookies, storage, cache, viewport, user
+agent or proxy, but they do share the browser's renderer, GPU and network
+processes, which is where most of the per-instance memory and startup time go.
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Type
+
+from install_playwright import install
+from playwright.sync_api import Browser, BrowserContext, Playwright, sync_playwright
+from playwright.sync_api import Error as PlaywrightError
+
+from nova_act.impl.common import should_install_chromium_dependencies
+from nova_act.tools.browser.default.util.user_agent import DEFAULT_USER_AGENT_SUFFIX, detect_user_agent
+from nova_act.types.errors import ClientNotStarted, StartFailed, ValidationFailed
+from nova_act.util.logging import setup_logging
+
+_LOGGER = setup_logging(__name__)
+
+DEFAULT_MAX_BROWSERS = 1
+DEFAULT_MAX_CONTEXTS_PER_BROWSER = 16
+DEFAULT_LEASE_TIMEOUT_S = 60.0
+
+_LEASE_POLL_INTERVAL_S = 0.1
+
+
+@dataclass
+class _PooledBrowser:
+    """One browser process in the pool and the contexts leased from it."""
+
+    browser: Browser | None
+    contexts: list[BrowserContext] = field(default_factory=list)
+    # Leases that picked this browser but have not received their context yet
+    reserved: int = 0
+    # Set while a lease relaunches this browser; other leases skip it meanwhile
+    launching: bool = False
+
+    @property
+    def load(self) -> int:
+        return len(self.contexts) + self.reserved
+
+
+class BrowserPool:
+    """A pool of shared Chromium browsers that leases one isolated BrowserContext per NovaAct.
+
+    Pass a started pool to ``NovaAct(browser_pool=...)``; the NovaAct leases a context on
+    start() and releases (closes) it on stop(). Browsers that crash or disconnect are
+    relaunched on the next lease. Like any Playwright object, a pool must be used from the
+    event loop (or, for the sync API, the thread) that started it.
+
+    Usage::
+
+        async with BrowserPool(max_browsers=2) as pool:
+            agents = [NovaAct(starting_page=url, browser_pool=pool) for url in urls]
+            ...
+    """
+
+    def __init__(
+        self,
+        *,
+        max_browsers: int = DEFAULT_MAX_BROWSERS,
+        max_contexts_per_browser: int = DEFAULT_MAX_CONTEXTS_PER_BROWSER,
+        headless: bool = True,
+        chrome_channel: str | None = None,
+        browser_args: list[str] | None = None,
+        lease_timeout_s: float = DEFAULT_LEASE_TIMEOUT_S,
+        playwright_instance: Playwright | None = None,
+    ):
+        """Initialize a pool. Browsers are launched by start().
+
+        Parameters
+        ----------
+        max_browsers: int
+            Number of browser processes to launch and share.
+        max_contexts_per_browser: int
+            Maximum concurrent leases per browser. Leases beyond max_browsers * max_contexts_per_browser
+            wait for a release.
+        headless: bool
+            Whether to launch the browsers in headless mode. Defaults to True.
+        chrome_channel: str, optional
+            Browser channel to launch. Defaults to the `NOVA_ACT_CHROME_CHANNEL` environment variable, or
+            "chrome", falling back to "chromium" if the channel is not installed.
+        browser_args: list[str], optional
+            Extra command line arguments for every browser. Defaults to `NOVA_ACT_BROWSER_ARGS`.
+        lease_timeout_s: float
+            Seconds a lease waits for a free context slot before raising StartFailed.
+        playwright_instance: Playwright, optional
+            An existing Playwright instance to launch the browsers with
+        """
+        if max_browsers < 1:
+            raise ValidationFailed("max_browsers must be at least 1")
+        if max_contexts_per_browser < 1:
+            raise ValidationFailed("max_contexts_per_browser must be at least 1")
+
+        self._max_browsers = max_browsers
+        self._max_contexts_per_browser = max_contexts_per_browser
+        self._headless = headless
+        self._chrome_channel = str(chrome_channel or os.environ.get("NOVA_ACT_CHROME_CHANNEL", "chrome"))
+        if browser_args is None:
+            browser_args = os.environ.get("NOVA_ACT_BROWSER_ARGS", "").split()
+        self._browser_args = browser_args
+        self._lease_timeout_s = lease_timeout_s
+        self._playwright = playwright_instance
+        self._owns_playwright = playwright_instance is None
+
+        self._browsers: list[_PooledBrowser] = []
+        self._default_user_agent: str | None = None
+
+    @property
+    def started(self) -> bool:
+        """Check if the pool is started."""
+        return bool(self._browsers)
+
+    @property
+    def active_contexts(self) -> int:
+        """Number of contexts currently leased from the pool."""
+        return sum(len(pooled.contexts) for pooled in self._browsers)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of contexts the pool leases at once."""
+        return self._max_browsers * self._max_contexts_per_browser
+
+    def start(self) -> None:
+        """Launch the pool's browsers."""
+        if self.started:
+            _LOGGER.warning("BrowserPool already started, to start over, stop the pool")
+            return
+
+        try:
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+
+            if not os.environ.get("NOVA_ACT_SKIP_PLAYWRIGHT_INSTALL"):
+                with_deps = should_install_chromium_dependencies()
+                if not install(self._playwright.chromium, with_deps=with_deps):
+                    raise StartFailed(
+                        "Failed to install Playwright browser binaries. They can be installed with "
+                        f"`python -m playwright install {'--with-deps ' if with_deps else ''}chromium`, "
+                        "or this step skipped by setting NOVA_ACT_SKIP_PLAYWRIGHT_INSTALL."
+                    )
+
+            for _ in range(self._max_browsers):
+                self._browsers.append(_PooledBrowser(browser=self._launch_browser()))
+            self._default_user_agent = (
+                detect_user_agent(self._playwright.chromium, self._browser_args) + DEFAULT_USER_AGENT_SUFFIX
+            )
+        except Exception as e:
+            self.stop()
+            if isinstance(e, StartFailed):
+                raise
+            raise StartFailed("Failed to start BrowserPool") from e
+
+        _LOGGER.info(f"BrowserPool started {self._max_browsers} browser(s) with channel {self._chrome_channel}")
+
+    def stop(self) -> None:
+        """Close every browser (and so every leased context) in the pool."""
+        for pooled in self._browsers:
+            if pooled.browser is not None:
+                try:
+                    pooled.browser.close()
+                except Exception as e:
+                    _LOGGER.debug(f"Error closing pooled browser: {e}")
+        self._browsers = []
+
+        if self._owns_playwright and self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def __enter__(self) -> "BrowserPool":
+        self.start()
+        return self
+
+    def __exit__(
+        self, exc_type: Type[BaseException] | None, exc_value: BaseException | None, traceback: BaseException | None
+    ) -> None:
+        self.stop()
+
+    def lease(self, **context_options: Any) -> BrowserContext:  # type: ignore[explicit-any]
+        """Create a BrowserContext on the least loaded browser.
+
+        context_options are passed to ``Browser.new_context`` (viewport, user_agent, proxy,
+        ignore_https_errors, record_video_dir, ...). user_agent defaults to the detected
+        Chromium user agent with the NovaAct suffix, as for a NovaAct without a pool. Waits up to lease_timeout_s for a free slot.
+        """
+        if not self.started:
+            raise ClientNotStarted("BrowserPool not started, run start() to start")
+
+        context_options.setdefault("user_agent", self._default_user_agent)
+
+        deadline = time.monotonic() + self._lease_timeout_s
+        while (pooled := self._reserve()) is None:
+            if time.monotonic() >= deadline:
+                raise StartFailed(
+                    f"No BrowserPool slot became free within {self._lease_timeout_s}s "
+                    f"({self.capacity} contexts leased); increase max_browsers or max_contexts_per_browser"
+                )
+            time.sleep(_LEASE_POLL_INTERVAL_S)
+
+        try:
+            if pooled.launching:
+                try:
+                    pooled.browser = self._launch_browser()
+                finally:
+                    pooled.launching = False
+            assert pooled.browser is not None
+            context = pooled.browser.new_context(**context_options)
+        finally:
+            pooled.reserved -= 1
+
+        pooled.contexts.append(context)
+        return context
+
+    def release(self, context: BrowserContext) -> None:
+        """Close a leased context and free its slot."""
+        for pooled in self._browsers:
+            if context in pooled.contexts:
+                pooled.contexts.remove(context)
+                break
+        try:
+            context.close()
+        except Exception as e:
+            # Expected when the browser crashed underneath the lease.
+            _LOGGER.debug(f"Error closing pooled context: {e}")
+
+    def _reserve(self) -> _PooledBrowser | None:
+        """Pick and reserve a slot on the least loaded browser, or None if the pool is full.
+
+        Runs without awaiting, so concurrent leases cannot both claim the last slot.
+        """
+        for pooled in self._browsers:
+            if pooled.browser is not None and not pooled.browser.is_connected():
+                _LOGGER.warning(
+                    f"Pooled browser disconnected with {len(pooled.contexts)} context(s) leased; relaunching"
+                )
+                pooled.browser = None
+                pooled.contexts.clear()
+
+        available = [
+            pooled for pooled in self._browsers if not pooled.launching and pooled.load < self._max_contexts_per_browser
+        ]
+        if not available:
+            return None
+
+        # Prefer running browsers; relaunch a crashed one only when the others are full.
+        pooled = min(available, key=lambda candidate: (candidate.browser is None, candidate.load))
+        pooled.reserved += 1
+        if pooled.browser is None:
+            pooled.launching = True
+        return pooled
+
+    def _launch_browser(self) -> Browser:
+        """Launch one browser on the pool's channel, falling back to Chromium."""
+        if self._playwright is None:
+            raise ValueError("Playwright instance is not initialized")
+
+        launch_options: dict[str, Any] = {  # type: ignore[explicit-any]
+            "headless": self._headless,
+            "args": [
+                "--disable-blink-features=AutomationControlled",  # Suppress navigator.webdriver flag
+                *(["--headless=new"] if self._headless else []),
+                "--silent-debugger-extension-api",
+                *self._browser_args,
+            ],
+            "ignore_default_args": ["--enable-automation", "--hide-scrollbars"],
+            "channel": self._chrome_channel,
+        }
+        if self._chrome_channel != "chromium":
+            try:
+                return self._playwright.chromium.launch(**launch_options)
+            except PlaywrightError:
+                _LOGGER.warning(
+                    f"BrowserPool is unable to launch `chrome_channel='{self._chrome_channel}'` and is "
+                    "falling back to 'chromium'."
+                )
+                self._chrome_channel = launch_options["channel"] = "chromium"
+        return self._playwright.chromium.launch(**launch_options)
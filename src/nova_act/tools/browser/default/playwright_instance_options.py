@@ -19,6 +19,7 @@ from dataclasses import dataclass, field
 from playwright.sync_api import Playwright
 
 from nova_act.browser_auth import BrowserAuth
+from nova_act.tools.browser.default.browser_pool import BrowserPool
 from nova_act.types.features import SecurityOptions
 
 _DEFAULT_GO_TO_URL_TIMEOUT = 60
@@ -46,8 +47,12 @@ class PlaywrightInstanceOptions:
     user_browser_args: list[str] | None = None
     security_options: SecurityOptions = field(default_factory=SecurityOptions)
     browser_auth_mode: BrowserAuth = None
+    browser_pool: BrowserPool | None = None
 
     def __post_init__(self) -> None:
-        self.owns_playwright = self.maybe_playwright is None
-        self.owns_context = self.cdp_endpoint_url is None and not self.use_default_chrome_browser
+        # Pooled contexts belong to the pool's Playwright and are released to it, not closed here
+        self.owns_playwright = self.maybe_playwright is None and self.browser_pool is None
+        self.owns_context = (
+            self.cdp_endpoint_url is None and not self.use_default_chrome_browser and self.browser_pool is None
+        )
         self.go_to_url_timeout = 1000 * (self.go_to_url_timeout or _DEFAULT_GO_TO_URL_TIMEOUT)
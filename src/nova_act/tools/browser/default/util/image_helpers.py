@@ -15,7 +15,10 @@
 # Source: src/nova_act/asyncio/tools/browser/default/util/image_helpers.py
 # DO NOT EDIT — changes will be overwritten. Modify the async source instead.
 import base64
+import binascii
 import io
+import struct
+from dataclasses import dataclass
 from typing import Literal, Union
 
 import numpy as np
@@ -26,6 +29,23 @@ from playwright.sync_api import Page
 from nova_act.tools.browser.default.util.bbox_parser import parse_bbox_string
 from nova_act.tools.browser.interface.types.dimensions_dict import DimensionsDict
 
+# Base64 characters decoded when probing an image header (a multiple of 4). Covers the PNG
+# IHDR chunk and the segments ahead of the frame header in browser JPEG screenshots.
+_HEADER_PROBE_BASE64_CHARS = 4096
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers (SOF0-SOF15, except DHT, JPG and DAC, which share the range)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+@dataclass(frozen=True)
+class ImageMetadata:
+    """Dimensions and encoding of an image, as read from its header."""
+
+    width: int
+    height: int
+    format: Literal["jpeg", "png"]
+    byte_length: int
+
 
 def get_source_image_from_data_url(screenshot_data_url: str) -> Image.Image:
     """
@@ -48,8 +68,89 @@ def convert_image_to_data_url(image: Image.Image, format_type: str = "jpeg", qua
     """
     buffer = io.BytesIO()
     image.save(buffer, format=format_type, quality=quality)
-    img_str = base64.b64encode(buffer.getvalue()).decode("utf-8")
-    return f"data:image/{format_type.lower()};base64,{img_str}"
+    return encode_data_url(buffer.getvalue(), format_type)
+
+
+def encode_data_url(image_bytes: bytes, format_type: str = "jpeg") -> str:
+    """
+    Encode raw image bytes as a base64 data URL.
+    """
+    base64_str = base64.b64encode(image_bytes).decode("utf-8")
+    return f"data:image/{format_type.lower()};base64,{base64_str}"
+
+
+def get_image_size(image_bytes: bytes) -> tuple[int, int]:
+    """
+    Read the (width, height) of an encoded image without decoding its pixel data.
+    """
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        return image.size
+
+
+def probe_image_metadata(data_url: str) -> ImageMetadata | None:
+    """
+    Read a base64 image data URL's metadata by decoding only the first bytes of the image.
+
+    Returns None if the URL is not a base64 data URL, or the image is not a JPEG or PNG
+    whose dimensions appear within the probed bytes; callers then decode the full image.
+    """
+    _, separator, payload = data_url.partition("base64,")
+    if not separator:
+        return None
+    try:
+        header = base64.b64decode(payload[:_HEADER_PROBE_BASE64_CHARS], validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    byte_length = len(payload) * 3 // 4 - (len(payload) - len(payload.rstrip("=")))
+
+    if header.startswith(_PNG_SIGNATURE) and header[12:16] == b"IHDR" and len(header) >= 24:
+        width, height = struct.unpack(">II", header[16:24])
+        return ImageMetadata(width=width, height=height, format="png", byte_length=byte_length)
+
+    if header.startswith(b"\xff\xd8"):
+        # Walk the marker segments up to the start-of-frame, which holds the dimensions.
+        offset = 2
+        while offset + 9 <= len(header):
+            if header[offset] != 0xFF:
+                return None
+            marker = header[offset + 1]
+            if marker == 0xFF:  # Fill byte
+                offset += 1
+            elif marker in _JPEG_SOF_MARKERS:
+                height, width = struct.unpack(">HH", header[offset + 5 : offset + 9])
+                return ImageMetadata(width=width, height=height, format="jpeg", byte_length=byte_length)
+            elif marker == 0x01 or 0xD0 <= marker <= 0xD8:  # Markers without a length
+                offset += 2
+            else:
+                (segment_length,) = struct.unpack(">H", header[offset + 2 : offset + 4])
+                offset += 2 + segment_length
+
+    return None
+
+
+def resize_image_bytes(image_bytes: bytes, dimensions: DimensionsDict, quality: int = 90) -> bytes:
+    """
+    Resizes encoded image bytes to the specified dimensions and re-encodes them as JPEG.
+
+    Args:
+        image_bytes: The encoded source image.
+        dimensions: Dictionary with width and height keys.
+        quality: The JPEG quality (0-100) of the resized image.
+
+    Returns:
+        The resized image as JPEG bytes.
+    """
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as source_image:
+            resized_image = source_image.convert("RGB").resize(
+                (dimensions["width"], dimensions["height"]),
+                Image.Resampling.LANCZOS,
+            )
+        buffer = io.BytesIO()
+        resized_image.save(buffer, format="jpeg", quality=quality)
+        return buffer.getvalue()
+    except Exception as e:
+        raise RuntimeError(f"Unable to resize image: {str(e)}")
 
 
 def resize_image(screenshot_data_url: str, dimensions: DimensionsDict) -> str:
@@ -79,36 +180,55 @@ def resize_image(screenshot_data_url: str, dimensions: DimensionsDict) -> str:
         raise RuntimeError(f"Unable to resize image: {str(e)}")
 
 
-def take_screenshot_as_data_url(
+def take_screenshot_as_bytes(
     page: Page,
     full_page: bool = False,
     format_type: Literal["jpeg", "png"] = "jpeg",
     quality: int = 100,
-) -> str:
+    scale: Literal["css", "device"] = "device",
+) -> bytes:
     """
-    Takes a screenshot using Playwright and returns it as a data URL.
+    Takes a screenshot using Playwright and returns the encoded image bytes.
 
     Args:
         page: The Playwright Page object.
         full_page: Whether to take a screenshot of the full page or just the viewport.
         format_type: The format of the screenshot (jpeg or png).
         quality: The quality of the screenshot (0-100), only applies to jpeg format.
+        scale: "css" captures one image pixel per CSS pixel, so the browser scales the frame
+            to the viewport size before encoding; "device" captures at device pixel ratio.
 
     Returns:
-        A data URL of the screenshot, base64 encoded.
+        The encoded screenshot bytes.
     """
-    # Take the screenshot using Playwright
-    screenshot_bytes = page.screenshot(
+    return page.screenshot(
         full_page=full_page,
         type=format_type,
         quality=quality if format_type == "jpeg" else None,
+        scale=scale,
     )
 
-    # Convert the bytes to a base64 string
-    base64_str = base64.b64encode(screenshot_bytes).decode("utf-8")
 
-    # Create and return the data URL
-    return f"data:image/{format_type};base64,{base64_str}"
+def take_screenshot_as_data_url(
+    page: Page,
+    full_page: bool = False,
+    format_type: Literal["jpeg", "png"] = "jpeg",
+    quality: int = 100,
+) -> str:
+    """
+    Takes a screenshot using Playwright and returns it as a data URL.
+
+    Args:
+        page: The Playwright Page object.
+        full_page: Whether to take a screenshot of the full page or just the viewport.
+        format_type: The format of the screenshot (jpeg or png).
+        quality: The quality of the screenshot (0-100), only applies to jpeg format.
+
+    Returns:
+        A data URL of the screenshot, base64 encoded.
+    """
+    screenshot_bytes = take_screenshot_as_bytes(page, full_page, format_type, quality)
+    return encode_data_url(screenshot_bytes, format_type)
 
 
 def compare_images(image1_data_url: str, image2_data_url: str, threshold: int = 10) -> float:
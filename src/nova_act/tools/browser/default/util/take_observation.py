@@ -21,11 +21,38 @@ from datetime import datetime
 from playwright.sync_api import Page
 
 from nova_act.tools.browser.default.util.image_helpers import (
-    resize_image,
-    take_screenshot_as_data_url,
+    encode_data_url,
+    get_image_size,
+    resize_image_bytes,
+    take_screenshot_as_bytes,
 )
 from nova_act.tools.browser.interface.types.dimensions_dict import DimensionsDict
 
+OBSERVATION_JPEG_QUALITY = 90
+
+
+def take_observation_bytes(page: Page, dimensions: DimensionsDict | None = None) -> bytes:
+    """
+    Captures the observation screenshot as JPEG bytes, encoded exactly once.
+
+    When dimensions are given, the browser renders the frame at CSS pixel scale so it already
+    matches the viewport size; the image is only resized locally if the capture still differs.
+
+    Args:
+        page: The Playwright Page object.
+        dimensions: Dictionary with width and height keys for sizing the image.
+
+    Returns:
+        The JPEG-encoded screenshot bytes.
+    """
+    if dimensions is None:
+        return take_screenshot_as_bytes(page)
+
+    screenshot_bytes = take_screenshot_as_bytes(page, quality=OBSERVATION_JPEG_QUALITY, scale="css")
+    if get_image_size(screenshot_bytes) != (dimensions["width"], dimensions["height"]):
+        screenshot_bytes = resize_image_bytes(screenshot_bytes, dimensions, OBSERVATION_JPEG_QUALITY)
+    return screenshot_bytes
+
 
 def take_observation(page: Page, dimensions: DimensionsDict | None = None, save_screenshot: bool = False) -> str:
     """
@@ -38,10 +65,8 @@ def take_observation(page: Page, dimensions: DimensionsDict | None = None, save_
     Returns:
         A data URL of the resized screenshot.
     """
-    # Take a screenshot and get it as a data URL
-    screenshot_data_url = take_screenshot_as_data_url(page)
-    if dimensions is not None:
-        screenshot_data_url = resize_image(screenshot_data_url, dimensions)
+    screenshot_bytes = take_observation_bytes(page, dimensions)
+    screenshot_data_url = encode_data_url(screenshot_bytes, "jpeg")
 
     if save_screenshot:
         save_data_url_to_file(screenshot_data_url, f"screenshot_{datetime.now().isoformat()}.jpg")
@@ -0,0 +1,49 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# WARNING: this file is auto-generated by scripts/generate_sync.py
+# Source: src/nova_act/asyncio/tools/browser/default/util/user_agent.py
+# DO NOT EDIT — changes will be overwritten. Modify the async source instead.
+from playwright.sync_api import BrowserType
+
+from nova_act.util.common_js_expressions import Expressions
+from nova_act.util.user_agent_cache import cache_user_agent, get_cached_user_agent, user_agent_cache_key
+
+DEFAULT_USER_AGENT_SUFFIX = " Agent-NovaAct/0.9"
+
+
+def detect_user_agent(chromium: BrowserType, browser_args: list[str]) -> str:
+    """Return the browser's default user agent, without the headless marker.
+
+    Detection launches a throwaway headless browser, so the result is cached per
+    browser build (in-process and on disk) and only the first start pays for it.
+
+    Args:
+        chromium: Playwright's Chromium browser type
+        browser_args: Extra browser args the browser is launched with
+    """
+    cache_key = user_agent_cache_key(chromium.executable_path, browser_args)
+    user_agent = get_cached_user_agent(cache_key)
+    if user_agent is not None:
+        return user_agent
+
+    browser = chromium.launch(headless=True, args=["--headless=new", *browser_args])
+    try:
+        page = browser.new_page()
+        user_agent = str(page.evaluate(Expressions.GET_USER_AGENT.value))
+    finally:
+        browser.close()
+    # Replace the headless chrome bit since it's a detection artifact.
+    user_agent = user_agent.replace("HeadlessChrome/", "Chrome/")
+    cache_user_agent(cache_key, user_agent)
+    return user_agent
@@ -20,9 +20,11 @@ from datetime import datetime, timezone
 from playwright.sync_api import Page
 from typing_extensions import TypedDict
 
-from nova_act.tools.browser.default.util.image_helpers import (
-    compare_images,
-    take_screenshot_as_data_url,
+from nova_act.tools.browser.default.util.image_helpers import encode_data_url
+from nova_act.tools.browser.default.util.settle_detection import (
+    SettleDetectorBase,
+    SettleSample,
+    ThumbnailSettleDetector,
 )
 from nova_act.tools.browser.default.util.take_observation import save_data_url_to_file
 from nova_act.util.logging import setup_logging
@@ -63,58 +65,65 @@ def consecutive_identical_checks(
     page: Page,
     options: ConsecutiveChecksOptions,
     save_screenshots: bool = False,
-) -> None:
+    detector: SettleDetectorBase | None = None,
+) -> SettleSample | None:
     """
     This function checks if the page has been unchanged for a certain number of checks.
     It will return when either:
-    1. The max timeout has been reached
-    2. The page has been stable for the specified number of checks
+    1. The max timeout has been reached, returning None
+    2. The page has been stable for the specified number of checks, returning the last stable sample
+
+    Each poll is delegated to `detector`, which defaults to a ThumbnailSettleDetector.
     """
+    detector = detector or ThumbnailSettleDetector()
+    detector.reset()
 
     start_time = datetime.now(timezone.utc)
     consecutive_stable_count = 0
-    previous_screenshot = None
 
     while True:
         timestamp = datetime.now().isoformat()
+        elapsed_ms = (datetime.now().timestamp() - start_time.timestamp()) * 1000
 
         # Check timeout
         if (
             options["max_timeout_ms"] is not None
             and options["max_timeout_ms"] > 0
-            and (datetime.now().timestamp() - start_time.timestamp()) * 1000 >= options["max_timeout_ms"]
+            and elapsed_ms >= options["max_timeout_ms"]
         ):
-            _LOGGER.debug(f"[CONSECUTIVE_CHECK] {timestamp} - TIMEOUT REACHED")
-            return
+            _LOGGER.debug(f"[CONSECUTIVE_CHECK] {timestamp} - TIMEOUT REACHED after {elapsed_ms:.0f}ms")
+            return None
 
         _LOGGER.debug(
             f"[CONSECUTIVE_CHECK] {timestamp} - Attempt {consecutive_stable_count}, "
             f"Threshold: {options['percent_difference_threshold']}%"
         )
 
-        # Take screenshot
-        screenshot = take_screenshot_as_data_url(page)
-        if screenshot is None:
-            _LOGGER.debug(f"[CONSECUTIVE_CHECK] {timestamp} - SCREENSHOT FAILED")
-            raise RuntimeError("Attempted to take a screenshot, but failed. Please try again.")
+        # Take and compare screenshot
+        try:
+            sample = detector.sample(page)
+        except Exception as e:
+            _LOGGER.debug(f"[CONSECUTIVE_CHECK] {timestamp} - SCREENSHOT FAILED: {e}")
+            raise RuntimeError("Attempted to take a screenshot, but failed. Please try again.") from e
 
         if save_screenshots:
-            save_data_url_to_file(screenshot, f"screenshot_{consecutive_stable_count}.jpeg")
+            save_data_url_to_file(
+                encode_data_url(sample.screenshot, "jpeg"), f"screenshot_{consecutive_stable_count}.jpeg"
+            )
 
         # First iteration - just wait and continue
-        if previous_screenshot is None:
+        if sample.percent_difference is None:
             _LOGGER.debug(
-                f"[CONSECUTIVE_CHECK] {timestamp} - FIRST ATTEMPT, waiting {options['polling_interval_ms']}ms"
+                f"[CONSECUTIVE_CHECK] {timestamp} - FIRST ATTEMPT ({sample.latency_ms:.1f}ms), "
+                f"waiting {options['polling_interval_ms']}ms"
             )
-            previous_screenshot = screenshot
             delay(options["polling_interval_ms"])
             continue
 
-        # Compare with previous screenshot
-        percent_difference = compare_images(previous_screenshot, screenshot)
+        percent_difference = sample.percent_difference
         _LOGGER.debug(
             f"[CONSECUTIVE_CHECK] {timestamp} - Attempt {consecutive_stable_count}: "
-            f"{percent_difference:.2f}% difference"
+            f"{percent_difference:.2f}% difference ({sample.latency_ms:.1f}ms)"
         )
 
         # If difference is too high, reset counter
@@ -126,12 +135,13 @@ def consecutive_identical_checks(
 
             # Check if we've reached required stable checks
             if consecutive_stable_count >= options["number_of_checks"]:
+                elapsed_ms = (datetime.now().timestamp() - start_time.timestamp()) * 1000
                 _LOGGER.debug(
-                    f"[CONSECUTIVE_CHECK] {timestamp} - COMPLETED after {consecutive_stable_count} stable checks"
+                    f"[CONSECUTIVE_CHECK] {timestamp} - COMPLETED after {consecutive_stable_count} stable checks "
+                    f"in {elapsed_ms:.0f}ms"
                 )
-                return
+                return sample
 
-        previous_screenshot = screenshot
         delay(options["polling_interval_ms"])
 
 
@@ -139,10 +149,11 @@ def wait_for_page_to_settle(
     page: Page,
     options: ConsecutiveChecksOptions,
     save_screenshots: bool = False,
-) -> None:
+    detector: SettleDetectorBase | None = None,
+) -> SettleSample | None:
     try:
         page.wait_for_load_state("load")
     except Exception as e:
         _LOGGER.debug(f"Failed to wait for page to load. Error: {e}")
         pass
-    consecutive_identical_checks(page, options, save_screenshots)
+    return consecutive_identical_checks(page, options, save_screenshots, detector)
@@ -36,11 +36,11 @@ def build_trajectory_file_path(session_logs_directory: str, act_id: str, prompt:
         prompt: The act prompt text.
 
     Returns:
-        The full file path for the trajectory JSON file.
+        The full file path for the streamed (JSON Lines) trajectory file.
     """
     prompt_filename_snippet = _safe_filename(prompt, 30)
     file_name_prefix = f"act_{act_id}_{prompt_filename_snippet}"
-    trajectory_file_name = f"{file_name_prefix}_trajectory.json"
+    trajectory_file_name = f"{file_name_prefix}_trajectory.jsonl"
     return os.path.join(session_logs_directory, trajectory_file_name)
 
 
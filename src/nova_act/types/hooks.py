@@ -14,7 +14,7 @@
 # WARNING: this file is auto-generated by scripts/generate_sync.py
 # Source: src/nova_act/asyncio/types/hooks.py
 # DO NOT EDIT — changes will be overwritten. Modify the async source instead.
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from nova_act.nova_act import NovaAct
@@ -36,3 +36,24 @@ class StopHook(Protocol):
             The NovaAct instance that is being stopped
         """
         ...
+
+
+@runtime_checkable
+class ActCompleteHook(Protocol):
+    """Interface for stop hooks that also want to be notified when each act finishes.
+
+    Stop hooks implementing this method are called after the act's run info files
+    (HTML report, traces and trajectory) have been written to the session logs directory.
+    """
+
+    def on_act_complete(self, nova_act: "NovaAct", act_id: str) -> None:
+        """Called after an act finishes and its run info files are written.
+
+        Parameters
+        ----------
+        nova_act : NovaAct
+            The NovaAct instance that ran the act
+        act_id : str
+            The ID of the act that finished
+        """
+        ...
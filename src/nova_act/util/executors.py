@@ -0,0 +1,73 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared thread pools that keep blocking work off the async SDK's event loop.
+
+Many NovaAct instances can share one event loop, so a blocking call in any of them
+stalls all of them. Two pools are used:
+
+- Backend calls (model round trips over blocking HTTP clients) are I/O bound, so
+  their pool is sized for many concurrent agents rather than for the CPU count,
+  which caps asyncio's default executor.
+- Image work (decode, resize, compare) is CPU bound. PIL and numpy release the GIL
+  for most of it, so a small pool lets agents overlap it without oversubscribing
+  the CPU.
+
+Both run the function in a copy of the caller's context, like `asyncio.to_thread`,
+so session logging state carries over.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, ParamSpec, TypeVar
+
+BACKEND_EXECUTOR_MAX_WORKERS = 64
+IMAGE_EXECUTOR_MAX_WORKERS = max(1, min(8, os.cpu_count() or 1))
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Return the named shared executor, creating it on first use."""
+    with _executors_lock:
+        if name not in _executors:
+            _executors[name] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"nova-act-{name}")
+        return _executors[name]
+
+
+async def _run_in_executor(
+    executor: ThreadPoolExecutor, func: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs
+) -> _T:
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, functools.partial(context.run, func, *args, **kwargs))
+
+
+async def run_backend_call(func: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs) -> _T:
+    """Run a blocking backend call (e.g. a model step) on the shared backend executor."""
+    executor = _get_executor("backend", BACKEND_EXECUTOR_MAX_WORKERS)
+    return await _run_in_executor(executor, func, *args, **kwargs)
+
+
+async def run_image_work(func: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs) -> _T:
+    """Run CPU-bound image work (decode, resize, compare) on the shared image executor."""
+    executor = _get_executor("image", IMAGE_EXECUTOR_MAX_WORKERS)
+    return await _run_in_executor(executor, func, *args, **kwargs)
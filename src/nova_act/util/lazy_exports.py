@@ -0,0 +1,62 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lazy package exports, so importing one submodule does not import a package's whole API.
+
+A package lists its public names and where they live, then installs module-level
+``__getattr__`` and ``__dir__`` hooks (PEP 562) that import each name's module on first
+access. Static type checkers do not follow the hooks, so packages keep a matching
+``if TYPE_CHECKING:`` import block.
+"""
+
+import importlib
+from collections.abc import Mapping
+
+
+def install(module_globals: dict[str, object], exports: Mapping[str, str]) -> None:
+    """Install lazy exports into a package's namespace.
+
+    Args:
+        module_globals: The package's ``globals()``
+        exports: Public names mapped to the module defining them, as ``"module"`` when the
+            attribute has the same name or ``"module:attribute"`` to re-export it under a new name
+
+    Raises:
+        ImportError: If a name in the package's ``__all__`` is neither defined nor exported
+    """
+    package = module_globals["__name__"]
+    targets: dict[str, tuple[str, str]] = {}
+    for name, target in exports.items():
+        module_name, _, attribute = target.partition(":")
+        targets[name] = (module_name, attribute or name)
+
+    declared = module_globals.get("__all__", [])
+    assert isinstance(declared, list)
+    missing = [name for name in declared if name not in targets and name not in module_globals]
+    if missing:
+        raise ImportError(f"{package}.__all__ lists names that are not exported: {', '.join(missing)}")
+
+    def __getattr__(name: str) -> object:
+        try:
+            module_name, attribute = targets[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module_name), attribute)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*module_globals, *targets})
+
+    module_globals["__getattr__"] = __getattr__
+    module_globals["__dir__"] = __dir__
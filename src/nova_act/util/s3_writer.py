@@ -12,18 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from boto3.session import Session
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from mypy_boto3_s3.service_resource import Bucket
 
 from nova_act import NovaAct
-from nova_act.types.hooks import StopHook
+from nova_act.types.hooks import ActCompleteHook, StopHook
 from nova_act.util.os_path import safe_relative_path
 from nova_act.util.s3_writer_errors import S3WriterBucketNotFoundError, S3WriterError, S3WriterPermissionError
 
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MULTIPART_THRESHOLD_BYTES = 8 * 1024 * 1024
+DEFAULT_MULTIPART_CHUNKSIZE_BYTES = 8 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 4
 
-class S3Writer(StopHook):
+
+class S3Writer(StopHook, ActCompleteHook):
     """A convenience utility class for writing NovaAct session files to S3.
 
     This class implements the StopHook protocol and can be registered with a NovaAct
@@ -38,6 +47,11 @@ class S3Writer(StopHook):
     - S3WriterPermissionError: Raised when there are permission issues with S3 operations
     - S3WriterError: Base class for all S3Writer-related errors
 
+    Files are uploaded concurrently by a bounded thread pool, and files larger than the
+    multipart threshold are split into parts that are uploaded in parallel. In incremental
+    mode each act's run info files are uploaded as soon as the act finishes; the remaining
+    session files are uploaded when the NovaAct instance stops.
+
     See the sample script in src/samples/s3_writer_example.py for usage examples.
     """
 
@@ -47,6 +61,10 @@ class S3Writer(StopHook):
         s3_bucket_name: str,
         s3_prefix: str = "",
         metadata: dict[str, str] | None = None,
+        incremental: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        multipart_threshold_bytes: int = DEFAULT_MULTIPART_THRESHOLD_BYTES,
+        multipart_chunksize_bytes: int = DEFAULT_MULTIPART_CHUNKSIZE_BYTES,
     ):
         """Initialize the S3Writer.
 
@@ -61,11 +79,20 @@ class S3Writer(StopHook):
             The prefix is used exactly as provided.
         metadata : dict, optional
             A dictionary of metadata key-value pairs to apply to all uploaded S3 objects
+        incremental : bool, optional
+            Upload each act's run info files as soon as the act finishes, instead of
+            uploading everything when the NovaAct instance stops
+        max_concurrency : int, optional
+            The maximum number of files uploaded in parallel
+        multipart_threshold_bytes : int, optional
+            Files at least this large are uploaded with multipart uploads
+        multipart_chunksize_bytes : int, optional
+            The size of each part in a multipart upload
 
         Raises
         ------
         ValueError
-            If boto_session is not provided
+            If boto_session is not provided, or max_concurrency is less than 1
         S3WriterBucketNotFoundError
             If the specified bucket does not exist
         S3WriterPermissionError
@@ -75,12 +102,31 @@ class S3Writer(StopHook):
         """
         if boto_session is None:
             raise ValueError("boto_session must be provided")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
 
         self._boto_session = boto_session
         self._s3_bucket_name = s3_bucket_name
         self._s3_prefix = s3_prefix
-        self._s3_resource = self._boto_session.resource("s3")
+        # Size the connection pool for every file and multipart part that may be in flight at once
+        self._s3_resource = self._boto_session.resource(
+            "s3", config=Config(max_pool_connections=max_concurrency * MULTIPART_MAX_CONCURRENCY)
+        )
         self._metadata = metadata or {}
+        self._incremental = incremental
+        self._max_concurrency = max_concurrency
+        self._transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold_bytes,
+            multipart_chunksize=multipart_chunksize_bytes,
+            max_concurrency=MULTIPART_MAX_CONCURRENCY,
+        )
+
+        # Upload state shared between the caller and the upload threads
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending_uploads: list[Future[None]] = []
+        # S3 key -> (size, mtime) of the local file last uploaded to it
+        self._uploaded: dict[str, tuple[int, int]] = {}
 
         # Check if the bucket exists
         self._check_bucket_exists()
@@ -185,21 +231,79 @@ class S3Writer(StopHook):
 
         self._log_upload_start(nova_act.get_session_id())
 
-        bucket = self._s3_resource.Bucket(self._s3_bucket_name)
-
         for root, _, files in os.walk(nova_act.get_logs_directory()):
             for file in files:
-                local_path = os.path.join(root, file)
-                # Calculate relative path for S3 key
-                relative_path = safe_relative_path(local_path, nova_act.get_session_logs_directory())
+                self._submit_upload(nova_act, os.path.join(root, file))
 
-                # Construct S3 key using the prefix exactly as provided
-                s3_key = self._construct_s3_key(nova_act.get_session_id(), relative_path)
+        self._wait_for_uploads()
+        self._log_upload_success()
 
-                # Upload file
-                self._upload_file_to_s3(bucket, local_path, s3_key)
+    def on_act_complete(self, nova_act: NovaAct, act_id: str) -> None:
+        """Upload an act's run info files in the background when incremental mode is enabled.
 
-        self._log_upload_success()
+        Parameters
+        ----------
+        nova_act : NovaAct
+            The NovaAct instance that ran the act
+        act_id : str
+            The ID of the act that finished
+        """
+        if not self._incremental or nova_act.get_session_id() is None:
+            return
+
+        # Run info files and directories are all named act_<act id>_<prompt snippet>...
+        session_logs_directory = nova_act.get_session_logs_directory()
+        act_file_prefix = f"act_{act_id}_"
+        for name in os.listdir(session_logs_directory):
+            if not name.startswith(act_file_prefix):
+                continue
+            path = os.path.join(session_logs_directory, name)
+            if os.path.isfile(path):
+                self._submit_upload(nova_act, path)
+                continue
+            for root, _, files in os.walk(path):
+                for file in files:
+                    self._submit_upload(nova_act, os.path.join(root, file))
+
+    def _submit_upload(self, nova_act: NovaAct, local_path: str) -> None:
+        """Queue a file for upload, skipping it if it is unchanged since it was last uploaded."""
+        # Calculate relative path for S3 key
+        relative_path = safe_relative_path(local_path, nova_act.get_session_logs_directory())
+
+        # Construct S3 key using the prefix exactly as provided
+        s3_key = self._construct_s3_key(nova_act.get_session_id(), relative_path)
+
+        try:
+            stat = os.stat(local_path)
+        except OSError as e:
+            print(f"Error uploading {local_path}: {e}")
+            return
+        file_version = (stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            if self._uploaded.get(s3_key) == file_version:
+                return
+            self._uploaded[s3_key] = file_version
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency, thread_name_prefix="nova-act-s3-writer"
+                )
+            self._pending_uploads.append(self._executor.submit(self._upload_file_to_s3, local_path, s3_key))
+
+    def _wait_for_uploads(self) -> None:
+        """Wait for all queued uploads and shut down the upload threads."""
+        with self._lock:
+            pending_uploads, self._pending_uploads = self._pending_uploads, []
+            executor, self._executor = self._executor, None
+
+        wait(pending_uploads)
+        if executor is not None:
+            executor.shutdown()
+
+        # Report unexpected upload errors without failing the remaining uploads
+        for upload in pending_uploads:
+            if (error := upload.exception()) is not None:
+                print(f"Error uploading to s3://{self._s3_bucket_name}: {error}")
 
     def _construct_s3_key(self, session_id: str, relative_path: str) -> str:
         """Construct an S3 key from the session ID and relative path.
@@ -224,13 +328,11 @@ class S3Writer(StopHook):
         else:
             return f"{session_id}/{relative_path}"
 
-    def _upload_file_to_s3(self, bucket: Bucket, local_path: str, s3_key: str) -> None:
+    def _upload_file_to_s3(self, local_path: str, s3_key: str) -> None:
         """Upload a file to S3 with error handling.
 
         Parameters
         ----------
-        bucket
-            The S3 bucket resource
         local_path : str
             The local path of the file to upload
         s3_key : str
@@ -238,25 +340,36 @@ class S3Writer(StopHook):
         """
         try:
             extra_args = self._prepare_extra_s3_args()
-            bucket.upload_file(local_path, s3_key, ExtraArgs=extra_args)
+            # The low-level client is thread-safe, unlike resource objects
+            self._s3_resource.meta.client.upload_file(
+                local_path, self._s3_bucket_name, s3_key, ExtraArgs=extra_args, Config=self._transfer_config
+            )
             print(f"Uploaded {local_path} to s3://{self._s3_bucket_name}/{s3_key}")
-        except ClientError as e:
+        except (ClientError, S3UploadFailedError) as e:
+            # Allow a later sweep to retry the file
+            with self._lock:
+                self._uploaded.pop(s3_key, None)
             self._handle_upload_error(e, local_path, s3_key)
 
-    def _handle_upload_error(self, e: ClientError, local_path: str, s3_key: str) -> None:
+    def _handle_upload_error(self, e: ClientError | S3UploadFailedError, local_path: str, s3_key: str) -> None:
         """Handle errors that occur during file upload to S3.
 
         Parameters
         ----------
-        e : ClientError
-            The boto3 ClientError that occurred
+        e : ClientError or S3UploadFailedError
+            The error that occurred; upload_file wraps service errors in S3UploadFailedError
         local_path : str
             The local path of the file being uploaded
         s3_key : str
             The S3 key being used for the file
         """
-        error_code = e.response.get("Error", {}).get("Code", "")
-        error_message = e.response.get("Error", {}).get("Message", "")
+        # S3UploadFailedError is raised while handling the ClientError it wraps
+        client_error = e if isinstance(e, ClientError) else e.__context__
+        if isinstance(client_error, ClientError):
+            error_code = client_error.response.get("Error", {}).get("Code", "")
+            error_message = client_error.response.get("Error", {}).get("Message", "")
+        else:
+            error_code, error_message = "", str(e)
 
         if error_code == "AccessDenied":
             error_msg = (
@@ -11,9 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import re
 import socket
 import ssl
+import threading
+import time
 from urllib.parse import urlparse, urlunparse
 
 import certifi
@@ -23,6 +26,12 @@ from nova_act.types.errors import InvalidCertificate, InvalidURL
 from nova_act.types.guardrail import GuardrailCallable, GuardrailDecision, GuardrailInputState
 from nova_act.util.path_validator import validate_file_url
 
+# How long a host whose certificate verified is trusted without another TLS handshake
+VERIFIED_HOST_TTL_S = 300.0
+
+_verified_hosts: dict[str, float] = {}
+_verified_hosts_lock = threading.Lock()
+
 
 def validate_url(
     url: str,
@@ -119,10 +128,35 @@ def validate_url(
     return url
 
 
+@functools.cache
+def _certifi_ssl_context() -> ssl.SSLContext:
+    """Build the certifi-backed SSL context once per process; loading the CA bundle is not free."""
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def _is_verified_host(hostname: str) -> bool:
+    with _verified_hosts_lock:
+        expiry = _verified_hosts.get(hostname)
+        if expiry is None:
+            return False
+        if expiry <= time.monotonic():
+            del _verified_hosts[hostname]
+            return False
+        return True
+
+
+def clear_verified_hosts() -> None:
+    """Forget cached certificate verifications, so the next check for every host does a handshake."""
+    with _verified_hosts_lock:
+        _verified_hosts.clear()
+
+
 def verify_certificate(url: str) -> None:
     """
     Verifies the SSL certificate of a given URL using native ssl library with certifi.
 
+    Successful verifications are cached per host for VERIFIED_HOST_TTL_S; failures are not.
+
     Args:
     url (str): The URL to verify the certificate for.
     """
@@ -145,12 +179,13 @@ def verify_certificate(url: str) -> None:
         parsed = urlparse(url)
 
     hostname = parsed.hostname
+    if hostname and _is_verified_host(hostname):
+        return
+
     try:
-        context = ssl.create_default_context(cafile=certifi.where())
         with socket.create_connection((hostname, 443), timeout=20) as sock:
-            with context.wrap_socket(sock, server_hostname=hostname) as secure_socket:
+            with _certifi_ssl_context().wrap_socket(sock, server_hostname=hostname) as secure_socket:
                 secure_socket.getpeercert()
-                return
     except socket.gaierror:
         raise InvalidCertificate(
             f"SSL Certificate verification failed for {url} as there was an error fetching details for the url"
@@ -161,3 +196,7 @@ def verify_certificate(url: str) -> None:
         raise InvalidCertificate(f"Connection refused by {url}")
     except Exception:
         raise InvalidCertificate(f"An error occurred while verifying SSL certificate for {url}")
+
+    if hostname:
+        with _verified_hosts_lock:
+            _verified_hosts[hostname] = time.monotonic() + VERIFIED_HOST_TTL_S
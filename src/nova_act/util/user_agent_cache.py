@@ -0,0 +1,96 @@
+# Copyright 2025 Amazon Inc
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of detected browser user agents, in-process and on disk.
+
+Detecting the user agent takes a throwaway headless browser launch, so the result
+is cached per Chromium binary and build: the key is the executable path plus its
+size and modification time, which change whenever the browser is updated, and the
+extra browser args the detection ran with. Computing a key needs only a stat.
+"""
+
+import json
+import os
+import stat
+import threading
+from pathlib import Path
+
+from nova_act.util.logging import setup_logging
+
+_LOGGER = setup_logging(__name__)
+
+_CACHE_PATH = Path.home() / ".nova-act" / "user-agents.json"
+
+_lock = threading.Lock()
+_memory_cache: dict[str, str] = {}
+_disk_cache_loaded = False
+
+
+def user_agent_cache_key(executable_path: str, browser_args: list[str]) -> str:
+    """Identify a browser binary and build without launching it."""
+    try:
+        file_stat = os.stat(executable_path)
+        build = f"{file_stat.st_size}:{file_stat.st_mtime_ns}"
+    except OSError:
+        build = "unknown"
+    return "|".join([executable_path, build, *browser_args])
+
+
+def get_cached_user_agent(key: str) -> str | None:
+    """Return the cached user agent for a key, reading the disk cache on first use."""
+    global _disk_cache_loaded
+    with _lock:
+        if not _disk_cache_loaded:
+            _memory_cache.update({**_read_disk_cache(), **_memory_cache})
+            _disk_cache_loaded = True
+        return _memory_cache.get(key)
+
+
+def cache_user_agent(key: str, user_agent: str) -> None:
+    """Cache a detected user agent in memory and on disk."""
+    with _lock:
+        _memory_cache[key] = user_agent
+        entries = _read_disk_cache()
+        entries[key] = user_agent
+        _write_disk_cache(entries)
+
+
+def clear_user_agent_cache() -> None:
+    """Forget cached user agents, in memory and on disk."""
+    global _disk_cache_loaded
+    with _lock:
+        _memory_cache.clear()
+        _disk_cache_loaded = False
+        _CACHE_PATH.unlink(missing_ok=True)
+
+
+def _read_disk_cache() -> dict[str, str]:
+    try:
+        data = json.loads(_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {str(key): str(value) for key, value in data.items()}
+
+
+def _write_disk_cache(entries: dict[str, str]) -> None:
+    """Write the cache atomically via a temp file and rename. Failures only cost a future detection."""
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CACHE_PATH.with_suffix(f".json.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+        os.chmod(tmp_path, stat.S_IRUSR | stat.S_IWUSR)
+        tmp_path.replace(_CACHE_PATH)
+    except OSError as e:
+        _LOGGER.debug(f"Failed to write user agent cache at {_CACHE_PATH}: {e}")